@@ -0,0 +1,84 @@
+from datetime import datetime
+from classes import Order
+
+
+class BackorderBook:
+    """
+    Represents the orders which wait for a delivery from suppliers, indexed by the uuid they wait for.
+    The orders of every uuid are kept in arrival order and membership checks use a set of order ids.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the BackorderBook class.
+        """
+        self.waiting_by_uuid = {}  # uuid -> {order_id: (order, expected_date)}, kept in arrival order
+        self.order_ids = set()  # The ids of all the waiting orders
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of waiting orders.
+        """
+        return len(self.order_ids)
+
+    def __contains__(self, order_id: int) -> bool:
+        """
+        Returns:
+            bool: True if the order is waiting for a delivery, False otherwise.
+        """
+        return order_id in self.order_ids
+
+    def __iter__(self):
+        """
+        Returns:
+            iterator: The ids of the waiting orders, grouped by uuid and in arrival order within every uuid.
+        """
+        for waiting_orders in self.waiting_by_uuid.values():
+            yield from waiting_orders
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the BackorderBook object.
+        """
+        return (f"BackorderBook(orders={len(self.order_ids)}, items={len(self.waiting_by_uuid)})")
+
+    def add(self, order: Order, uuid: int, expected_date: datetime) -> bool:
+        """
+        Adds an order to the orders waiting for a uuid.
+
+        Args:
+            order (Order): The waiting order.
+            uuid (int): The item the order waits for.
+            expected_date (datetime): The date of the shipment which is expected to complete the order.
+
+        Returns:
+            bool: True if the order was added, False if it was already waiting.
+        """
+        if order.order_id in self.order_ids:
+            return False
+        self.waiting_by_uuid.setdefault(uuid, {})[order.order_id] = (order, expected_date)
+        self.order_ids.add(order.order_id)
+        return True
+
+    def has_waiting(self, uuid: int) -> bool:
+        """
+        Returns:
+            bool: True if there are orders waiting for the uuid, False otherwise.
+        """
+        return uuid in self.waiting_by_uuid
+
+    def pop_waiting(self, uuid: int) -> list:
+        """
+        Removes all the orders waiting for a uuid.
+
+        Args:
+            uuid (int): The item which arrived.
+
+        Returns:
+            list: (order, expected_date) tuples in arrival order.
+        """
+        waiting_orders = self.waiting_by_uuid.pop(uuid, {})
+        self.order_ids.difference_update(waiting_orders)
+        return list(waiting_orders.values())
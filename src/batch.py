@@ -0,0 +1,143 @@
+import os
+import time
+import argparse
+import multiprocessing
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from globals import *
+from engine import SimulationInputs, Simulation
+
+PLACEMENTS = ['original'] + [f'placement{number}' for number in range(1, 8)]  # The placements in src/data
+
+# The inputs of every placement in a worker process. With fork they are set in the parent before the
+# pool starts, so the workers share the loaded tables copy-on-write instead of loading them again.
+_BATCH_INPUTS = {}
+
+
+def load_batch_inputs(placements: list, max_date: datetime or None = MAX_DATETIME,
+                      use_cache: bool = USE_DATA_CACHE) -> dict:
+    """
+    Load the shared tables once, then the cells and positions of every placement.
+
+    Args:
+        placements (list): The placements to load.
+        max_date (datetime or None, optional): The end of the simulation, None for the full simulation. Defaults to MAX_DATETIME.
+        use_cache (bool, optional): If True the tables are read through the Parquet cache. Defaults to USE_DATA_CACHE.
+
+    Returns:
+        dict: placement -> SimulationInputs, sharing the tables which do not depend on the placement.
+    """
+    shared_inputs = SimulationInputs.load(placements[0], max_date, use_cache)
+    batch_inputs = {placements[0]: shared_inputs}
+    for placement in placements[1:]:
+        batch_inputs[placement] = shared_inputs.for_placement(placement, use_cache)
+    return batch_inputs
+
+
+def _init_worker(placements: list, max_date: datetime or None, use_cache: bool) -> None:
+    """
+    Load the inputs in a worker process, used when the processes can not be forked.
+    """
+    _BATCH_INPUTS.update(load_batch_inputs(placements, max_date, use_cache))
+
+
+def start_pool(placements: list, workers: int = None, max_date: datetime or None = MAX_DATETIME,
+               use_cache: bool = USE_DATA_CACHE) -> ProcessPoolExecutor:
+    """
+    Start a process pool whose workers hold the inputs of the placements, see worker_inputs.
+
+    Args:
+        placements (list): The placements to load.
+        workers (int, optional): The number of processes, None for one per placement up to the number of cores. Defaults to None.
+        max_date (datetime or None, optional): The end of the simulation, None for the full simulation. Defaults to MAX_DATETIME.
+        use_cache (bool, optional): If True the tables are read through the Parquet cache. Defaults to USE_DATA_CACHE.
+
+    Returns:
+        ProcessPoolExecutor: The pool.
+    """
+    workers = workers or min(len(placements), os.cpu_count() or 1)
+    if 'fork' in multiprocessing.get_all_start_methods():
+        # Load in the parent, the forked workers inherit the inputs
+        _BATCH_INPUTS.update(load_batch_inputs(placements, max_date, use_cache))
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    # Every worker loads the inputs once, from the Parquet cache written by the parent
+    load_batch_inputs(placements, max_date, use_cache)
+    return ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(placements, max_date, use_cache))
+
+
+def worker_inputs(placement: str) -> SimulationInputs:
+    """
+    Returns:
+        SimulationInputs: The inputs of a placement in a worker of a pool started by start_pool.
+    """
+    return _BATCH_INPUTS[placement]
+
+
+def run_placement(placement: str, seed: int, events_recording_level: str = EVENTS_RECORDING_LEVEL) -> dict:
+    """
+    Run the simulation of a placement and write its results under RESULTS_PATH.
+
+    Args:
+        placement (str): The placement of the warehouse, loaded in the worker inputs.
+        seed (int): The seed of the random numbers, the same for all the placements of a batch.
+        events_recording_level (str, optional): 'off', 'sampled' or 'full' for the events results. Defaults to EVENTS_RECORDING_LEVEL.
+
+    Returns:
+        dict: The measures of the run, with the placement and the run time in seconds.
+    """
+    start = time.perf_counter()
+    # Seed every run, so the results do not depend on the worker which ran the placement before
+    np.random.seed(seed)
+    simulation = Simulation(worker_inputs(placement), events_recording_level=events_recording_level,
+                            progress_quiet=True)
+    simulation.run()
+    simulation.write_results()
+    measures = simulation.measures().iloc[0].to_dict()
+    return {'placement': placement, **measures, 'run_seconds': round(time.perf_counter() - start, 1)}
+
+
+def run_batch(placements: list = PLACEMENTS, workers: int = None, max_date: datetime or None = MAX_DATETIME,
+              use_cache: bool = USE_DATA_CACHE, events_recording_level: str = EVENTS_RECORDING_LEVEL,
+              seed: int = None) -> pd.DataFrame:
+    """
+    Run the simulations of many placements in parallel processes.
+
+    Args:
+        placements (list, optional): The placements to run. Defaults to PLACEMENTS.
+        workers (int, optional): The number of processes, None for one per placement up to the number of cores. Defaults to None.
+        max_date (datetime or None, optional): The end of the simulation, None for the full simulation. Defaults to MAX_DATETIME.
+        use_cache (bool, optional): If True the tables are read through the Parquet cache. Defaults to USE_DATA_CACHE.
+        events_recording_level (str, optional): 'off', 'sampled' or 'full' for the events results. Defaults to EVENTS_RECORDING_LEVEL.
+        seed (int, optional): The seed of the random numbers of every placement, None draws one. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The measures of every placement, in the order of placements, with the seed.
+    """
+    if seed is None:
+        seed = int(np.random.randint(2**31))
+    with start_pool(placements, workers, max_date, use_cache) as pool:
+        results = list(pool.map(run_placement, placements, [seed] * len(placements),
+                                [events_recording_level] * len(placements)))
+    batch_measures = pd.DataFrame(results)
+    batch_measures['seed'] = seed
+    return batch_measures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the simulation of many placements in parallel.')
+    parser.add_argument('placements', nargs='*', default=PLACEMENTS,
+                        help='The placements to run, all the placements by default.')
+    parser.add_argument('--workers', type=int, default=None, help='The number of processes.')
+    parser.add_argument('--until', default=MAX_DATETIME, type=pd.Timestamp,
+                        help='The end of the simulation, MAX_DATETIME by default.')
+    parser.add_argument('--events', default=EVENTS_RECORDING_LEVEL, choices=['off', 'sampled', 'full'],
+                        help='The recording level of the events results.')
+    parser.add_argument('--seed', type=int, default=None, help='The seed of the random numbers of every placement.')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    batch_measures = run_batch(args.placements, args.workers, args.until, USE_DATA_CACHE, args.events, args.seed)
+    print(batch_measures.to_string(index=False))
+    print(f"batch of {len(args.placements)} placements took {time.perf_counter() - start:.1f} seconds")
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+
+
+class BusinessCalendar:
+    """
+    Represents the working days of the warehouse, built once from the dates data.
+    Every query is answered in O(1) from arrays indexed by the date ordinal.
+    """
+
+    def __init__(self, dates: pd.DataFrame) -> None:
+        """
+        Initializes a new instance of the BusinessCalendar class.
+
+        Args:
+            dates (pd.DataFrame): The dates data with 'date' and 'short_day' columns, as returned by import_dates_data.
+        """
+        dates = dates.sort_values(by='date')
+        self.dates = dates['date'].tolist()  # The working days as timestamps
+        ordinals = np.array([date.toordinal() for date in self.dates], dtype=int)
+        self.first_ordinal = ordinals[0] if len(ordinals) > 0 else 0
+        span = (ordinals[-1] - self.first_ordinal + 1) if len(ordinals) > 0 else 0
+        # Flags of every calendar day between the first and the last working day
+        is_working_day = np.zeros(span, dtype=bool)
+        is_working_day[ordinals - self.first_ordinal] = True
+        self.short_days = np.zeros(span, dtype=bool)
+        self.short_days[ordinals - self.first_ordinal] = dates['short_day'].to_numpy(dtype=bool)
+        # Number of working days up to and including every calendar day
+        self.working_days_prefix = np.cumsum(is_working_day)
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of working days in the calendar.
+        """
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the BusinessCalendar object.
+        """
+        return (f"BusinessCalendar(first_date={self.first_date}, last_date={self.last_date}, days={len(self.dates)})")
+
+    @property
+    def first_date(self) -> datetime:
+        """
+        Returns:
+            datetime: The first working day.
+        """
+        return self.dates[0]
+
+    @property
+    def last_date(self) -> datetime:
+        """
+        Returns:
+            datetime: The last working day.
+        """
+        return self.dates[-1]
+
+    def working_days_until(self, date: datetime) -> int:
+        """
+        Count the working days up to and including a date.
+
+        Args:
+            date (datetime): The date (the time of the day is ignored).
+
+        Returns:
+            int: The number of working days which are not after the date.
+        """
+        offset = date.toordinal() - self.first_ordinal
+        if offset < 0:  # Before the first working day
+            return 0
+        if offset >= len(self.working_days_prefix):  # After the last working day
+            return len(self.dates)
+        return int(self.working_days_prefix[offset])
+
+    def working_days_between(self, start_date: datetime, end_date: datetime) -> int:
+        """
+        Count the working days after start_date and up to and including end_date.
+
+        Args:
+            start_date (datetime): The date to count from (excluded).
+            end_date (datetime): The date to count to (included).
+
+        Returns:
+            int: The number of working days in (start_date, end_date].
+        """
+        return self.working_days_until(end_date) - self.working_days_until(start_date)
+
+    def next_working_day(self, t_now: datetime) -> datetime:
+        """
+        Get the next working day after the current date.
+
+        Args:
+            t_now (datetime): Current datetime object.
+
+        Returns:
+            datetime: The next working day, or t_now + 1 day if there is no working day after the current date.
+        """
+        next_index = self.working_days_until(t_now)  # The index of the first working day after the current date
+        if next_index < len(self.dates):
+            return self.dates[next_index]
+        return t_now + timedelta(days=1)
+
+    def nth_working_day(self, t_now: datetime, n: int) -> datetime:
+        """
+        Get the n-th working day after the current date.
+
+        Args:
+            t_now (datetime): Current datetime object.
+            n (int): The number of working days to move forward (1 is the next working day).
+
+        Returns:
+            datetime: The n-th working day, or t_now + n days if the calendar ends before it.
+        """
+        index = self.working_days_until(t_now) + n - 1
+        if index < len(self.dates):
+            return self.dates[index]
+        return t_now + timedelta(days=n)
+
+    def is_short_day(self, date: datetime) -> bool:
+        """
+        Returns:
+            bool: True if the date is a short working day (Friday), False otherwise.
+        """
+        offset = date.toordinal() - self.first_ordinal
+        if 0 <= offset < len(self.short_days):
+            return bool(self.short_days[offset])
+        return False
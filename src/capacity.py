@@ -0,0 +1,156 @@
+import numpy as np
+from lookups import CellLookup
+
+
+class MaxSegmentTree:
+    """
+    Represents a max segment tree over a fixed sequence of values, to find the first value at least a threshold.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        """
+        Initializes a new instance of the MaxSegmentTree class.
+
+        Args:
+            values (np.ndarray): The values, in the order of the search.
+        """
+        self.length = len(values)
+        self.size = 1 << max(self.length - 1, 0).bit_length()  # The leaves, a power of 2
+        tree = np.full(2 * self.size, -np.inf)
+        tree[self.size:self.size + self.length] = values
+        for node in range(self.size - 1, 0, -1):  # Every node holds the max of its children
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.tree = tree.tolist()  # Scalar access is faster on a list
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the MaxSegmentTree object.
+        """
+        return (f"MaxSegmentTree(length={self.length})")
+
+    def update(self, position: int, value: float) -> None:
+        """
+        Sets a value and updates the nodes above it.
+
+        Args:
+            position (int): The position of the value.
+            value (float): The new value.
+        """
+        tree = self.tree
+        node = position + self.size
+        tree[node] = value
+        node //= 2
+        while node:
+            left, right = tree[2 * node], tree[2 * node + 1]
+            node_max = left if left >= right else right
+            if tree[node] == node_max:  # The nodes above do not change either
+                break
+            tree[node] = node_max
+            node //= 2
+
+    def first_at_least(self, threshold: float) -> int:
+        """
+        Returns:
+            int: The first position whose value is at least the threshold, -1 if there is none.
+        """
+        tree = self.tree
+        if not tree[1] >= threshold:
+            return -1
+        node = 1
+        while node < self.size:  # Go down to the leftmost child which holds such a value
+            node = 2 * node if tree[2 * node] >= threshold else 2 * node + 1
+        return node - self.size
+
+
+class FreeCapacityIndex:
+    """
+    Represents the free volume of the cells for the placing heuristic: one MaxSegmentTree per putaway zone
+    and one over all the cells, each over its cells in order of decreasing attractiveness (then location id).
+    The most attractive cell with enough free volume is found in O(log n), and a change of the free volume
+    of a cell updates its two trees in O(log n).
+    """
+
+    def __init__(self, cell_lookup: CellLookup, available_volume: np.ndarray, excluded: list = ()) -> None:
+        """
+        Initializes a new instance of the FreeCapacityIndex class.
+
+        Args:
+            cell_lookup (CellLookup): The attractiveness and the putaway zone of the cells.
+            available_volume (np.ndarray): The free volume of the cells, indexed by location id.
+                                           The index updates it in place.
+            excluded (list, optional): Locations never chosen, like the sort area. Defaults to ().
+        """
+        self.cell_lookup = cell_lookup
+        self.available_volume = available_volume
+        cells = np.flatnonzero(np.isfinite(available_volume))  # The locations which are cells
+        cells = cells[~np.isin(cells, excluded)]
+        cells = cells[np.lexsort((cells, -cell_lookup.attractiveness[cells]))]
+        zones = cell_lookup.putaway_zone[cells]
+        self.trees = {None: MaxSegmentTree(available_volume[cells])}  # putaway zone or None for all -> tree
+        self.tree_cells = {None: cells.tolist()}  # putaway zone or None for all -> the locations of the tree positions
+        self.zone_position = np.full(len(available_volume), -1)  # The position of a cell in its zone tree
+        self.all_position = np.full(len(available_volume), -1)  # The position of a cell in the tree of all cells
+        self.all_position[cells] = np.arange(len(cells))
+        self.all_position = self.all_position.tolist()  # Scalar access is faster on a list
+        self.attractiveness = cell_lookup.attractiveness.tolist()
+        for zone in np.unique(zones):
+            zone_cells = cells[zones == zone]
+            self.trees[int(zone)] = MaxSegmentTree(available_volume[zone_cells])
+            self.tree_cells[int(zone)] = zone_cells.tolist()
+            self.zone_position[zone_cells] = np.arange(len(zone_cells))
+        self.zone_position = self.zone_position.tolist()
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the FreeCapacityIndex object.
+        """
+        return (f"FreeCapacityIndex(cells={len(self.tree_cells[None])}, zones={len(self.trees) - 1})")
+
+    def change_volume(self, location: int, volume: float) -> None:
+        """
+        Changes the free volume of a cell.
+
+        Args:
+            location (int): The location id.
+            volume (float): The volume added, negative for a volume taken.
+        """
+        self.available_volume[location] += volume
+        if self.all_position[location] < 0:  # Not indexed, like the sort area
+            return
+        new_volume = float(self.available_volume[location])
+        self.trees[None].update(self.all_position[location], new_volume)
+        self.trees[int(self.cell_lookup.putaway_zone[location])].update(self.zone_position[location], new_volume)
+
+    def most_attractive(self, zone: int or None, min_volume: float) -> int:
+        """
+        Args:
+            zone (int or None): The putaway zone, None for all the cells.
+            min_volume (float): The free volume needed.
+
+        Returns:
+            int: The most attractive cell of the zone with at least min_volume free, -1 if there is none.
+        """
+        tree = self.trees.get(zone)
+        position = -1 if tree is None else tree.first_at_least(min_volume)
+        return -1 if position < 0 else int(self.tree_cells[zone][position])
+
+    def most_attractive_of(self, locations: list, min_volume: float) -> int:
+        """
+        Args:
+            locations (list): Candidate locations, like the locations of an item.
+            min_volume (float): The free volume needed.
+
+        Returns:
+            int: The most attractive indexed location with at least min_volume free, -1 if there is none.
+        """
+        available_volume, attractiveness, all_position = self.available_volume, self.attractiveness, self.all_position
+        best_cell, best_key = -1, None
+        for location in locations:  # Few locations, faster than NumPy
+            if all_position[location] >= 0 and available_volume[location] >= min_volume:
+                # Ties of attractiveness go to the lowest location id, like in the trees
+                key = (-attractiveness[location], location)
+                if best_key is None or key < best_key:
+                    best_cell, best_key = location, key
+        return int(best_cell)
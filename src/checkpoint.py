@@ -0,0 +1,127 @@
+import os
+import gzip
+import pickle
+
+CHECKPOINT_VERSION = 1  # Increase when the state saved in the checkpoints changes
+CHECKPOINT_PREFIX = 'checkpoint-'
+CHECKPOINT_SUFFIX = '.pkl.gz'
+
+
+class SharedObjectsPickler(pickle.Pickler):
+    """
+    Represents a pickler which writes the given shared objects, wherever they are referenced, as their names.
+    The shared objects are not part of the pickle and are given again when it is loaded.
+    """
+
+    def __init__(self, file, shared: dict) -> None:
+        """
+        Initializes a new instance of the SharedObjectsPickler class.
+
+        Args:
+            file: The binary file to write to.
+            shared (dict): The shared objects, name -> object.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared_names = {id(obj): name for name, obj in shared.items() if obj is not None}
+
+    def persistent_id(self, obj):
+        """
+        Returns:
+            str: The name of a shared object, None for the objects which are pickled.
+        """
+        return self.shared_names.get(id(obj))
+
+
+class SharedObjectsUnpickler(pickle.Unpickler):
+    """
+    Represents an unpickler which replaces the names written by SharedObjectsPickler with the shared objects.
+    """
+
+    def __init__(self, file, shared: dict) -> None:
+        """
+        Initializes a new instance of the SharedObjectsUnpickler class.
+
+        Args:
+            file: The binary file to read from.
+            shared (dict): The shared objects, name -> object.
+        """
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, name: str):
+        """
+        Returns:
+            object: The shared object of a name.
+        """
+        return self.shared[name]
+
+
+def write_checkpoint(path: str, state: dict, shared: dict) -> None:
+    """
+    Write a checkpoint as a compressed pickle. The file is renamed into place when complete,
+    so an interrupted write never leaves a partial checkpoint.
+
+    Args:
+        path (str): The path of the checkpoint.
+        state (dict): The state to save.
+        shared (dict): Objects referenced by the state which are not saved, name -> object.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temporary_path = f'{path}.tmp-{os.getpid()}'
+    with gzip.open(temporary_path, 'wb', compresslevel=1) as file:
+        SharedObjectsPickler(file, shared).dump((CHECKPOINT_VERSION, state))
+    os.replace(temporary_path, path)
+
+
+def read_checkpoint(path: str, shared: dict) -> dict:
+    """
+    Read a checkpoint written by write_checkpoint.
+
+    Args:
+        path (str): The path of the checkpoint.
+        shared (dict): The objects to use for the shared objects of the checkpoint, name -> object.
+
+    Returns:
+        dict: The saved state.
+
+    Raises:
+        ValueError: If the checkpoint was written by another version.
+    """
+    with gzip.open(path, 'rb') as file:
+        version, state = SharedObjectsUnpickler(file, shared).load()
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"checkpoint version {version} is not supported, expected {CHECKPOINT_VERSION}.")
+    return state
+
+
+def checkpoint_files(directory: str) -> list:
+    """
+    Returns:
+        list: The paths of the checkpoints in a directory, from the oldest to the latest.
+    """
+    if not os.path.isdir(directory):
+        return []
+    # The names hold the simulation time, so they sort in time order
+    return [f'{directory}/{name}' for name in sorted(os.listdir(directory))
+            if name.startswith(CHECKPOINT_PREFIX) and name.endswith(CHECKPOINT_SUFFIX)]
+
+
+def latest_checkpoint(directory: str) -> str or None:
+    """
+    Returns:
+        str or None: The path of the latest checkpoint in a directory, None if there is none.
+    """
+    files = checkpoint_files(directory)
+    return files[-1] if files else None
+
+
+def prune_checkpoints(directory: str, keep: int = 2) -> None:
+    """
+    Remove all the checkpoints of a directory but the latest ones.
+
+    Args:
+        directory (str): The checkpoints directory.
+        keep (int, optional): The number of checkpoints kept. Defaults to 2.
+    """
+    for path in checkpoint_files(directory)[:-keep]:
+        os.remove(path)
@@ -1,4 +1,3 @@
-import heapq
 from datetime import datetime
 from enum import Enum
 
@@ -177,15 +176,18 @@ class EventType(Enum):
     REST = 3
     FETCHING = 4
     TRANSFER_TOOLS = 5
+    WAVE_RELEASE = 6
     TWELVE_PM = 12    
 
 
 class Event:
     """
     Represents an event in a system.
+    Events are added to the simulation through an EventCalendar.
     """
+    __slots__ = ('time', 'type', 'employee', 'tool', 'shipment', 'order', 'items_to_fetch')
 
-    def __init__(self, time, type:EventType, employee:Employee=None, tool:Tool=None, shipment:Shipment=None, order:Order=None,items_to_fetch=None,P=[]):
+    def __init__(self, time, type:EventType, employee:Employee=None, tool:Tool=None, shipment:Shipment=None, order:Order=None,items_to_fetch=None):
         """
         Initializes a new instance of the Event class.
 
@@ -197,7 +199,6 @@ class Event:
             shipment: A Shipment-type object associated with the event. Defaults to None.
             order: An Order-type object associated with the event. Defaults to None.
             items_to_fetch: A dictionary representing the items to fetch and their amounts. Defaults to None.
-            P: Heap used for events. Defaults to an empty list.
 
             TODO: Decide how time is represented (a hour, a day, a week)
         """
@@ -208,9 +209,6 @@ class Event:
         self.shipment = shipment
         self.order = order
         self.items_to_fetch = items_to_fetch
-        # Pushing to the heap
-        self.P = P
-        heapq.heappush(P, self)
 
     def __lt__(self, event2):
         """
@@ -0,0 +1,157 @@
+import os
+import shutil
+import hashlib
+import pandas as pd
+from datetime import datetime
+from data_imports import *
+
+try:  # The cache is stored as Parquet, without pyarrow the tables are imported from the CSV files
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+CACHE_VERSION = 2  # Increase when an import function changes the table it returns
+CACHE_PATH = f'{DATA_PATH}/cache'
+
+# name -> (import function of a placement, source files relative to DATA_PATH, date column, partitioned by month)
+TABLES = {
+    'dates': (lambda placement: import_dates_data(),
+              ['dates.csv'], 'date', False),
+    'items': (lambda placement: import_items_data(),
+              ['items.csv', 'ids/item_ids.csv', 'ids/putaway_zone_ids.csv'], None, False),
+    'shipments': (lambda placement: import_shipments_data(),
+                  ['shipments.csv', 'ids/item_ids.csv'], 'date', True),
+    'orders': (lambda placement: import_orders_data(),
+               ['orders.csv', 'ids/item_ids.csv'], 'timestamp', True),
+    'tools': (lambda placement: import_tools_data(),
+              ['fetch_tools_speeds_mean_and_std.csv', 'ids/tool_ids.csv'], None, False),
+    'tool_capacity': (lambda placement: import_tool_capacity_data(),
+                      ['tool_capacity.csv', 'ids/tool_ids.csv'], None, False),
+    'cells': (lambda placement: import_warehouse_data(f'{DATA_PATH}/{placement}/cells.csv'),
+              ['{placement}/cells.csv', 'ids/location_ids.csv', 'ids/putaway_zone_ids.csv', 'ids/tool_ids.csv'], None, False),
+    'positions': (lambda placement: import_warehouse_positions(f'{DATA_PATH}/{placement}/positions.csv'),
+                  ['{placement}/positions.csv', 'ids/location_ids.csv', 'ids/item_ids.csv'], None, False),
+}
+
+
+def table_key(name: str, placement: str) -> str:
+    """
+    Hash the cache version, the table name and the content of its source files.
+
+    Args:
+        name (str): The name of the table.
+        placement (str): The placement of the warehouse.
+
+    Returns:
+        str: The hexadecimal key of the table.
+    """
+    sources = TABLES[name][1]
+    digest = hashlib.sha256(f'{CACHE_VERSION}/{name}'.encode())
+    for source in sources:
+        source = source.format(placement=placement)
+        digest.update(source.encode())
+        with open(f'{DATA_PATH}/{source}', 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def table_label(name: str, placement: str) -> str:
+    """
+    Returns:
+        str: The prefix of the cache directories of the table, with the placement for per-placement tables.
+    """
+    if any('{placement}' in source for source in TABLES[name][1]):
+        return f'{name}-{placement}'
+    return name
+
+
+def write_table(df: pd.DataFrame, path: str, date_column: str or None, partitioned: bool) -> None:
+    """
+    Write a table to a new cache directory. The directory is renamed into place when complete,
+    so readers never see a partial table.
+
+    Args:
+        df (pd.DataFrame): The table.
+        path (str): The cache directory of the table.
+        date_column (str or None): The datetime column of the table.
+        partitioned (bool): If True the table is split into one file per month of the date column.
+    """
+    temporary_path = f'{path}.tmp-{os.getpid()}'
+    shutil.rmtree(temporary_path, ignore_errors=True)
+    os.makedirs(temporary_path)
+    if partitioned:
+        df.head(0).to_parquet(f'{temporary_path}/schema.parquet', index=False)  # Read when no partition is needed
+        for month, partition in df.groupby(df[date_column].dt.strftime('%Y-%m')):
+            os.makedirs(f'{temporary_path}/month={month}')
+            partition.to_parquet(f'{temporary_path}/month={month}/part.parquet', index=False)
+    else:
+        df.to_parquet(f'{temporary_path}/table.parquet', index=False)
+    try:
+        os.rename(temporary_path, path)
+    except OSError:  # Another process wrote the same table first
+        shutil.rmtree(temporary_path, ignore_errors=True)
+
+
+def read_table(path: str, partitioned: bool, max_date: datetime or None) -> pd.DataFrame:
+    """
+    Read a table from its cache directory. Only the partitions of the months until max_date are read.
+
+    Args:
+        path (str): The cache directory of the table.
+        partitioned (bool): If True the table is split into one file per month.
+        max_date (datetime or None): The end of the simulation, None reads every partition.
+
+    Returns:
+        pd.DataFrame: The table.
+    """
+    if not partitioned:
+        return pd.read_parquet(f'{path}/table.parquet')
+    partitions = sorted(entry for entry in os.listdir(path) if entry.startswith('month='))
+    if max_date is not None:
+        last_month = pd.Timestamp(max_date).strftime('%Y-%m')
+        partitions = [partition for partition in partitions if partition[len('month='):] <= last_month]
+    if not partitions:
+        return pd.read_parquet(f'{path}/schema.parquet')
+    # Concatenate the partitions as Arrow tables and convert to pandas once
+    tables = [pyarrow.parquet.read_table(f'{path}/{partition}/part.parquet') for partition in partitions]
+    return pyarrow.concat_tables(tables).to_pandas()
+
+
+def load_table(name: str, placement: str = PLACEMENT, max_date: datetime or None = None,
+               use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load an id-encoded table from the cache, importing it from the CSV files when the cache is missing
+    or its source files changed.
+
+    Args:
+        name (str): The name of the table, one of TABLES.
+        placement (str, optional): The placement of the warehouse. Defaults to PLACEMENT.
+        max_date (datetime or None, optional): Keep only the rows before this date. Defaults to None.
+        use_cache (bool, optional): If False the table is imported from the CSV files. Defaults to True.
+
+    Returns:
+        pd.DataFrame: The table, as returned by its import function.
+
+    Raises:
+        KeyError: If the table name is unknown.
+    """
+    importer, sources, date_column, partitioned = TABLES[name]
+    if not use_cache or pyarrow is None:
+        df = importer(placement)
+    else:
+        label = table_label(name, placement)
+        path = f'{CACHE_PATH}/{label}-{table_key(name, placement)[:16]}'
+        if not os.path.isdir(path):
+            os.makedirs(CACHE_PATH, exist_ok=True)
+            for entry in os.listdir(CACHE_PATH):  # Remove the caches of older source files
+                if entry.startswith(f'{label}-') and entry[len(label) + 1:].isalnum():
+                    shutil.rmtree(f'{CACHE_PATH}/{entry}', ignore_errors=True)
+            write_table(importer(placement), path, date_column, partitioned)
+        df = read_table(path, partitioned, max_date)
+    if max_date is not None and date_column is not None:
+        df = df[df[date_column] < max_date]
+        if partitioned:
+            df = df.reset_index(drop=True)
+    return df
@@ -1,10 +1,16 @@
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 
 DATA_PATH = 'src/data'
 
 PLACEMENT = 'original' # 'placement#'
 
+@lru_cache(maxsize=None)
+def import_ids_data(name: str) -> pd.DataFrame:
+    # read an ids table from 'src/data/ids/' only once per process, the callers do not modify it
+    return pd.read_csv(f'{DATA_PATH}/ids/{name}.csv')
+
 # create an import function for each csv file
 def import_dates_data(max_date: datetime or None = None) -> pd.DataFrame:
     df = pd.read_csv(f'{DATA_PATH}/dates.csv')
@@ -19,12 +25,12 @@ def import_warehouse_data(path: str = f'{DATA_PATH}/{PLACEMENT}/cells.csv') -> p
     # drop the 'fetch_zone' column
     df = df.drop(columns=['fetch_zone'])
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    location_df = pd.read_csv( f'{DATA_PATH}/ids/location_ids.csv')
+    location_df = import_ids_data('location_ids')
     # replace the values under the 'location' column with the corresponding value from the location_df 'location_id' column
     df = df.merge(location_df, on='location').drop(columns=['location'])
-    putaway_zone_df = pd.read_csv( f'{DATA_PATH}/ids/putaway_zone_ids.csv')
+    putaway_zone_df = import_ids_data('putaway_zone_ids')
     df = df.merge(putaway_zone_df[['putaway_zone', 'putaway_zone_id']], on='putaway_zone').drop(columns=['putaway_zone'])
-    tool_df = pd.read_csv( f'{DATA_PATH}/ids/tool_ids.csv', usecols=['fetch_tool', 'fetch_tool_id'])
+    tool_df = import_ids_data('tool_ids')[['fetch_tool', 'fetch_tool_id']]
     df = df.merge(tool_df, on='fetch_tool').drop(columns=['fetch_tool'])
     # remove all _id from the column names
     df.columns = [col.replace('_id', '') for col in df.columns]
@@ -42,10 +48,10 @@ def import_warehouse_data(path: str = f'{DATA_PATH}/{PLACEMENT}/cells.csv') -> p
 def import_warehouse_positions(path: str = f'{DATA_PATH}/{PLACEMENT}/positions.csv') -> pd.DataFrame:
     df = pd.read_csv(path)
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    location_df = pd.read_csv(f'{DATA_PATH}/ids/location_ids.csv')
+    location_df = import_ids_data('location_ids')
     # replace the values under the 'location' column with the corresponding value from the location_df 'location_id' column
     df = df.merge(location_df, on='location').drop(columns=['location'])
-    item_df = pd.read_csv(f'{DATA_PATH}/ids/item_ids.csv')
+    item_df = import_ids_data('item_ids')
     df = df.merge(item_df[['uuid', 'item_id']], on='uuid').drop(columns=['uuid'])
     df = df.rename(columns={'location_id': 'location', 'item_id': 'uuid'})
     df.sort_values(by=['location', 'uuid'], inplace=True)
@@ -58,10 +64,10 @@ def import_warehouse_positions(path: str = f'{DATA_PATH}/{PLACEMENT}/positions.c
 def import_items_data(path: str = f'{DATA_PATH}/items.csv') -> pd.DataFrame:
     df = pd.read_csv(path)
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    item_df = pd.read_csv(f'{DATA_PATH}/ids/item_ids.csv')
+    item_df = import_ids_data('item_ids')
     # merge the df with the item_df dataframe on the 'uuid' column, keep only the 'item_id' column
     df = df.merge(item_df[['uuid', 'item_id']], on='uuid').drop(columns=['uuid'])
-    putaway_zone_df = pd.read_csv(f'{DATA_PATH}/ids/putaway_zone_ids.csv')
+    putaway_zone_df = import_ids_data('putaway_zone_ids')
     # do the same for the 'putaway_zone' column
     df = df.merge(putaway_zone_df[['putaway_zone', 'putaway_zone_id']], on='putaway_zone').drop(columns=['putaway_zone'])
     # remove the _id from the column names
@@ -79,7 +85,7 @@ def import_shipments_data(path: str = f'{DATA_PATH}/shipments.csv', max_date: da
     if max_date is not None:
         df = df[df['date'] < max_date]
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    item_df = pd.read_csv(f'{DATA_PATH}/ids/item_ids.csv')
+    item_df = import_ids_data('item_ids')
     # merge the df with the item_df dataframe on the 'uuid' column, keep only the 'item_id' column
     df = df.merge(item_df[['uuid', 'item_id']], on='uuid').drop(columns=['uuid'])
     # remove the _id from the column names
@@ -107,7 +113,7 @@ def import_orders_data(path: str = f'{DATA_PATH}/orders.csv', shipments_df: pd.D
     # existing_items = pd.concat([first_shipments_df, starting_stock_items]).sort_values(by=['date', 'uuid']).drop_duplicates(subset=['uuid'], keep='first').reset_index(drop=True)
     
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    item_ids_df = pd.read_csv(f'{DATA_PATH}/ids/item_ids.csv')
+    item_ids_df = import_ids_data('item_ids')
     # merge the df with the item_df dataframe on the 'uuid' column, keep only the 'item_id' column
     df = df.merge(item_ids_df[['uuid', 'item_id']], on='uuid').drop(columns=['uuid'])
     df = df.rename(columns={'item_id': 'uuid'})
@@ -122,14 +128,32 @@ def import_orders_data(path: str = f'{DATA_PATH}/orders.csv', shipments_df: pd.D
     df.reset_index(drop=True, inplace=True)
     # make order_id equal to the index
     df['order_id'] = df.index
-    # change the order of the columns to match the original dataframe
-    df = df[['order_id', 'timestamp', 'uuid', 'quantity']]
+    # change the order of the columns to match the original dataframe, other columns (like an order key) are kept after them
+    columns = ['order_id', 'timestamp', 'uuid', 'quantity']
+    df = df[columns + [column for column in df.columns if column not in columns]]
+    return df
+
+def group_order_lines(df: pd.DataFrame, grouping: str or None = None) -> pd.DataFrame:
+    # group the order lines of import_orders_data into multi-line orders: None keeps one order per line,
+    # 'timestamp' groups the lines with the same timestamp and any other name groups by that order key column
+    if grouping is None:
+        return df
+    if grouping not in df.columns:
+        raise KeyError(f"the orders have no '{grouping}' column to group the lines by.")
+    df = df.copy()
+    # every line of an order arrives with the first line of the order
+    df['timestamp'] = df.groupby(grouping)['timestamp'].transform('min')
+    # keep the lines of every order together, the orders sorted by arrival
+    df.sort_values(by=list(dict.fromkeys(['timestamp', grouping, 'uuid'])), inplace=True, kind='stable')
+    df.reset_index(drop=True, inplace=True)
+    # number the orders in arrival order
+    df['order_id'] = (df[grouping] != df[grouping].shift()).cumsum() - 1
     return df
 
 def import_tools_data(path: str = f'{DATA_PATH}/fetch_tools_speeds_mean_and_std.csv') -> pd.DataFrame:
     df = pd.read_csv(path)
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    tool_df = pd.read_csv(f'{DATA_PATH}/ids/tool_ids.csv')
+    tool_df = import_ids_data('tool_ids')
     # merge the df with the tool_df dataframe on the 'uuid' column, keep only the 'fetch_tool_id' column
     df = df.merge(tool_df, on='fetch_tool').drop(columns=['fetch_tool'])
     # remove the _id from the column names
@@ -146,7 +170,7 @@ def import_tools_data(path: str = f'{DATA_PATH}/fetch_tools_speeds_mean_and_std.
 def import_tool_capacity_data(path: str = f'{DATA_PATH}/tool_capacity.csv') -> pd.DataFrame:
     df = pd.read_csv(path)
     # replace all column which are objects with the relevant ids from 'src/data/ids/
-    tool_df = pd.read_csv(f'{DATA_PATH}/ids/tool_ids.csv')
+    tool_df = import_ids_data('tool_ids')
     # merge the df with the tool_df dataframe on the 'uuid' column, keep only the 'fetch_tool_id' column
     df = df.merge(tool_df, on='fetch_tool').drop(columns=['fetch_tool'])
     # remove the _id from the column names
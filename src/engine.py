@@ -0,0 +1,1185 @@
+import os
+import copy
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from globals import *
+from classes import *
+from data_cache import load_table
+from data_imports import group_order_lines
+from checkpoint import write_checkpoint, read_checkpoint, prune_checkpoints
+from inventory import InventoryLedger
+from capacity import FreeCapacityIndex
+from lookups import ItemLookup, CellLookup, ToolLookup
+from geometry import WarehouseGeometry
+from routing import PickRouter
+from business_calendar import BusinessCalendar
+from shipment_index import ShipmentIndex
+from backorders import BackorderBook
+from recorder import EventRecorder
+from progress import ProgressReporter
+from fetching_queues import FetchItem, FetchingQueue, FetchingTaskQueue
+from event_calendar import EventCalendar
+from variates import VariatePool
+from setting_sim import create_employees, create_tools, create_known_events
+
+
+class SimulationInputs:
+    """
+    Represents the loaded data of a simulation and the lookups built from it.
+    The inputs are not modified by the simulations, so many simulations can share them.
+    """
+
+    def __init__(self, dates: pd.DataFrame, cells: pd.DataFrame, positions: pd.DataFrame, items: pd.DataFrame,
+                 shipments: pd.DataFrame, orders: pd.DataFrame, times: pd.DataFrame, capacities: pd.DataFrame,
+                 placement: str = PLACEMENT) -> None:
+        """
+        Initializes a new instance of the SimulationInputs class.
+
+        Args:
+            dates (pd.DataFrame): The dates data, as returned by import_dates_data.
+            cells (pd.DataFrame): The cells data, as returned by import_warehouse_data.
+            positions (pd.DataFrame): The initial positions data, as returned by import_warehouse_positions.
+            items (pd.DataFrame): The items data, as returned by import_items_data.
+            shipments (pd.DataFrame): The shipments data, as returned by import_shipments_data.
+            orders (pd.DataFrame): The order lines, as returned by group_order_lines.
+            times (pd.DataFrame): The tools speeds data, as returned by import_tools_data.
+            capacities (pd.DataFrame): The tools capacity data, as returned by import_tool_capacity_data.
+            placement (str, optional): The name of the placement of the cells and positions. Defaults to PLACEMENT.
+        """
+        self.placement = placement
+        self.dates = dates
+        self.cells = cells
+        self.positions = positions
+        self.items = items
+        self.shipments = shipments
+        self.orders = orders
+        # The first line of every order and the end of the last one, the lines of an order are together
+        order_ids = orders['order_id'].to_numpy()
+        self.order_starts = np.r_[np.flatnonzero(np.r_[True, order_ids[1:] != order_ids[:-1]]), len(order_ids)]
+        self.times = times
+        self.capacities = capacities
+        self.calendar = BusinessCalendar(dates)  # Working days index for all the calendar queries
+        self.shipment_index = ShipmentIndex(shipments)  # Per-uuid shipment dates and cumulative quantities
+        # Dense lookup tables indexed by item id, location id and tool type id
+        self.item_lookup = ItemLookup(items)
+        self.cell_lookup = CellLookup(cells)  # Holds the initial cell volumes, every simulation updates a copy
+        self.tool_lookup = ToolLookup(times, capacities)
+        self.geometry = WarehouseGeometry(cells)  # Cell coordinates and aisle distances of the placement
+        # find the 'location' value of the first row with aisle == 0 in the cells dataframe, assign as sort_area_location
+        self.sort_area_location = cells.loc[cells['aisle'] == 0, 'location'].iloc[0]
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the SimulationInputs object.
+        """
+        return (f"SimulationInputs(placement={self.placement}, orders={len(self.orders)}, "
+                f"shipments={len(self.shipments)}, cells={len(self.cells)})")
+
+    def signature(self) -> tuple:
+        """
+        Returns:
+            tuple: The placement and the sizes of the tables, to check that a checkpoint is resumed with the same inputs.
+        """
+        return (self.placement, len(self.dates), len(self.cells), len(self.shipments), len(self.orders),
+                len(self.order_starts) - 1)
+
+    @classmethod
+    def load(cls, placement: str = PLACEMENT, max_date: datetime or None = MAX_DATETIME,
+             use_cache: bool = USE_DATA_CACHE, order_grouping: str or None = ORDER_GROUPING) -> 'SimulationInputs':
+        """
+        Load the inputs of a placement from the data files.
+
+        Args:
+            placement (str, optional): The placement of the warehouse. Defaults to PLACEMENT.
+            max_date (datetime or None, optional): The end of the simulation, None for the full simulation. Defaults to MAX_DATETIME.
+            use_cache (bool, optional): If True the tables are read through the Parquet cache. Defaults to USE_DATA_CACHE.
+            order_grouping (str or None, optional): How the order lines are grouped into orders, see group_order_lines.
+                                                    Defaults to ORDER_GROUPING.
+
+        Returns:
+            SimulationInputs: The loaded inputs.
+        """
+        return cls(dates=load_table('dates', placement, max_date, use_cache),
+                   cells=load_table('cells', placement, use_cache=use_cache),
+                   positions=load_table('positions', placement, use_cache=use_cache),
+                   items=load_table('items', placement, use_cache=use_cache),
+                   shipments=load_table('shipments', placement, max_date, use_cache),
+                   orders=group_order_lines(load_table('orders', placement, max_date, use_cache), order_grouping),
+                   times=load_table('tools', placement, use_cache=use_cache),
+                   capacities=load_table('tool_capacity', placement, use_cache=use_cache),
+                   placement=placement)
+
+    def for_placement(self, placement: str, use_cache: bool = USE_DATA_CACHE) -> 'SimulationInputs':
+        """
+        Load the cells and positions of another placement. The tables which do not depend on the
+        placement (dates, items, shipments, orders, tools) and their lookups are shared, not copied.
+
+        Args:
+            placement (str): The placement of the warehouse.
+            use_cache (bool, optional): If True the tables are read through the Parquet cache. Defaults to USE_DATA_CACHE.
+
+        Returns:
+            SimulationInputs: The inputs of the placement.
+        """
+        inputs = copy.copy(self)
+        inputs.placement = placement
+        inputs.cells = load_table('cells', placement, use_cache=use_cache)
+        inputs.positions = load_table('positions', placement, use_cache=use_cache)
+        inputs.cell_lookup = CellLookup(inputs.cells)
+        inputs.geometry = WarehouseGeometry(inputs.cells)
+        inputs.sort_area_location = inputs.cells.loc[inputs.cells['aisle'] == 0, 'location'].iloc[0]
+        return inputs
+
+
+class Simulation:
+    """
+    Represents one run of the warehouse simulation. All the state which changes during the run
+    (inventory, cell volumes, queues, employees, tools, events and measures) belongs to the object.
+    The attributes in INPUT_ATTRIBUTES are read from the inputs and never change, they are not saved
+    in the checkpoints of the run.
+    """
+
+    INPUT_ATTRIBUTES = ('inputs', 'calendar', 'shipment_index', 'item_lookup', 'cell_lookup', 'tool_lookup',
+                        'geometry', 'sort_area_location', 'order_starts', 'order_ids', 'order_uuids',
+                        'order_quantities', 'shipment_uuids', 'shipment_quantities', 'last_date')
+
+    def __init__(self, inputs: SimulationInputs, results_path: str = None, results_format: str = RESULTS_FORMAT,
+                 events_recording_level: str = EVENTS_RECORDING_LEVEL, progress_interval: float = PROGRESS_INTERVAL,
+                 progress_quiet: bool = PROGRESS_QUIET, fetch_tasks_recording_level: str = 'full',
+                 rng=None, variate_block_size: int = VARIATE_BLOCK_SIZE,
+                 routing_policy: str = ROUTING_POLICY, picking_mode: str = PICKING_MODE,
+                 wave_window_minutes: float = WAVE_WINDOW_MINUTES, wave_max_orders: int = WAVE_MAX_ORDERS,
+                 checkpoint_every_days: int = CHECKPOINT_EVERY_DAYS, checkpoint_path: str = None) -> None:
+        """
+        Initializes a new instance of the Simulation class.
+
+        Args:
+            inputs (SimulationInputs): The loaded data, shared with other simulations.
+            results_path (str, optional): The results directory. Defaults to RESULTS_PATH of the placement.
+            results_format (str, optional): 'csv' or 'parquet' for the fetch tasks and events results. Defaults to RESULTS_FORMAT.
+            events_recording_level (str, optional): 'off', 'sampled' or 'full' for the events results. Defaults to EVENTS_RECORDING_LEVEL.
+            progress_interval (float, optional): Minimal real seconds between progress prints. Defaults to PROGRESS_INTERVAL.
+            progress_quiet (bool, optional): If True nothing is printed during the run. Defaults to PROGRESS_QUIET.
+            fetch_tasks_recording_level (str, optional): 'off', 'sampled' or 'full' for the fetch tasks results. Defaults to 'full'.
+            rng (np.random.Generator, optional): The random numbers generator of the run. Defaults to the global np.random.
+            variate_block_size (int, optional): The number of random values drawn at once for every tool parameter. Defaults to VARIATE_BLOCK_SIZE.
+            routing_policy (str, optional): The routing policy of the fetch tasks, one of ROUTING_POLICIES. Defaults to ROUTING_POLICY.
+            picking_mode (str, optional): 'order' to allocate and dispatch every order when it arrives, or 'wave' to
+                                          collect the orders in waves allocated and dispatched together. Defaults to PICKING_MODE.
+            wave_window_minutes (float, optional): Minutes from the first order of a wave to its release. Defaults to WAVE_WINDOW_MINUTES.
+            wave_max_orders (int, optional): Number of orders which releases a wave before its window ends,
+                                             None for no limit. Defaults to WAVE_MAX_ORDERS.
+            checkpoint_every_days (int, optional): Write a checkpoint every this number of simulation days,
+                                                   None for no checkpoints. Defaults to CHECKPOINT_EVERY_DAYS.
+            checkpoint_path (str, optional): The checkpoints directory. Defaults to '<results_path>/checkpoints'.
+
+        Raises:
+            ValueError: If the picking mode is not supported.
+        """
+        if picking_mode not in ('order', 'wave'):
+            raise ValueError("picking_mode must be 'order' or 'wave'.")
+        self.bind_inputs(inputs)
+        self.rng = rng if rng is not None else np.random  # All the random draws of the run
+        self.results_path = results_path or RESULTS_PATH.format(placement=inputs.placement)
+        # Periodic checkpoints of the run, see save_checkpoint
+        self.checkpoint_every_days = checkpoint_every_days
+        self.checkpoint_path = checkpoint_path or f'{self.results_path}/checkpoints'
+        self.days_since_checkpoint = 0
+        self.router = PickRouter(inputs.geometry, inputs.tool_lookup, routing_policy)  # Routes of the fetch tasks
+        # Pools of random values per tool parameter, drawn in blocks from the generator of the run
+        self.variates = VariatePool(inputs.tool_lookup, self.rng, variate_block_size)
+        self.variates.add('transfer_time', TRANSFER_TIME_MEAN, TRANSFER_TIME_STD)
+        self.available_volume = inputs.cell_lookup.available_volume.copy()  # The live free volume of the cells
+        # Most attractive cells with enough free volume, the only way to change available_volume
+        self.capacity = FreeCapacityIndex(inputs.cell_lookup, self.available_volume, [inputs.sort_area_location])
+        self.warehouse_positions = InventoryLedger(inputs.positions)  # Stock ledger keyed by (location, uuid)
+
+        # QUEUES:
+        # Per-tool queues of the items waiting to be fetched
+        self.fetching_queue = FetchingQueue()
+        # Per-employee buffers of the items in the fetch task in progress
+        self.fetching_task_queue = FetchingTaskQueue()
+        self.waiting_for_delivery = BackorderBook()  # Orders waiting for delivery, by uuid
+        self.orders = {}  # Registry of the orders which arrived, order_id -> Order
+        # Wave picking: the orders of the open wave, released together at wave_release_time
+        self.picking_mode = picking_mode
+        self.wave_window = timedelta(minutes=wave_window_minutes)
+        self.wave_max_orders = wave_max_orders
+        self.wave_orders = []
+        self.wave_release_time = None  # None when no wave is open
+        self.employees = create_employees()
+        self.tools = create_tools(inputs.times, inputs.capacities)
+
+        # Measures for Service Level
+        self.orders_on_time = 0
+        self.orders_on_time_today = 0
+        self.orders_late = 0
+        self.return_orders = 0
+        self.impossible_orders = 0
+        self.fetch_task_times = []  # List for fetch task times
+
+        # Recorder for fetch tasks
+        self.fetch_tasks = EventRecorder(f'{self.results_path}/fetch_tasks_results', FETCH_TASKS_columns,
+                                         level=fetch_tasks_recording_level, file_format=results_format)
+        # Recorder for events simulation
+        self.events_sim = EventRecorder(f'{self.results_path}/events_sim_results', EVENTS_SIM_columns,
+                                        level=events_recording_level, file_format=results_format,
+                                        categories={'event_type': EVENT_TYPE_NAMES})
+        # Console progress, counts orders with a cursor
+        self.progress = ProgressReporter(inputs.orders['timestamp'].iloc[inputs.order_starts[:-1]],
+                                         wall_interval=progress_interval,
+                                         quiet=progress_quiet)
+
+        # Events calendar, known events merged with the events created during the run
+        self.events = EventCalendar(create_known_events(inputs.orders, inputs.shipments, self.calendar,
+                                                        self.make_known_event, self.progress))
+
+        self.event = self.events.pop() if self.events else None  # The next event to process
+        self.t_now = self.event.time if self.event else None
+        self.current_date = self.t_now.date() if self.event else None
+
+    def bind_inputs(self, inputs: SimulationInputs) -> None:
+        """
+        Set the attributes in INPUT_ATTRIBUTES, which are read from the inputs.
+
+        Args:
+            inputs (SimulationInputs): The loaded data.
+        """
+        self.inputs = inputs
+        self.calendar = inputs.calendar
+        self.shipment_index = inputs.shipment_index
+        self.item_lookup = inputs.item_lookup
+        self.cell_lookup = inputs.cell_lookup
+        self.tool_lookup = inputs.tool_lookup
+        self.geometry = inputs.geometry
+        self.sort_area_location = inputs.sort_area_location
+        # The orders and shipments columns, the Order and Shipment objects are created when their events come due
+        self.order_starts = inputs.order_starts  # Order row -> its first line, the next entry ends its lines
+        self.order_ids = inputs.orders['order_id'].to_numpy()
+        self.order_uuids = inputs.orders['uuid'].to_numpy()
+        self.order_quantities = inputs.orders['quantity'].to_numpy()
+        self.shipment_uuids = inputs.shipments['uuid'].to_numpy()
+        self.shipment_quantities = inputs.shipments['quantity'].to_numpy()
+        # last date for stopping the simulation
+        self.last_date = self.calendar.last_date
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the Simulation object.
+        """
+        return (f"Simulation(placement={self.inputs.placement}, t_now={self.t_now}, "
+                f"orders_on_time={self.orders_on_time}, events={len(self.events)})")
+
+    def make_known_event(self, type: EventType, row: int, timestamp: datetime) -> Event:
+        """
+        Create a known event when it comes due.
+
+        Args:
+            type (EventType): The type of the event.
+            row (int): The row of the event in its data, the number of the order for orders.
+            timestamp (datetime): The time of the event.
+
+        Returns:
+            Event: The event, with its order or shipment for orders and deliveries.
+        """
+        if type == EventType.ORDERS_FROM_CUSTOMERS:
+            start, end = self.order_starts[row], self.order_starts[row + 1]
+            items_dict = {}  # The lines of the order, the quantities of repeated items are added
+            for uuid, quantity in zip(self.order_uuids[start:end].tolist(), self.order_quantities[start:end].tolist()):
+                items_dict[int(uuid)] = items_dict.get(int(uuid), 0) + int(quantity)
+            order = Order(int(self.order_ids[start]), timestamp, items_dict)
+            self.orders[order.order_id] = order  # Register the order
+            return Event(time=timestamp, type=type, order=order)
+        if type == EventType.DELIVERIES_FROM_SUPPLIERS:
+            items_dict = {int(self.shipment_uuids[row]): int(self.shipment_quantities[row])}
+            shipment = Shipment(timestamp, items_dict)
+            return Event(time=timestamp, type=type, shipment=shipment)
+        return Event(time=timestamp, type=type)
+
+    """ ------- Helper Functions ------- """
+
+    def calc_time_to_transfer(self) -> int:
+        """
+        Calculate the time to transfer from tool to tool.
+
+        Returns:
+            float: Time to transfer from tool to tool.
+        """
+        return int(self.variates.draw(None, 'transfer_time'))
+
+    def short_lines(self, order: Order) -> np.ndarray:
+        """
+        Check the lines of an order against the units in the warehouse.
+
+        Args:
+            order (Order): Order object.
+
+        Returns:
+            np.ndarray: For every line of the order, in the order of items_dict, True if the warehouse
+                        does not have all its units.
+        """
+        lines = len(order.items_dict)
+        quantities = np.fromiter(order.items_dict.values(), dtype=float, count=lines)
+        # The units of every item, -1 for an item without positions
+        units = np.fromiter((self.warehouse_positions.total(item) if self.warehouse_positions.has_positions(item)
+                             else -1 for item in order.items_dict), dtype=float, count=lines)
+        return (units < 0) | (quantities > units)
+
+    def revelant_shipment_in_next_days(self, t_now: datetime, order: Order):
+        """
+        Check if enough units of the short lines of the order (all the lines if none is short) arrive in the
+        shipments of the next working days, until 4 working days have passed since the order arrived.
+
+        Args:
+            t_now (datetime): Current datetime object.
+            order (Order): Order object.
+
+        Returns:
+            tuple: The date of the last shipment which completes the units needed and its item if there is one,
+                   False otherwise.
+        """
+        arrival_date = order.arrival_date.date()  # Get the arrival date of the order
+        current_date = t_now.date()  # Get the current date
+        # Get the number of days between the current date and the arrival date
+        count_days_between = self.calendar.working_days_between(arrival_date, current_date)
+        # Get the number of days until the next shipment
+        days_until_supply = 4 - count_days_between
+
+        if days_until_supply > 0:  # If there is a relevant shipment in the next 4 days
+            # Get the items which wait for a shipment
+            items = list(order.items_dict)
+            waiting_items = [item for item, short in zip(items, self.short_lines(order)) if short] or items
+            # Get the relevant dates for the next shipment: the next days_until_supply working days
+            first_relevant_date = t_now + timedelta(days=1)
+            last_relevant_date = self.calendar.nth_working_day(t_now, days_until_supply)
+            relevant_shipments = []
+            for item_id in waiting_items:
+                # Get the date by which the relevant shipments have enough units of the line
+                relevant_shipment_date = self.shipment_index.arrival_of_units(
+                    item_id, first_relevant_date, last_relevant_date, order.items_dict[item_id])
+                if relevant_shipment_date is None:  # The line can not be completed in time
+                    return False
+                relevant_shipments.append((relevant_shipment_date, item_id))
+
+            # The order waits for the last of the shipments. The deliveries of a date are processed in
+            # uuid order, so a tie goes to the highest uuid, whose delivery is the last one of the date
+            return max(relevant_shipments)
+
+        return False
+
+    def backorder_or_reject(self, t_now: datetime, order: Order) -> None:
+        """
+        Put an order which can not be satisfied in the waiting for delivery book if a relevant shipment
+        arrives in time, otherwise count it as impossible.
+
+        Args:
+            t_now (datetime): Current datetime object.
+            order (Order): Order object.
+        """
+        relevant_shipment = self.revelant_shipment_in_next_days(
+            t_now, order)  # Get the relevant next event date and its item
+        # If there is a relevant next event date
+        if relevant_shipment:
+            relevant_next_event_date, item_id = relevant_shipment
+            # Add the order to the waiting for delivery book, it is woken up when the item arrives
+            self.waiting_for_delivery.add(order, item_id, relevant_next_event_date)
+            self.return_orders += 1  # Counted once for every time the order is backordered
+        else:
+            self.impossible_orders += 1
+
+    def wake_backorders(self, t_now: datetime, item_id: int) -> None:
+        """
+        Release the orders waiting for an item which has just arrived, in arrival order.
+
+        Args:
+            t_now (datetime): Current datetime object.
+            item_id (int): The item which arrived.
+        """
+        units_available = {}  # uuid -> units not taken yet by the orders released before
+        for order, expected_date in self.waiting_for_delivery.pop_waiting(item_id):
+            for uuid in order.items_dict:
+                if uuid not in units_available:
+                    units_available[uuid] = self.warehouse_positions.total(uuid)
+            # The order can be satisfied now if all its lines can
+            if all(units_needed <= units_available[uuid] for uuid, units_needed in order.items_dict.items()):
+                for uuid, units_needed in order.items_dict.items():
+                    units_available[uuid] -= units_needed
+                # Create an orders from customers event
+                self.events.schedule(time=t_now + timedelta(minutes=1),
+                                     type=EventType.ORDERS_FROM_CUSTOMERS, order=order)
+            elif t_now.date() < expected_date.date():  # The completing shipment did not arrive yet
+                self.waiting_for_delivery.add(order, item_id, expected_date)
+            else:  # The expected shipment arrived but the units were taken by other orders
+                self.backorder_or_reject(t_now, order)
+
+    def creation_fetching(self, t_now: datetime, employee: Employee, tool: Tool) -> None:
+        """
+        This function creates the fetching events.
+
+        Args:
+            t_now (datetime): The current time
+            employee (Employee): The employee that is fetching the item
+            tool (Tool): The tool that is fetching the item
+        """
+        if employee.employee_id != 0:  # If the employee is not the sort employee
+            employee.employee_status = 1  # The employee is busy
+        if tool.tool_id != 0:  # If the tool is not the sort tool
+            tool.status = 1  # The tool is busy
+        # Get the time to fetch the item
+        y = self.prioritize_items_for_fetching(t_now, employee, tool)
+        if y:  # If the time to fetch the item is not 0
+            # Create the fetching event
+            self.events.schedule(time=t_now+timedelta(seconds=y), type=EventType.FETCHING, employee=employee,
+                                 tool=tool)  # Add the event to the event list
+
+    def checking_next_fetching_task(self, t_now: datetime, employee: Employee, current_tool: Tool) -> None:
+        """
+        Check for the next fetching task or available tools for the employee.
+
+        Args:
+            t_now (datetime): Current datetime object.
+            employee (Employee): Employee object.
+            tool (Tool): Tool object.
+        """
+        employee.employee_status = 0  # The employee is available
+        if employee not in self.employees:  # Retired by a scenario, the employee releases the tool and stops
+            current_tool.status = 0  # The tool is available
+            return
+        # Check if there are pending fetching tasks for the tool, a tool retired by a scenario is not used again
+        if current_tool in self.tools and self.fetching_queue.has_work(current_tool.type):
+            self.creation_fetching(t_now, employee, current_tool)
+        else:  # If there are no pending fetching tasks for the tool
+            current_tool.status = 0  # The tool is available
+            # Check if there are tools to be picked
+            next_tool = self.prioritize_tools_for_queues(employee)
+            if next_tool:  # If there are tools to be picked
+                if employee.employee_id != 0:  # If the employee is not the sort employee
+                    employee.employee_status = 1  # The employee is busy
+                if next_tool.tool_id != 0:   # If the tool is not the sort tool
+                    next_tool.status = 1  # The tool is busy
+                y = self.calc_time_to_transfer()  # Get the time to transfer the tools
+                # Create the transfer tools event
+                self.events.schedule(time=t_now + timedelta(seconds=y), type=EventType.TRANSFER_TOOLS,
+                                     employee=employee, tool=next_tool)
+
+    def get_order(self, order_id):
+        """
+        This function returns the order according to the order_id
+
+        Args:
+            order_id (int): The id of the order
+
+        Returns:
+            order (Order): The order with the order_id
+        """
+        return self.orders.get(order_id, False)
+
+    def add_item_to_fetching_task(self, item: FetchItem, employee: Employee, tool: Tool) -> None:
+        """
+        Add an item taken from the fetching queue to the fetch task of the employee.
+
+        Args:
+            item (FetchItem): The item taken from the fetching queue.
+            employee (Employee): Employee object.
+            tool (Tool): Tool object.
+        """
+        # Append the new item to the task buffer of the employee
+        self.fetching_task_queue.task(employee.employee_id).append(item)
+        # Update the left capacity of the tool based on the volume of the fetched item
+        tool.left_capacity -= item.volume_to_fetch
+
+    def calculate_route_time(self, aisles: np.ndarray, x: np.ndarray, z: np.ndarray, tool: Tool) -> float:
+        """
+        Calculate the travel time of a fetch task route, given as the points of PickRouter.route.
+        Every move inside an aisle takes max(|dx| / speed_x, |dz| / speed_z) with its own sampled speeds,
+        the moves along the cross aisles take their y distance over a speed sampled once per task, and the
+        distances from the I/O point to the first aisle and from the last aisle back are added.
+
+        Args:
+            aisles (np.ndarray): The aisle of every point of the route.
+            x (np.ndarray): The x-coordinate of every point of the route.
+            z (np.ndarray): The z-coordinate of every point of the route.
+            tool (Tool): Tool object.
+
+        Returns:
+            float: Time in seconds.
+        """
+        same_aisle = aisles[1:] == aisles[:-1]
+        dx = np.abs(np.diff(x))[same_aisle]
+        dz = np.abs(np.diff(z))[same_aisle]
+        # Get the horizontal and vertical speeds of the tool for every move using a normal distribution
+        speed_x = np.array(self.variates.draw_many(tool.type, 'horizontal_speed', len(dx)))
+        speed_z = np.array(self.variates.draw_many(tool.type, 'vertical_speed', len(dz)))
+        # A tool without a vertical speed (NaN) only moves on the floor, fmax ignores its vertical time
+        with np.errstate(divide='ignore', invalid='ignore'):
+            move_times = np.fmax(dx / speed_x, dz / speed_z)
+        # Moves with a non-positive speed (the cross dock) take no time
+        route_time = move_times[(speed_x > 0) & ~(speed_z <= 0)].sum()
+
+        # Calculate time between aisles
+        speed_y = self.variates.draw(tool.type, 'horizontal_speed')
+        if speed_y > 0:
+            route_time += self.geometry.aisle_distance[aisles[:-1][~same_aisle], aisles[1:][~same_aisle]].sum() / speed_y
+        # The distances from the I/O point to the first aisle and from the last aisle back
+        route_time += self.geometry.aisle_io_distance[aisles[0]] + self.geometry.aisle_io_distance[aisles[-1]]
+        return float(route_time)
+
+    """ ------- Huristic functions ------- """
+
+    def prioritize_locations_for_fetching(self, t_now: datetime, order: Order) -> None:
+        """
+        Prioritize locations for fetching based on order requirements and warehouse data.
+        The units of every line are taken from the positions of its item in order of cell attractiveness.
+
+        Args:
+            t_now (datetime): Current datetime.
+            order (Order): Order object.
+        """
+        items = list(order.items_dict)
+        # Get the relevant positions of the items, line after line
+        line_positions = [self.warehouse_positions.positions(item_id) for item_id in items]
+        relevant_positions = [position for positions in line_positions for position in positions]
+        line_sizes = [len(positions) for positions in line_positions]
+        lines = np.repeat(np.arange(len(items)), line_sizes)
+        locations = np.fromiter((location for location, _, _ in relevant_positions), dtype=int,
+                                count=len(relevant_positions))
+        # Sort the possible positions of every line by cell attractiveness
+        sorted_positions = np.lexsort((-self.cell_lookup.attractiveness[locations], lines))
+        # Calculate the time it takes to fetch the items, drawn for the tool of the first position of every line
+        fetch_time_array = []
+        line_starts = np.r_[0, np.cumsum(line_sizes)]
+        for line, line_size in enumerate(line_sizes):
+            first_fetch_tool = self.cell_lookup.fetch_tool[locations[sorted_positions[line_starts[line]]]]
+            fetch_time_array += self.variates.draw_many(first_fetch_tool, 'remove_from_shelf_time', line_size)
+        # Get the number of units left to fetch of every item
+        units_left_to_fetch = dict(order.items_dict)
+        # Iterate over the possible positions
+        for i in sorted_positions:  # Iterate over the possible positions
+            location, item_id, quantity = relevant_positions[i]
+            if units_left_to_fetch[item_id] == 0:  # All the units of the line were fetched
+                continue
+            fetch_tool = self.cell_lookup.fetch_tool[location]
+            # Get the number of units to fetch
+            units_to_fetch = min(quantity, units_left_to_fetch[item_id])
+            # Update the number of units left to fetch
+            units_left_to_fetch[item_id] -= units_to_fetch
+            # Update the quantity of the item in the warehouse
+            self.warehouse_positions.remove(location, item_id, units_to_fetch)
+            # Update the available volume of the item in the warehouse
+            volume_to_fetch = self.item_lookup.volume[item_id] * units_to_fetch
+            self.capacity.change_volume(location, volume_to_fetch)
+            # Calculate the time it takes to fetch the item
+            time_to_fetch = 0 if fetch_tool == ToolType.CROSS_DOCK.value else fetch_time_array[i]
+            # Add the item to the fetching queue of its tool
+            self.fetching_queue.push(FetchItem(fetch_tool=fetch_tool,
+                                               location=location,
+                                               aisle=self.cell_lookup.aisle[location],
+                                               cell_attractiveness=self.cell_lookup.attractiveness[location],
+                                               order_id=order.order_id,
+                                               arrival_date=order.arrival_date,
+                                               uuid=item_id,
+                                               units_to_fetch=units_to_fetch,
+                                               volume_to_fetch=volume_to_fetch,
+                                               time_to_fetch=time_to_fetch))
+
+    def prioritize_tools_for_queues(self, employee: Employee):
+        """
+        Prioritize tools for fetching queues based on employee's available tools.
+
+        Args:
+            employee (Employee): Employee object.
+
+        Returns:
+            Tool or False: The prioritized tool for the fetching queues, or False if no available tool is found.
+        """
+        employee_tool_types = set(
+            employee.tools)  # Get the employee's available tools
+        # Get the available tools
+        available_tools = {tool.type: tool for tool in self.tools if tool.status == 0}
+        # Iterate over the employee's available tools
+        for tool_type in employee_tool_types:
+            # Check if the tool is available and in the fetching queue
+            if tool_type in available_tools and self.fetching_queue.has_work(tool_type):
+                return available_tools[tool_type]  # Return the tool
+        # Return False if no available tool is found
+        return False
+
+    def prioritize_items_for_fetching(self, t_now: datetime, employee: Employee, tool: Tool) -> float:
+        """
+        Prioritizes items for fetching based on employee and tool constraints.
+
+        Args:
+            t_now (datetime): Current datetime.
+            employee (Employee): Employee object.
+            tool (Tool): Tool object.
+
+        Returns:
+            float: Total time required for fetching tasks.
+        """
+        # Initialize tool's left capacity
+        tool.left_capacity = tool.capacity
+        # Loop until no more relevant items or tool capacity is reached
+        while True:
+            # Get the item with the earliest arrival date that fits within the tool's capacity
+            current_item = self.fetching_queue.pop_earliest(tool.type, tool.left_capacity)
+            if current_item is None:  # If there are no relevant items to fetch
+                break
+            # Update the task queue
+            self.add_item_to_fetching_task(current_item, employee, tool)
+            # Iterate over relevant items in the same aisle
+            for item in self.fetching_queue.items_in_aisle(tool.type, current_item.aisle):
+                if item.volume_to_fetch <= tool.left_capacity:
+                    self.fetching_queue.remove(item)
+                    self.add_item_to_fetching_task(item, employee, tool)
+                # Otherwise this item is not relevant to the current fetch task
+
+        # Calculate the total time for the fetch task
+        fetching_task_of_employee = self.fetching_task_queue.task(employee.employee_id)
+        if len(fetching_task_of_employee) > 0:
+            number_items_in_fetch_task = len(fetching_task_of_employee)
+            time_fetch_task = fetching_task_of_employee.time_to_fetch
+            number_aisles_in_fetch_task = len(fetching_task_of_employee.aisles)
+
+            # Route the task through the aisles and calculate its travel time
+            task_locations = np.array([item.location for item in fetching_task_of_employee.items], dtype=int)
+            route_aisles, route_x, route_z = self.router.route(task_locations, tool.type)
+            time_fetch_task += self.calculate_route_time(route_aisles, route_x, route_z, tool)
+
+            # Append fetch task time to the fetch task times list
+            time_fetch_task = round(time_fetch_task)
+            self.fetch_task_times.append(time_fetch_task)
+            # Record the fetch task
+            self.fetch_tasks.record(t_now, employee.employee_id, tool.tool_id, tool.type, time_fetch_task,
+                                    number_items_in_fetch_task, number_aisles_in_fetch_task)
+            return time_fetch_task  # Return the time of the fetch task
+        else:
+            employee.employee_status = 0  # Update employee status to 0 (available)
+            tool.tool_status = 0  # Update tool status to 0 (available)
+            return 0  # Return 0 (no fetch task)
+
+    def placing_huristic(self, item_id: int, amount_to_place: int) -> None:
+        """
+        Apply the placing heuristic to determine the optimal placement of an item.
+
+        Args:
+            item_id (int): The ID of the item to be placed.
+            amount_to_place (int): The number of units of the item to be placed.
+
+        Raises:
+            ValueError: If no cell has enough volume for a unit of the item.
+        """
+        self.warehouse_positions.add_many(
+            self.placing_cells(item_id, amount_to_place, self.warehouse_positions.locations(item_id)))
+
+    def placing_cells(self, item_id: int, amount_to_place: int, item_locations: list) -> list:
+        """
+        Choose the cells of an item with the placing heuristic and take their free volume,
+        without adding the item to the ledger.
+
+        Args:
+            item_id (int): The ID of the item to be placed.
+            amount_to_place (int): The number of units of the item to be placed.
+            item_locations (list): The locations which hold the item, the chosen cells are appended to it.
+
+        Returns:
+            list: (location, item_id, amount) tuples of the placements, in order.
+
+        Raises:
+            ValueError: If no cell has enough volume for a unit of the item.
+        """
+        # Get unit putaway zone and unit volume for the item
+        unit_putaway_zone = int(self.item_lookup.putaway_zone[item_id])
+        unit_volume = self.item_lookup.volume[item_id]
+        capacity = self.capacity
+        placements = []
+        while amount_to_place > 0:  # While there are still units to place
+            # Calculate the volume left to place
+            volume_left_to_place = unit_volume * amount_to_place
+            # The cells which already include the item, then the cells with the same putaway zone, then all
+            # other cells: in the first of them with a cell for a unit, the most attractive cell with enough
+            # volume to place all the units left to place, or else the most attractive cell for a unit
+            most_attractive_cell = capacity.most_attractive_of(item_locations, volume_left_to_place)
+            if most_attractive_cell < 0:
+                most_attractive_cell = capacity.most_attractive_of(item_locations, unit_volume)
+            for zone in (unit_putaway_zone, None):
+                if most_attractive_cell >= 0:
+                    break
+                most_attractive_cell = capacity.most_attractive(zone, volume_left_to_place)
+                if most_attractive_cell < 0:
+                    most_attractive_cell = capacity.most_attractive(zone, unit_volume)
+            if most_attractive_cell < 0:
+                raise ValueError(f"no cell has enough volume for a unit of item {item_id}.")
+            max_amount_to_place = self.available_volume[most_attractive_cell] // unit_volume
+            # If there is a cell with enough volume to place all the units left to place
+            amount_to_place_here = min(amount_to_place, max_amount_to_place)
+            # Calculate the volume to place in the cell
+            volume_to_place_here = unit_volume * amount_to_place_here
+            # Place the item in the cell, the ledger creates the position if the cell does not have the item yet
+            placements.append((most_attractive_cell, item_id, amount_to_place_here))
+            item_locations.append(most_attractive_cell)
+            # Update the available volume of the cell
+            capacity.change_volume(most_attractive_cell, -volume_to_place_here)
+
+            amount_to_place -= amount_to_place_here
+        return placements
+
+    # ------------- Event functions -------------:
+
+    def deliveries_from_suppliers(self, t_now: datetime, shipment: Shipment) -> None:
+        """
+        This function handels the deliveries from suppliers events.
+
+        Args:
+            t_now (datetime): The current time.
+            shipment (Shipment): The shipment that is being delivered.
+
+        Iterates over the items in the shipment and adds them to the warehouse with the location named 'Sort'.
+
+        - `item`: Item ID from the shipment.
+        - `amount`: Amount of the item in the shipment.
+        - Adds `amount` units of `item` to the warehouse positions ledger under the sort area location.
+        - Wakes up the orders waiting for `item`.
+        """
+        for item, amount in shipment.items_dict.items():
+            # Add the items to the sort area
+            self.warehouse_positions.add(self.sort_area_location, item, amount)
+            if self.waiting_for_delivery.has_waiting(item):  # If there are orders waiting for the item
+                self.wake_backorders(t_now, item)
+
+    def placing(self) -> None:
+        """
+        This function handels the placing events.
+
+        Places all the items of the sort area in one pass, in order of decreasing item attractiveness
+        (ties in the order of the sort area), with the placing heuristic of placing_cells. The free volumes
+        are updated as every item is placed, and the positions are added to the ledger in one batch.
+        Every item has a single position in the sort area, so an item never sees the placements of another
+        one in the ledger, and the result is the one of calling placing_huristic for every item in order.
+        """
+        # Get the items to place from SORT01
+        sort_area = self.warehouse_positions.items_at(self.sort_area_location)
+        uuids = np.fromiter((uuid for _, uuid, _ in sort_area), dtype=int, count=len(sort_area))
+        # Sort by the attractiveness of the items
+        order = np.argsort(-self.item_lookup.attractiveness[uuids], kind='stable')
+        # Perform the placing heuristic for each item
+        placements = []
+        for i in order.tolist():
+            _, uuid, quantity = sort_area[i]
+            if quantity > 0:
+                placements += self.placing_cells(uuid, quantity, self.warehouse_positions.locations(uuid))
+        self.warehouse_positions.add_many(placements)
+        # remove from the ledger every position with location == sort_area_location and quantity == 0
+        self.warehouse_positions.discard_empty(self.sort_area_location)
+
+    def orders_from_customers(self, t_now: datetime, order: Order) -> None:
+        """
+        Process orders from customers. In the 'wave' picking mode the order joins the open wave.
+
+        Args:
+            t_now (datetime): The current time.
+            order (Order): The order to process.
+        """
+        if self.picking_mode == 'wave':
+            self.add_order_to_wave(t_now, order)
+        elif self.allocate_order(t_now, order):
+            self.dispatch_available_employees(t_now)
+
+    def allocate_order(self, t_now: datetime, order: Order) -> bool:
+        """
+        Allocate the units of all the lines of an order to locations and queue them for fetching,
+        or backorder or reject the order if the warehouse does not have all of them.
+
+        Args:
+            t_now (datetime): The current time.
+            order (Order): The order to allocate.
+
+        Returns:
+            bool: True if the order was queued for fetching, False otherwise.
+        """
+        # Check if the items are in the warehouse with all the units of the order
+        if not self.short_lines(order).any():
+            # We have all units of these items
+            # Prioritize locations for fetching
+            self.prioritize_locations_for_fetching(t_now, order)
+            return True
+        # We do not have all units of these items
+        self.backorder_or_reject(t_now, order)
+        return False
+
+    def dispatch_available_employees(self, t_now: datetime) -> None:
+        """
+        Start a fetching task for every available employee with an available tool which has work.
+
+        Args:
+            t_now (datetime): The current time.
+        """
+        for employee in self.employees:  # Iterate over the employees
+            if employee.employee_status == 0:  # If the employee is available
+                tool = self.prioritize_tools_for_queues(
+                    employee)  # Prioritize tools for queues
+                if tool:  # If the employee has a tool
+                    # Create a fetching event
+                    self.creation_fetching(t_now, employee, tool)
+
+    def add_order_to_wave(self, t_now: datetime, order: Order) -> None:
+        """
+        Add an order to the open wave, opening a wave if there is none. The wave is released when its
+        window ends, or as soon as it has wave_max_orders orders.
+
+        Args:
+            t_now (datetime): The current time.
+            order (Order): The order to add.
+        """
+        self.wave_orders.append(order)
+        if self.wave_max_orders is not None and len(self.wave_orders) >= self.wave_max_orders:
+            self.release_wave(t_now)
+        elif self.wave_release_time is None:  # The order opens a new wave
+            self.wave_release_time = t_now + self.wave_window
+            self.events.schedule(time=self.wave_release_time, type=EventType.WAVE_RELEASE)
+
+    def wave_release(self, t_now: datetime) -> None:
+        """
+        This function handels the wave release events.
+
+        Args:
+            t_now (datetime): The current time
+        """
+        # A wave released by its number of orders leaves a stale release event behind
+        if t_now == self.wave_release_time:
+            self.release_wave(t_now)
+
+    def release_wave(self, t_now: datetime) -> None:
+        """
+        Allocate all the orders of the open wave in arrival order, then dispatch the available employees once.
+        The items of the wave are queued together by tool and aisle, so the fetching tasks collect
+        more items from the same aisles.
+
+        Args:
+            t_now (datetime): The current time.
+        """
+        orders, self.wave_orders, self.wave_release_time = self.wave_orders, [], None
+        allocated = [self.allocate_order(t_now, order) for order in orders]
+        if any(allocated):
+            self.dispatch_available_employees(t_now)
+
+    def rest(self, t_now: datetime, employee: Employee) -> None:
+        """
+        This function handels the rest events.
+
+        Args:
+            t_now (datetime): The current time
+            employee (Employee): The employee that is resting
+        """
+        employee.employee_status = 0  # The employee is available
+        if employee not in self.employees:  # Retired by a scenario
+            return
+        # Check if there are tools to be picked
+        tool = self.prioritize_tools_for_queues(employee)
+        if tool:  # If there are tools to be picked
+            self.creation_fetching(t_now=t_now, employee=employee, tool=tool)
+
+    def handle_employee_fetching_tasks(self, item: FetchItem) -> None:
+        order_id = item.order_id  # Get the order
+        order = self.get_order(order_id)  # Get the order
+        uuid = item.uuid  # Get the UUID
+        # update the quantity left to fetch
+        order.items_dict[uuid] -= item.units_to_fetch
+        if not any(order.items_dict.values()):  # All the lines of the order were fetched
+            arrival_date = order.arrival_date.date()
+            current_date = self.t_now.date()
+            count_days_between = self.calendar.working_days_between(arrival_date, current_date)
+            order.waiting_days_for_delivery = count_days_between
+            # Update Service Level
+            if order.waiting_days_for_delivery > 4:
+                self.orders_late += 1
+            else:
+                self.orders_on_time += 1
+                self.orders_on_time_today += 1
+            del self.orders[order_id]  # Drop the completed order from the registry
+
+    def fetching(self, t_now: datetime, employee: Employee, tool: Tool) -> None:
+        """
+        This function handels the fetching events.
+
+        Args:
+            t_now (datetime): The current time
+            employee (Employee): The employee that is fetching
+            tool (Tool): The tool that is being fetched
+        """
+        # Get the last fetching task assigned to the employee from the fetching task queue.
+        last_employee_fetching_task = self.fetching_task_queue.task(employee.employee_id)
+        # apply handle_employee_fetching_tasks on every item of last_employee_fetching_task
+        for item in last_employee_fetching_task.items:
+            self.handle_employee_fetching_tasks(item)
+        # remove all the items from the task of the employee
+        last_employee_fetching_task.clear()
+
+        current_date = t_now.date()
+        # If it is Friday
+        if self.calendar.is_short_day(current_date):
+            if 8 <= t_now.hour <= 12:  # work hours
+                self.checking_next_fetching_task(t_now, employee, tool)
+
+        else:  # If it is not Friday
+            if 8 <= t_now.hour <= 17:
+                if employee.employee_rest == 1:  # If the employee rested
+                    self.checking_next_fetching_task(t_now, employee, tool)
+
+                else:  # If the employee did not rest
+                    if t_now.hour > 12:  # employee needs rest
+                        employee.employee_rest = 1  # The employee is resting
+                        tool.status = 0  # The tool is available
+                        # Add the event to the event list
+                        self.events.schedule(time=t_now+timedelta(hours=1),
+                                             type=EventType.REST, employee=employee)
+                    else:  # employee does not need rest
+                        self.checking_next_fetching_task(t_now, employee, tool)
+
+    def tranfer_tools(self, t_now: datetime, employee: Employee, tool: Tool) -> None:
+        """
+        This function creates the transfer tools events.
+
+        Args:
+            t_now (datetime): The current time
+            tool (Tool): The tool that is being transferred
+            employee (Employee): The employee that is transferred to the tool
+        """
+        if employee not in self.employees or tool not in self.tools:  # Retired by a scenario during the transfer
+            tool.status = 0  # The tool is available
+            self.rest(t_now, employee)  # An employee who is not retired looks for another tool
+            return
+        self.creation_fetching(t_now, employee, tool)
+
+    def twelve_pm(self, t_now: datetime, next_day: datetime) -> None:
+        """
+        This function creates the twelve pm events.
+        Args:
+            t_now (datetime): The current time
+            next_day (datetime): The next day
+        """
+        current_date = t_now.date()
+        # If it is not  Friday
+        if not self.calendar.is_short_day(current_date):
+            available_employees = [
+                employee for employee in self.employees if employee.employee_status == 0]
+            for employee in available_employees:
+                if employee.employee_id != 0:
+                    employee.employee_rest = 1  # The employee is resting
+                    # Add the event to the event list
+                    self.events.schedule(time=t_now + timedelta(hours=1),
+                                         type=EventType.REST, employee=employee)
+
+        # Add the event to the event list
+        next_day = next_day.replace(hour=12, minute=0)
+        self.events.schedule(time=next_day, type=EventType.TWELVE_PM)
+
+    # ------------- Simulation loop -------------:
+
+    def is_finished(self) -> bool:
+        """
+        Returns:
+            bool: True if there are no more events to process before the last date, False otherwise.
+        """
+        return self.event is None or not self.events or self.t_now > self.last_date
+
+    def step(self) -> bool:
+        """
+        Process the next event.
+
+        Returns:
+            bool: True if an event was processed, False if the simulation is finished.
+        """
+        if self.is_finished():
+            return False
+        t_now = self.t_now
+        event = self.event
+        if self.current_date != t_now.date():
+            self.orders_on_time_today = 0
+
+        if event.type == EventType.DELIVERIES_FROM_SUPPLIERS:
+            self.deliveries_from_suppliers(t_now, event.shipment)
+
+        elif event.type == EventType.TWELVE_PM:
+            next_day = self.calendar.next_working_day(t_now)
+            self.twelve_pm(t_now, next_day)
+
+        elif event.type == EventType.FETCHING:
+            self.fetching(t_now, event.employee, event.tool)
+
+        elif event.type == EventType.TRANSFER_TOOLS:
+            self.tranfer_tools(t_now, event.employee, event.tool)
+
+        elif event.type == EventType.REST:
+            self.rest(t_now, event.employee)
+
+        elif event.type == EventType.ORDERS_FROM_CUSTOMERS:
+            self.orders_from_customers(t_now, event.order)
+
+        elif event.type == EventType.PLACING:
+            self.placing()
+
+        elif event.type == EventType.WAVE_RELEASE:
+            self.wave_release(t_now)
+
+        self.current_date = t_now.date()
+        # Check in order to reduce the amount of useless prints
+        if event.type != EventType.DELIVERIES_FROM_SUPPLIERS and self.progress.due(t_now):
+            self.progress.report(t_now, event.type.name, self.orders_on_time_today, self.orders_on_time,
+                                 self.impossible_orders, self.return_orders, len(self.fetching_task_queue),
+                                 len(self.fetching_queue))
+        # Record the event, -1 marks a missing value
+        self.events_sim.record(t_now,
+                               event.type.value,
+                               event.employee.employee_id if event.employee else -1,
+                               event.tool.tool_id if event.tool else -1,
+                               event.tool.type if event.tool else -1,
+                               next(iter(event.shipment.items_dict)) if event.shipment else -1,
+                               event.order.order_id if event.order else -1,
+                               next(iter(event.order.items_dict)) if event.order else -1)
+
+        previous_event_date = t_now.date()  # Extract the current date
+        self.event = self.events.pop()
+        self.t_now = self.event.time
+
+        if self.t_now.date() != previous_event_date:
+            # Start of a new day
+            self.fetching_task_queue.clear()
+            for employee in self.employees:
+                employee.employee_status = 0  # The employee is available
+                if employee.employee_id != 0:
+                    employee.employee_rest = 0  # The employee is not resting
+            for tool in self.tools:
+                tool.status = 0  # The tool is available
+            if self.checkpoint_every_days:
+                self.days_since_checkpoint += 1
+                if self.days_since_checkpoint >= self.checkpoint_every_days:
+                    self.save_checkpoint()
+        return True
+
+    def run(self, until: datetime = None) -> None:
+        """
+        Process the events until the simulation is finished.
+
+        Args:
+            until (datetime, optional): Stop before the first event later than this time,
+                                        None runs to the end. Defaults to None.
+        """
+        while until is None or (self.t_now is not None and self.t_now <= until):
+            if not self.step():
+                break
+
+    def shared_objects(self) -> dict:
+        """
+        Returns:
+            dict: The objects which are referenced by the state of the run but not saved in its checkpoints,
+                  name -> object: the simulation itself, the global np.random and the INPUT_ATTRIBUTES.
+        """
+        shared = {'simulation': self, 'np.random': np.random}
+        shared.update({name: getattr(self, name) for name in self.INPUT_ATTRIBUTES})
+        return shared
+
+    def save_checkpoint(self, path: str = None) -> str:
+        """
+        Write the state of the run to a checkpoint, before the next event. The state of the global
+        np.random is saved when it is the generator of the run.
+
+        Args:
+            path (str, optional): The path of the checkpoint, like a snapshot to fork scenarios from. Defaults to
+                                  a new checkpoint in checkpoint_path, and the older ones but the previous one are removed.
+
+        Returns:
+            str: The path of the checkpoint.
+        """
+        if path is None:
+            self.days_since_checkpoint = 0
+            path = f"{self.checkpoint_path}/checkpoint-{self.t_now.strftime('%Y%m%d-%H%M%S')}.pkl.gz"
+        state = {name: value for name, value in vars(self).items() if name not in self.INPUT_ATTRIBUTES}
+        write_checkpoint(path, {'inputs': self.inputs.signature(),
+                                'np_random_state': np.random.get_state() if self.rng is np.random else None,
+                                'simulation': state},
+                         self.shared_objects())
+        if os.path.dirname(path) == self.checkpoint_path:
+            prune_checkpoints(self.checkpoint_path)
+        return path
+
+    @classmethod
+    def from_checkpoint(cls, path: str, inputs: SimulationInputs) -> 'Simulation':
+        """
+        Restore a run from a checkpoint written by save_checkpoint. The rows which the recorders wrote after
+        the checkpoint are removed, so the resumed run gives the results of an uninterrupted run.
+
+        Args:
+            path (str): The path of the checkpoint.
+            inputs (SimulationInputs): The inputs of the run, loaded the same way as for the run.
+
+        Returns:
+            Simulation: The run, before the event which followed the checkpoint.
+
+        Raises:
+            ValueError: If the checkpoint was written with other inputs.
+        """
+        simulation = cls.__new__(cls)
+        simulation.bind_inputs(inputs)
+        checkpoint = read_checkpoint(path, simulation.shared_objects())
+        if checkpoint['inputs'] != inputs.signature():
+            raise ValueError(f"the checkpoint {path} was written with other inputs.")
+        vars(simulation).update(checkpoint['simulation'])
+        if checkpoint['np_random_state'] is not None:
+            np.random.set_state(checkpoint['np_random_state'])
+        simulation.fetch_tasks.rewind()
+        simulation.events_sim.rewind()
+        return simulation
+
+    def branch(self, results_path: str) -> None:
+        """
+        Continue the run in another results directory, like a scenario forked from this state.
+        The recorders start from a copy of the rows they wrote so far, so the results of the branch
+        cover the whole run.
+
+        Args:
+            results_path (str): The results directory of the branch.
+        """
+        self.results_path = results_path
+        self.checkpoint_path = f'{results_path}/checkpoints'
+        self.fetch_tasks.branch(f'{results_path}/fetch_tasks_results')
+        self.events_sim.branch(f'{results_path}/events_sim_results')
+
+    def measures(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The measures of the run, one row.
+        """
+        measures_df = pd.DataFrame(columns=['last_date', 'ORDERS_ON_TIME', 'ORDERS_LATE', 'RETURN_ORDERS',
+                                   'WAITING_FOR_DELIVERY_len', 'FETCHING_QUEUE_DF', 'FETCHING_TASK_QUEUE_DF', 'IMPOSSIBLE_ORDERS'])
+        measures_df["last_date"] = [self.last_date]
+        measures_df["ORDERS_ON_TIME"] = [self.orders_on_time]
+        measures_df["ORDERS_LATE"] = [self.orders_late]
+        measures_df["RETURN_ORDERS"] = [self.return_orders]
+        measures_df["WAITING_FOR_DELIVERY_len"] = [len(self.waiting_for_delivery)]
+        measures_df["FETCHING_QUEUE_DF"] = [len(self.fetching_queue)]
+        measures_df["FETCHING_TASK_QUEUE_DF"] = [len(self.fetching_task_queue)]
+        measures_df["IMPOSSIBLE_ORDERS"] = [self.impossible_orders]
+        return measures_df
+
+    def write_results(self) -> None:
+        """
+        Write the measures, the final positions and the waiting orders to the results directory,
+        and the rows of the recorders which were not spilled yet.
+        """
+        # create the results directory if it doesn't exist
+        os.makedirs(self.results_path, exist_ok=True)
+        self.measures().to_csv(f'{self.results_path}/measures.csv', index=False)
+
+        self.warehouse_positions.to_dataframe().to_csv(
+            f'{self.results_path}/positions_results.csv', index=False)
+
+        waiting_df = pd.DataFrame(list(self.waiting_for_delivery))
+        waiting_df.to_csv(
+            f'{self.results_path}/waiting_for_supply.csv', index=False)
+
+        # Write the rows which were not spilled yet
+        self.fetch_tasks.close()
+        self.events_sim.close()
@@ -0,0 +1,198 @@
+import heapq
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from classes import Event, EventType
+
+
+def time_key(time) -> int:
+    """
+    Returns:
+        int: The time as nanoseconds since the epoch, which compares faster than datetime objects.
+    """
+    if type(time) is pd.Timestamp:
+        return time.value
+    return pd.Timestamp(time).value
+
+
+class KnownEvents:
+    """
+    Represents the events known before the simulation starts (orders, shipments, placing, ...) as
+    arrays sorted by time. The Event objects, and the objects they carry, are created by a factory
+    only when the events come due, so startup time and memory do not grow with the history length.
+    """
+
+    def __init__(self, make_event) -> None:
+        """
+        Initializes a new instance of the KnownEvents class.
+
+        Args:
+            make_event: A function (type, row, time) -> Event, where row is the position of the event
+                        in the times passed to add for its type.
+        """
+        self.make_event = make_event
+        self.types = []  # The EventType of every added group
+        self.keys = np.empty(0, dtype=np.int64)  # Sorted time keys
+        self.groups = np.empty(0, dtype=np.int64)  # The group of every sorted event
+        self.rows = np.empty(0, dtype=np.int64)  # The row of every sorted event within its group
+        self.position = 0  # Index of the next event
+        self.next_key = None  # Time key of the next event as an int, None when exhausted
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of events which did not come due yet.
+        """
+        return len(self.keys) - self.position
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the KnownEvents object.
+        """
+        return (f"KnownEvents(events={len(self.keys)}, position={self.position})")
+
+    def __getstate__(self) -> dict:
+        """
+        Returns:
+            dict: The state of the object for a checkpoint, without the events which came due.
+        """
+        state = self.__dict__.copy()
+        for name in ('keys', 'groups', 'rows'):
+            state[name] = state[name][self.position:].copy()
+        state['position'] = 0
+        return state
+
+    def add(self, times, type: EventType) -> None:
+        """
+        Adds a group of events of the same type. Events with the same time keep the order in which
+        they were added.
+
+        Args:
+            times: The times of the events.
+            type (EventType): The type of the events.
+        """
+        keys = pd.DatetimeIndex(times).as_unit('ns').asi8  # Times as nanoseconds since the epoch
+        group = len(self.types)
+        self.types.append(type)
+        # Merge the new group with the events which did not come due yet, keeping ties in insertion order
+        all_keys = np.concatenate([self.keys[self.position:], keys])
+        all_groups = np.concatenate([self.groups[self.position:], np.full(len(keys), group, dtype=np.int64)])
+        all_rows = np.concatenate([self.rows[self.position:], np.arange(len(keys), dtype=np.int64)])
+        order = np.argsort(all_keys, kind='stable')
+        self.keys, self.groups, self.rows = all_keys[order], all_groups[order], all_rows[order]
+        self.position = 0
+        self.next_key = int(self.keys[0]) if len(self.keys) else None
+
+    def pop(self) -> Event:
+        """
+        Creates the next event.
+
+        Returns:
+            Event: The next event.
+        """
+        position = self.position
+        self.position += 1
+        self.next_key = int(self.keys[self.position]) if self.position < len(self.keys) else None
+        return self.make_event(self.types[self.groups[position]], int(self.rows[position]),
+                               pd.Timestamp(int(self.keys[position])))
+
+
+class EventCalendar:
+    """
+    Represents the future events of the simulation as the known events stream merged with a heap
+    of (time_key, seq, type_code, event) tuples for the events created during the run.
+    The sequence number breaks ties between events with the same time in scheduling order (FIFO),
+    so the heap never compares Event objects. Known events come before heap events with the same time.
+    """
+
+    def __init__(self, known: KnownEvents = None) -> None:
+        """
+        Initializes a new instance of the EventCalendar class.
+
+        Args:
+            known (KnownEvents, optional): The events known before the simulation starts. Defaults to None.
+        """
+        self.heap = []  # Heap of (time_key, seq, type_code, event)
+        self.next_seq = 0  # Counter for the scheduling order
+        self.known = known if known is not None else KnownEvents(None)
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of scheduled events.
+        """
+        return len(self.heap) + len(self.known)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the EventCalendar object.
+        """
+        return (f"EventCalendar(known={len(self.known)}, dynamic={len(self.heap)}, next_time={self.peek_time()})")
+
+    def push(self, event: Event) -> Event:
+        """
+        Adds an event to the calendar.
+
+        Args:
+            event (Event): The event to add.
+
+        Returns:
+            Event: The added event.
+        """
+        heapq.heappush(self.heap, (time_key(event.time), self.next_seq, event.type.value, event))
+        self.next_seq += 1
+        return event
+
+    def schedule(self, time: datetime, type: EventType, **payload) -> Event:
+        """
+        Creates an event and adds it to the calendar.
+
+        Args:
+            time (datetime): The time of the event.
+            type (EventType): The type of the event.
+            **payload: The employee, tool, shipment, order or items_to_fetch of the event.
+
+        Returns:
+            Event: The created event.
+        """
+        return self.push(Event(time, type, **payload))
+
+    def extend(self, events) -> None:
+        """
+        Adds many events to the calendar with a single heapify.
+        Events with the same time keep the order of the iterable.
+
+        Args:
+            events: An iterable of Event objects.
+        """
+        for event in events:
+            self.heap.append((time_key(event.time), self.next_seq, event.type.value, event))
+            self.next_seq += 1
+        heapq.heapify(self.heap)
+
+    def pop(self) -> Event:
+        """
+        Removes the earliest event from the calendar.
+
+        Returns:
+            Event: The earliest event, the first scheduled among events with the same time.
+
+        Raises:
+            IndexError: If the calendar is empty.
+        """
+        next_key = self.known.next_key
+        if next_key is not None and (not self.heap or next_key <= self.heap[0][0]):
+            return self.known.pop()
+        return heapq.heappop(self.heap)[3]
+
+    def peek_time(self):
+        """
+        Returns:
+            datetime: The time of the earliest event, or None if the calendar is empty.
+        """
+        next_key = self.known.next_key
+        if next_key is not None and (not self.heap or next_key <= self.heap[0][0]):
+            return pd.Timestamp(next_key)
+        return self.heap[0][3].time if self.heap else None
@@ -0,0 +1,282 @@
+import heapq
+from datetime import datetime
+
+
+class FetchItem:
+    """
+    Represents units of an item waiting in the fetching queue to be fetched from a location.
+    """
+    __slots__ = ('fetch_tool', 'location', 'aisle', 'cell_attractiveness', 'order_id', 'arrival_date',
+                 'uuid', 'units_to_fetch', 'volume_to_fetch', 'time_to_fetch', 'seq', 'queued')
+
+    def __init__(self, fetch_tool: int, location: int, aisle: int, cell_attractiveness: float, order_id: int,
+                 arrival_date: datetime, uuid: int, units_to_fetch: float, volume_to_fetch: float, time_to_fetch: float) -> None:
+        """
+        Initializes a new instance of the FetchItem class.
+
+        Args:
+            fetch_tool (int): The tool type needed to fetch from the location.
+            location (int): The location to fetch from.
+            aisle (int): The aisle of the location.
+            cell_attractiveness (float): The attractiveness of the location.
+            order_id (int): The order the units belong to.
+            arrival_date (datetime): The arrival date of the order.
+            uuid (int): The item id.
+            units_to_fetch (float): The number of units to fetch.
+            volume_to_fetch (float): The volume of the units to fetch.
+            time_to_fetch (float): The time it takes to remove the units from the shelf.
+        """
+        self.fetch_tool = fetch_tool
+        self.location = location
+        self.aisle = aisle
+        self.cell_attractiveness = cell_attractiveness
+        self.order_id = order_id
+        self.arrival_date = arrival_date
+        self.uuid = uuid
+        self.units_to_fetch = units_to_fetch
+        self.volume_to_fetch = volume_to_fetch
+        self.time_to_fetch = time_to_fetch
+        self.seq = None  # Set by the queue, breaks ties between items
+        self.queued = False  # True while the item is in the queue
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the FetchItem object.
+        """
+        return (f"FetchItem(order_id={self.order_id}, uuid={self.uuid}, location={self.location}, "
+                f"fetch_tool={self.fetch_tool}, units_to_fetch={self.units_to_fetch})")
+
+
+class FetchingQueue:
+    """
+    Represents the items waiting to be fetched, with one heap per tool type ordered by
+    (arrival date, descending cell attractiveness) and per (tool type, aisle) buckets.
+    Items removed through a bucket or popped stay in the heap and are skipped by the searches,
+    the heap is rebuilt without them when they are the majority of its entries.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the FetchingQueue class.
+        """
+        self.heaps = {}  # tool type -> heap of (arrival_date, -cell_attractiveness, seq, item)
+        self.aisles = {}  # (tool type, aisle) -> {seq: item}
+        self.counts = {}  # tool type -> number of queued items
+        self.size = 0  # Number of queued items
+        self.next_seq = 0  # Counter for the items order
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of queued items.
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Returns:
+            iterator: The queued items, grouped by tool type and aisle.
+        """
+        for bucket in self.aisles.values():
+            yield from bucket.values()
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the FetchingQueue object.
+        """
+        return (f"FetchingQueue(items={self.size}, counts={self.counts})")
+
+    def push(self, item: FetchItem) -> None:
+        """
+        Adds an item to the queue of its tool type.
+
+        Args:
+            item (FetchItem): The item to add.
+        """
+        item.seq = self.next_seq
+        item.queued = True
+        self.next_seq += 1
+        heapq.heappush(self.heaps.setdefault(item.fetch_tool, []),
+                       (item.arrival_date, -item.cell_attractiveness, item.seq, item))
+        self.aisles.setdefault((item.fetch_tool, item.aisle), {})[item.seq] = item
+        self.counts[item.fetch_tool] = self.counts.get(item.fetch_tool, 0) + 1
+        self.size += 1
+
+    def has_work(self, tool_type: int) -> bool:
+        """
+        Returns:
+            bool: True if there are items to fetch with the tool type, False otherwise.
+        """
+        return self.counts.get(tool_type, 0) > 0
+
+    def _detach(self, item: FetchItem) -> None:
+        """
+        Removes an item from its aisle bucket and from the counters. Its heap entry is left behind.
+
+        Args:
+            item (FetchItem): The queued item to detach.
+        """
+        item.queued = False
+        bucket = self.aisles[(item.fetch_tool, item.aisle)]
+        del bucket[item.seq]
+        if not bucket:
+            del self.aisles[(item.fetch_tool, item.aisle)]
+        self.counts[item.fetch_tool] -= 1
+        self.size -= 1
+
+    def remove(self, item: FetchItem) -> None:
+        """
+        Removes an item from the queue.
+
+        Args:
+            item (FetchItem): The queued item to remove.
+        """
+        self._detach(item)
+        self._compact(item.fetch_tool)
+
+    def _compact(self, tool_type: int) -> None:
+        """
+        Drops the removed items from the heap of a tool type when they are the majority of its entries.
+
+        Args:
+            tool_type (int): The tool type.
+        """
+        heap = self.heaps[tool_type]
+        if len(heap) > 2 * self.counts[tool_type] + 64:
+            self.heaps[tool_type] = [entry for entry in heap if entry[3].queued]
+            heapq.heapify(self.heaps[tool_type])
+
+    def pop_earliest(self, tool_type: int, max_volume: float = float('inf')):
+        """
+        Removes the item with the earliest arrival date (and then the highest cell attractiveness)
+        which fits into the volume left.
+
+        The heap is searched best-first without being changed: a child entry is never earlier than its parent,
+        so the entries are visited in queue order and only the children of the visited entries are candidates.
+        A call takes O(log n + k log k) for the k earlier entries which are too large or removed, O(log n)
+        when the earliest item fits. The entry of the item is left in the heap, like the removed items.
+
+        Args:
+            tool_type (int): The tool type.
+            max_volume (float, optional): The maximal volume of the item. Defaults to infinity.
+
+        Returns:
+            FetchItem: The item, or None if there is no item which fits.
+        """
+        heap = self.heaps.get(tool_type, [])
+        while heap and not heap[0][3].queued:  # The removed items at the top are dropped for good
+            heapq.heappop(heap)
+        candidates = [(heap[0], 0)] if heap else []  # (entry, position in the heap), the earliest first
+        earliest_item = None
+        while candidates:
+            entry, position = heapq.heappop(candidates)
+            if entry[3].queued and entry[3].volume_to_fetch <= max_volume:
+                earliest_item = entry[3]
+                break
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(candidates, (heap[child], child))
+        if earliest_item is not None:
+            self._detach(earliest_item)
+            self._compact(tool_type)
+        return earliest_item
+
+    def items_in_aisle(self, tool_type: int, aisle: int) -> list:
+        """
+        Returns:
+            list: The queued items of the tool type in the aisle, sorted by cell attractiveness (descending).
+        """
+        bucket = self.aisles.get((tool_type, aisle), {})
+        return sorted(bucket.values(), key=lambda item: (-item.cell_attractiveness, item.seq))
+
+
+class FetchingTask:
+    """
+    Represents the items assigned to one fetch task of an employee, with running totals.
+    """
+    __slots__ = ('items', 'time_to_fetch', 'aisles')
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the FetchingTask class.
+        """
+        self.items = []  # The FetchItem objects of the task, in assignment order
+        self.time_to_fetch = 0  # Sum of the time to remove the items from the shelves
+        self.aisles = set()  # The aisles visited by the task
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of items in the task.
+        """
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the FetchingTask object.
+        """
+        return (f"FetchingTask(items={len(self.items)}, aisles={sorted(self.aisles)}, time_to_fetch={self.time_to_fetch})")
+
+    def append(self, item: FetchItem) -> None:
+        """
+        Adds an item to the task and updates the totals.
+
+        Args:
+            item (FetchItem): The item taken from the fetching queue.
+        """
+        self.items.append(item)
+        self.time_to_fetch += item.time_to_fetch
+        self.aisles.add(item.aisle)
+
+    def clear(self) -> None:
+        """
+        Removes all the items from the task.
+        """
+        self.items.clear()
+        self.time_to_fetch = 0
+        self.aisles.clear()
+
+
+class FetchingTaskQueue:
+    """
+    Represents the fetch tasks in progress, one FetchingTask buffer per employee.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the FetchingTaskQueue class.
+        """
+        self.tasks = {}  # employee id -> FetchingTask
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of items in all the tasks.
+        """
+        return sum(len(task) for task in self.tasks.values())
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the FetchingTaskQueue object.
+        """
+        return (f"FetchingTaskQueue(tasks={self.tasks})")
+
+    def task(self, employee_id: int) -> FetchingTask:
+        """
+        Returns:
+            FetchingTask: The task buffer of the employee.
+        """
+        if employee_id not in self.tasks:
+            self.tasks[employee_id] = FetchingTask()
+        return self.tasks[employee_id]
+
+    def clear(self) -> None:
+        """
+        Removes the items from the tasks of all the employees.
+        """
+        for task in self.tasks.values():
+            task.clear()
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from lookups import dense_array
+
+
+class WarehouseGeometry:
+    """
+    Represents the geometry of a placement as NumPy arrays: the coordinates of every cell indexed by the
+    location id, and the position of every aisle indexed by the aisle id. Aisles run along x, from a front
+    cross aisle at x = 0 on the side of the I/O point to a back cross aisle at back_x, and are placed along y.
+    """
+
+    def __init__(self, cells: pd.DataFrame) -> None:
+        """
+        Initializes a new instance of the WarehouseGeometry class.
+
+        Args:
+            cells (pd.DataFrame): The cells data, as returned by import_warehouse_data.
+        """
+        size = int(cells['location'].max()) + 1
+        index = cells['location']
+        # Per cell
+        self.cell_aisle = dense_array(index, cells['aisle'], size, fill=-1, dtype=int)
+        self.cell_x = dense_array(index, cells['x_length'], size)
+        self.cell_y = dense_array(index, cells['y_width'], size)
+        self.cell_z = dense_array(index, cells['z_height'], size)
+        self.back_x = float(np.nanmax(self.cell_x))  # The back cross aisle, behind the deepest cells
+        # Per aisle, all the cells of an aisle share its y and its distance from the I/O point
+        aisles = cells.drop_duplicates('aisle')
+        aisles_size = int(aisles['aisle'].max()) + 1
+        self.aisle_io_distance = dense_array(aisles['aisle'], aisles['distance_from_io_to_aisle'], aisles_size)
+        self.aisle_y = dense_array(aisles['aisle'], aisles['y_width'], aisles_size)
+        # Distance along y between every two aisles
+        self.aisle_distance = np.abs(self.aisle_y[:, np.newaxis] - self.aisle_y[np.newaxis, :])
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the WarehouseGeometry object.
+        """
+        return (f"WarehouseGeometry(cells={len(self.cell_x)}, aisles={len(self.aisle_y)})")
@@ -1,46 +1,31 @@
+import numpy as np
 import pandas as pd
-from data_imports import *
+from classes import EventType
 
 # Global Parameters - Shown here to save code repetition
 MAX_DATETIME = None  # Set to None for full simulation
 PLACEMENT = 'original' # Set to 'original' or 'placement#' ( # = (1,7) )
-DATES_DATA = import_dates_data(MAX_DATETIME)
-DATES_DATA_list = DATES_DATA['date'].tolist()
+RESULTS_PATH = 'src/data/{placement}/results'  # The results directory of a placement, formatted with its name
+USE_DATA_CACHE = True  # Set to False to import the tables from the CSV files without the Parquet cache
+RESULTS_FORMAT = 'csv'  # Set to 'csv' or 'parquet' (requires pyarrow) for the fetch tasks and events results
+EVENTS_RECORDING_LEVEL = 'full'  # Set to 'off', 'sampled' or 'full' for the events results
+PROGRESS_QUIET = False  # Set to True to run without progress prints
+PROGRESS_INTERVAL = 1.0  # Minimal real seconds between progress prints, set to None to print every event
+VARIATE_BLOCK_SIZE = 4096  # Number of random values drawn at once for every tool parameter
+TRANSFER_TIME_MEAN = 60  # Mean seconds to transfer from tool to tool
+TRANSFER_TIME_STD = 10  # Standard deviation of the seconds to transfer from tool to tool
+ROUTING_POLICY = 'return'  # Set to 'return', 's_shape', 'largest_gap' or 'optimal' for the routes of the fetch tasks
+PICKING_MODE = 'order'  # Set to 'order' to dispatch every order when it arrives or 'wave' to release the orders in waves
+WAVE_WINDOW_MINUTES = 15  # Minutes a wave collects orders before it is released, in the 'wave' picking mode
+WAVE_MAX_ORDERS = None  # Number of orders which releases a wave before its window ends, None for no limit
+ORDER_GROUPING = None  # Set to None for one order per line of orders.csv, 'timestamp' or the name of an order key column for multi-line orders
+CHECKPOINT_EVERY_DAYS = None  # Simulation days between two checkpoints of the run, set to None for no checkpoints
 EMPLOYEE_INDEX = 1  # Setting counter for employee id
-WAREHOUSE_DATA = import_warehouse_data()
-WAREHOUSE_POSITIONS = import_warehouse_positions()
-# find the 'location' value of the first row with aisle == 0 in the WAREHOUSE_DATA dataframe, assign as SORT_AREA_LOCATION
-SORT_AREA_LOCATION = WAREHOUSE_DATA.loc[WAREHOUSE_DATA['aisle']
-                                        == 0, 'location'].iloc[0]
-ITEMS_DATA = import_items_data()
-SHIPMENTS_DATA = import_shipments_data(max_date=MAX_DATETIME)
-ORDERS_DATA = import_orders_data(
-    shipments_df=SHIPMENTS_DATA, items_df=ITEMS_DATA, max_date=MAX_DATETIME)
-TIMES_DATA = import_tools_data()
-TOOL_CAPACITY_DATA = import_tool_capacity_data()
-ORDERS_ON_TIME = 0  # Measure for Service Level
-ORDERS_ON_TIME_TODAY = 0
 
-
-ORDERS_LATE = 0  # Measure for Service Level
-RETURN_ORDERS = 0
-IMPOSSIBLE_ORDERS = 0
-# Dictionary for fetch from floor
-# FETCH_FROM_FLOOR = {date.date(): 0 for date in DATES_DATA_list}
-# Dictionary for fetch from high
-# FETCH_FROM_HIGH = {date.date(): 0 for date in DATES_DATA_list}
-# Dictionary for fetch from sort
-# FETCH_FROM_SORT = {date.date(): 0 for date in DATES_DATA_list}
-FETCH_TASK_TIMES = []  # List for fetch task times
-WAITING_FOR_DELIVERY = []  # List for waiting for delivery
-
-FETCH_TASKS_columns = ['t_now', 'employee', 'tool', 'type_tool',
-                        'task_time', 'num_of_items', 'num_of_aisles']
-# DataFrame for fetch tasks
-FETCH_TASKS = pd.DataFrame(columns=FETCH_TASKS_columns)
-
-
-EVENTS_SIM_columns = ['t_now', 'event_type',
-                      'employee', 'tool_id', 'tool_type', 'item_in_shipment', 'order_id', 'item_in_order']
-# DataFrame for events simulation
-EVENTS_SIM = pd.DataFrame(columns=EVENTS_SIM_columns)
+# Columns of the fetch tasks results
+FETCH_TASKS_columns = {'t_now': 'datetime64[ns]', 'employee': np.int64, 'tool': np.int64, 'type_tool': np.int64,
+                       'task_time': np.float64, 'num_of_items': np.int64, 'num_of_aisles': np.int64}
+# Columns of the events simulation results
+EVENTS_SIM_columns = {'t_now': 'datetime64[ns]', 'event_type': np.int8, 'employee': 'Int64', 'tool_id': 'Int64',
+                      'tool_type': 'Int64', 'item_in_shipment': 'Int64', 'order_id': 'Int64', 'item_in_order': 'Int64'}
+EVENT_TYPE_NAMES = {event_type.value: str(event_type) for event_type in EventType}  # Labels of the event type codes
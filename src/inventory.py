@@ -0,0 +1,151 @@
+import pandas as pd
+
+
+class InventoryLedger:
+    """
+    Represents the stock held in the warehouse as an in-memory ledger keyed by (location, uuid),
+    with a per-uuid index of locations and running per-uuid totals.
+    """
+
+    def __init__(self, positions: pd.DataFrame = None) -> None:
+        """
+        Initializes a new instance of the InventoryLedger class.
+
+        Args:
+            positions (pd.DataFrame, optional): DataFrame with 'location', 'uuid' and 'quantity' columns,
+                                                as returned by import_warehouse_positions. Defaults to None.
+        """
+        self.quantities = {}  # (location, uuid) -> quantity
+        self.locations_by_uuid = {}  # uuid -> {location: None}, kept in insertion order
+        self.uuids_by_location = {}  # location -> {uuid: None}, kept in insertion order
+        self.totals = {}  # uuid -> total quantity over all locations
+        if positions is not None:
+            for location, uuid, quantity in zip(positions['location'], positions['uuid'], positions['quantity']):
+                self.add(location, uuid, quantity)
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of (location, uuid) positions in the ledger.
+        """
+        return len(self.quantities)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the InventoryLedger object.
+        """
+        return (f"InventoryLedger(positions={len(self.quantities)}, items={len(self.locations_by_uuid)})")
+
+    def add(self, location: int, uuid: int, quantity: float) -> None:
+        """
+        Adds units of an item to a location, creating the position if it does not exist.
+
+        Args:
+            location (int): The location id.
+            uuid (int): The item id.
+            quantity (float): The number of units to add.
+        """
+        key = (location, uuid)
+        if key in self.quantities:  # If the position already exists
+            self.quantities[key] += quantity
+        else:  # Create the position and index it by item and by location
+            self.quantities[key] = quantity
+            self.locations_by_uuid.setdefault(uuid, {})[location] = None
+            self.uuids_by_location.setdefault(location, {})[uuid] = None
+        self.totals[uuid] = self.totals.get(uuid, 0) + quantity
+
+    def add_many(self, positions: list) -> None:
+        """
+        Adds units of items to locations in one batch, in the given order.
+
+        Args:
+            positions (list): (location, uuid, quantity) tuples.
+        """
+        for location, uuid, quantity in positions:
+            self.add(location, uuid, quantity)
+
+    def remove(self, location: int, uuid: int, quantity: float) -> None:
+        """
+        Removes units of an item from a location. The position is kept even if its quantity reaches 0.
+
+        Args:
+            location (int): The location id.
+            uuid (int): The item id.
+            quantity (float): The number of units to remove.
+
+        Raises:
+            KeyError: If the item has no position in the location.
+        """
+        self.quantities[(location, uuid)] -= quantity
+        self.totals[uuid] -= quantity
+
+    def quantity(self, location: int, uuid: int) -> float:
+        """
+        Returns:
+            float: The number of units of the item in the location, 0 if there is no such position.
+        """
+        return self.quantities.get((location, uuid), 0)
+
+    def total(self, uuid: int) -> float:
+        """
+        Returns:
+            float: The number of units of the item over all locations.
+        """
+        return self.totals.get(uuid, 0)
+
+    def has_positions(self, uuid: int) -> bool:
+        """
+        Returns:
+            bool: True if the item has at least one position (even an empty one), False otherwise.
+        """
+        return bool(self.locations_by_uuid.get(uuid))
+
+    def locations(self, uuid: int) -> list:
+        """
+        Returns:
+            list: The locations holding a position of the item, in the order they were added.
+        """
+        return list(self.locations_by_uuid.get(uuid, ()))
+
+    def positions(self, uuid: int) -> list:
+        """
+        Returns:
+            list: (location, uuid, quantity) tuples of the item, in the order they were added.
+        """
+        return [(location, uuid, self.quantities[(location, uuid)])
+                for location in self.locations_by_uuid.get(uuid, ())]
+
+    def items_at(self, location: int) -> list:
+        """
+        Returns:
+            list: (location, uuid, quantity) tuples of the items held in the location, in the order they were added.
+        """
+        return [(location, uuid, self.quantities[(location, uuid)])
+                for uuid in self.uuids_by_location.get(location, ())]
+
+    def discard_empty(self, location: int) -> None:
+        """
+        Removes every position in the location whose quantity is 0.
+
+        Args:
+            location (int): The location id.
+        """
+        for uuid in list(self.uuids_by_location.get(location, ())):
+            if self.quantities[(location, uuid)] == 0:
+                del self.quantities[(location, uuid)]
+                del self.locations_by_uuid[uuid][location]
+                del self.uuids_by_location[location][uuid]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Exports the ledger in the WAREHOUSE_POSITIONS format.
+
+        Returns:
+            pd.DataFrame: DataFrame with 'location', 'uuid' and 'quantity' columns.
+        """
+        df = pd.DataFrame([(location, uuid, quantity) for (location, uuid), quantity in self.quantities.items()],
+                          columns=['location', 'uuid', 'quantity'])
+        # ids may be stored as floats when they are read from mixed-type rows
+        df = df.astype({'location': int, 'uuid': int})
+        return df
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+
+def dense_array(index: pd.Series, values: pd.Series, size: int, fill=np.nan, dtype=float) -> np.ndarray:
+    """
+    Create an array where values[i] is stored at position index[i].
+
+    Args:
+        index (pd.Series): The integer ids used as positions in the array.
+        values (pd.Series): The values to store.
+        size (int): The size of the array.
+        fill (optional): The value of positions without an id. Defaults to np.nan.
+        dtype (optional): The dtype of the array. Defaults to float.
+
+    Returns:
+        np.ndarray: The dense array.
+    """
+    array = np.full(size, fill, dtype=dtype)
+    array[index.to_numpy(dtype=int)] = values.to_numpy(dtype=dtype)
+    return array
+
+
+class ItemLookup:
+    """
+    Represents the item attributes as NumPy arrays indexed directly by the item id.
+    """
+
+    def __init__(self, items: pd.DataFrame) -> None:
+        """
+        Initializes a new instance of the ItemLookup class.
+
+        Args:
+            items (pd.DataFrame): The items data, as returned by import_items_data.
+        """
+        size = int(items['uuid'].max()) + 1
+        index = items['uuid']
+        self.volume = dense_array(index, items['item_volume'], size)
+        self.putaway_zone = dense_array(index, items['putaway_zone'], size, fill=-1, dtype=int)
+        self.attractiveness = dense_array(index, items['item_attractiveness'], size)
+        self.initial_stock = dense_array(index, items['initial_stock'], size, fill=0)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the ItemLookup object.
+        """
+        return (f"ItemLookup(size={len(self.volume)})")
+
+
+class CellLookup:
+    """
+    Represents the cell attributes as NumPy arrays indexed directly by the location id.
+    The coordinates of the cells are in WarehouseGeometry.
+    `available_volume` is the initial free volume of each cell, every simulation updates its own copy.
+    """
+
+    def __init__(self, cells: pd.DataFrame) -> None:
+        """
+        Initializes a new instance of the CellLookup class.
+
+        Args:
+            cells (pd.DataFrame): The cells data, as returned by import_warehouse_data.
+        """
+        size = int(cells['location'].max()) + 1
+        index = cells['location']
+        self.aisle = dense_array(index, cells['aisle'], size, fill=-1, dtype=int)
+        self.attractiveness = dense_array(index, cells['cell_attractiveness'], size)
+        self.fetch_tool = dense_array(index, cells['fetch_tool'], size, fill=-1, dtype=int)
+        self.putaway_zone = dense_array(index, cells['putaway_zone'], size, fill=-1, dtype=int)
+        self.cell_volume = dense_array(index, cells['cell_volume'], size)
+        self.available_volume = dense_array(index, cells['available_volume'], size, fill=-np.inf)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the CellLookup object.
+        """
+        return (f"CellLookup(size={len(self.aisle)})")
+
+
+class ToolLookup:
+    """
+    Represents the tool type attributes as NumPy arrays indexed directly by the tool type id.
+    Tool types without a row in the data (the cross dock) get 0, like the cross dock tool in setting_sim.
+    """
+
+    def __init__(self, times: pd.DataFrame, capacities: pd.DataFrame) -> None:
+        """
+        Initializes a new instance of the ToolLookup class.
+
+        Args:
+            times (pd.DataFrame): The tools speeds data, as returned by import_tools_data.
+            capacities (pd.DataFrame): The tools capacity data, as returned by import_tool_capacity_data.
+        """
+        size = int(max(times['fetch_tool'].max(), capacities['fetch_tool'].max())) + 1
+        index = times['fetch_tool']
+        self.horizontal_speed_mean = dense_array(index, times['horizontal_speed_mean'], size, fill=0)
+        self.horizontal_speed_std = dense_array(index, times['horizontal_speed_std'], size, fill=0)
+        self.vertical_speed_mean = dense_array(index, times['vertical_speed_mean'], size, fill=0)
+        self.vertical_speed_std = dense_array(index, times['vertical_speed_std'], size, fill=0)
+        self.remove_from_shelf_time_mean = dense_array(index, times['remove_from_shelf_time_mean'], size, fill=0)
+        self.remove_from_shelf_time_std = dense_array(index, times['remove_from_shelf_time_std'], size, fill=0)
+        self.capacity = dense_array(capacities['fetch_tool'], capacities['max_volume'], size, fill=np.inf)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the ToolLookup object.
+        """
+        return (f"ToolLookup(size={len(self.capacity)})")
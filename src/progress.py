@@ -0,0 +1,127 @@
+import sys
+import time
+import numpy as np
+from datetime import datetime, timedelta
+
+
+class ProgressReporter:
+    """
+    Prints the progress of the simulation to the console.
+    The number of orders which arrived so far is kept with a cursor moving forward over the
+    sorted order timestamps, so every report costs O(1) amortized.
+    """
+
+    def __init__(self, order_timestamps, wall_interval: float = None, sim_interval: timedelta = None,
+                 quiet: bool = False, stream=None) -> None:
+        """
+        Initializes a new instance of the ProgressReporter class.
+
+        Args:
+            order_timestamps: The arrival timestamps of the orders.
+            wall_interval (float, optional): Minimal number of real seconds between two reports. Defaults to None.
+            sim_interval (timedelta, optional): Minimal simulation time between two reports. Defaults to None.
+                                                If both intervals are None every event is reported.
+            quiet (bool, optional): If True nothing is printed. Defaults to False.
+            stream (optional): The stream to print to. Defaults to sys.stdout.
+        """
+        self.timestamps = np.sort(np.asarray(order_timestamps, dtype='datetime64[ns]'))
+        self.wall_interval = wall_interval
+        self.sim_interval = sim_interval
+        self.quiet = quiet
+        self.stream = stream
+        self.cursor = 0  # Number of orders with a timestamp <= the last reported time
+        self.day_start = 0  # Index of the first order of the last reported date
+        self.current_date = None  # The last reported date
+        self.last_wall_time = None  # Real time of the last report
+        self.last_sim_time = None  # Simulation time of the last report
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the ProgressReporter object.
+        """
+        return (f"ProgressReporter(orders={len(self.timestamps)}, cursor={self.cursor}, quiet={self.quiet})")
+
+    def due(self, t_now: datetime) -> bool:
+        """
+        Check if a report should be printed at the current time.
+
+        Args:
+            t_now (datetime): The current time.
+
+        Returns:
+            bool: True if a report should be printed, False otherwise.
+        """
+        if self.quiet:
+            return False
+        if self.wall_interval is None and self.sim_interval is None:  # Report every event
+            return True
+        if self.last_wall_time is None:  # First report
+            return True
+        if self.wall_interval is not None and time.monotonic() - self.last_wall_time >= self.wall_interval:
+            return True
+        if self.sim_interval is not None and t_now - self.last_sim_time >= self.sim_interval:
+            return True
+        return False
+
+    def orders_so_far(self, t_now: datetime) -> tuple:
+        """
+        Count the orders which arrived until the current time.
+
+        Args:
+            t_now (datetime): The current time, not earlier than the previous call.
+
+        Returns:
+            tuple: (orders so far, orders so far on the current date).
+        """
+        now = np.datetime64(t_now, 'ns')
+        # Move the cursor forward over the orders which arrived since the last call
+        while self.cursor < len(self.timestamps) and self.timestamps[self.cursor] <= now:
+            self.cursor += 1
+        if t_now.date() != self.current_date:  # Find the first order of the new date
+            self.current_date = t_now.date()
+            self.day_start = int(np.searchsorted(
+                self.timestamps, np.datetime64(self.current_date, 'ns'), side='left'))
+        return self.cursor, self.cursor - self.day_start
+
+    def message(self, *values) -> None:
+        """
+        Print a message about the run, like the steps of its setup.
+
+        Args:
+            *values: The values to print, like the arguments of print.
+        """
+        if not self.quiet:
+            print(*values, file=self.stream or sys.stdout)
+
+    def report(self, t_now: datetime, event_name: str, orders_on_time_today: int, orders_on_time: int,
+               impossible_orders: int, return_orders: int, fetching_task_queue_len: int, fetching_queue_len: int) -> None:
+        """
+        Print a progress line.
+
+        Args:
+            t_now (datetime): The current time.
+            event_name (str): The name of the current event type.
+            orders_on_time_today (int): The number of orders completed on time today.
+            orders_on_time (int): The number of orders completed on time.
+            impossible_orders (int): The number of impossible orders.
+            return_orders (int): The number of times an order was put to wait for a delivery.
+            fetching_task_queue_len (int): The number of items in the fetch tasks in progress.
+            fetching_queue_len (int): The number of items in the fetching queue.
+        """
+        orders_so_far_count, orders_on_this_date_so_far = self.orders_so_far(t_now)
+        self.last_wall_time = time.monotonic()
+        self.last_sim_time = t_now
+        print(
+            t_now,
+            f"{event_name:<25}",
+            "Today:", f"{orders_on_time_today:<6}/{orders_on_this_date_so_far:<6}",
+            "Orders:", f"{orders_so_far_count-impossible_orders:<6} ({orders_so_far_count:<6})",
+            "OT:", f"{orders_on_time:<6}",
+            "SR:", f"{round(orders_on_time/max(orders_so_far_count-impossible_orders,1), 2):<6}",
+            "FTQ:", f"{fetching_task_queue_len:<6}",
+            "FQ:", f"{fetching_queue_len:<6}",
+            "R:", f"{return_orders:<6}",
+            "IM:", f"{impossible_orders}",
+            file=self.stream or sys.stdout
+        )
@@ -0,0 +1,230 @@
+import os
+import glob
+import shutil
+import numpy as np
+import pandas as pd
+
+try:  # Parquet output is optional
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+RECORDING_LEVELS = ('off', 'sampled', 'full')
+
+
+class EventRecorder:
+    """
+    Records rows into preallocated typed column arrays and spills them to disk in chunks,
+    so the memory used by a run is bounded by the chunk size.
+
+    Columns with the 'Int64' dtype are stored as int64 with -1 for missing values,
+    and columns with categories are stored as integer codes.
+    """
+
+    def __init__(self, path: str, columns: dict, level: str = 'full', sample_every: int = 100,
+                 chunk_size: int = 100_000, file_format: str = 'csv', categories: dict = None,
+                 partition_by: str = 't_now') -> None:
+        """
+        Initializes a new instance of the EventRecorder class.
+
+        Args:
+            path (str): The output path without extension. CSV chunks are appended to '<path>.csv',
+                        Parquet chunks are written to '<path>/date=<YYYY-MM-DD>/part-<n>.parquet'.
+                        The output of a previous run at the path is replaced when the recorder first writes,
+                        a recorder which is off never touches it.
+            columns (dict): The column names and their dtypes, in order.
+            level (str, optional): 'off' records nothing, 'sampled' records every sample_every-th row,
+                                   'full' records every row. Defaults to 'full'.
+            sample_every (int, optional): The sampling interval of the 'sampled' level. Defaults to 100.
+            chunk_size (int, optional): The number of rows kept in memory before a flush. Defaults to 100_000.
+            file_format (str, optional): 'csv' or 'parquet'. Defaults to 'csv'.
+            categories (dict, optional): Labels of the coded columns, column -> {code: label}. Defaults to None.
+            partition_by (str, optional): The datetime column used to partition the Parquet chunks. Defaults to 't_now'.
+
+        Raises:
+            ValueError: If the level or the file format is not supported.
+            ImportError: If the file format is 'parquet' and pyarrow is not installed.
+        """
+        if level not in RECORDING_LEVELS:
+            raise ValueError(f"level must be one of {RECORDING_LEVELS}.")
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError("file_format must be 'csv' or 'parquet'.")
+        if file_format == 'parquet' and pyarrow is None:
+            raise ImportError("pyarrow is required for the 'parquet' file format.")
+
+        self.path = path
+        self.columns = columns
+        self.level = level
+        self.sample_every = sample_every
+        self.chunk_size = chunk_size
+        self.file_format = file_format
+        self.categories = categories or {}
+        self.partition_by = partition_by
+        self.arrays = [np.empty(chunk_size, dtype=np.int64 if dtype == 'Int64' else dtype)
+                       for dtype in columns.values()]
+        self.rows_in_chunk = 0  # Number of rows in the arrays
+        self.rows_seen = 0  # Number of rows passed to record, including the ones which were not sampled
+        self.rows_written = 0  # Number of rows flushed to disk
+        self.chunks_written = 0  # Number of flushes
+        self.bytes_written = 0  # Size of the CSV file after the last flush
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of recorded rows.
+        """
+        return self.rows_written + self.rows_in_chunk
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the EventRecorder object.
+        """
+        return (f"EventRecorder(path={self.path}, level={self.level}, rows={len(self)})")
+
+    def __getstate__(self) -> dict:
+        """
+        Returns:
+            dict: The state of the recorder for a checkpoint, with only the filled part of the arrays.
+        """
+        state = self.__dict__.copy()
+        state['arrays'] = [array[:self.rows_in_chunk].copy() for array in self.arrays]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the state saved by __getstate__, with the arrays allocated again.
+
+        Args:
+            state (dict): The saved state.
+        """
+        self.__dict__.update(state)
+        self.arrays = []
+        for rows in state['arrays']:
+            array = np.empty(self.chunk_size, dtype=rows.dtype)
+            array[:len(rows)] = rows
+            self.arrays.append(array)
+
+    def remove_output(self, path: str) -> None:
+        """
+        Removes the output of the file format at a path, like the rows of a previous run.
+
+        Args:
+            path (str): The output path without extension.
+        """
+        if self.file_format == 'csv':
+            if os.path.exists(f'{path}.csv'):
+                os.remove(f'{path}.csv')
+        elif os.path.isdir(path):
+            shutil.rmtree(path)
+
+    def rewind(self) -> None:
+        """
+        Removes from disk the rows flushed after the state of the recorder was saved,
+        when a run resumes from a checkpoint.
+        """
+        if self.file_format == 'csv':
+            if os.path.exists(f'{self.path}.csv'):
+                if self.chunks_written == 0:  # The file is started again by the next flush
+                    os.remove(f'{self.path}.csv')
+                else:
+                    with open(f'{self.path}.csv', 'r+b') as file:
+                        file.truncate(self.bytes_written)
+        else:
+            for part_path in glob.glob(f'{self.path}/date=*/part-*.parquet'):
+                if int(os.path.basename(part_path)[len('part-'):-len('.parquet')]) >= self.chunks_written:
+                    os.remove(part_path)
+
+    def branch(self, path: str) -> None:
+        """
+        Continues the recording at another path, from a copy of the rows flushed so far.
+
+        Args:
+            path (str): The new output path without extension.
+        """
+        if path == self.path:
+            return
+        if self.level != 'off':
+            self.remove_output(path)  # The output of a previous run of the branch
+        if self.file_format == 'csv':
+            if self.chunks_written > 0 and os.path.exists(f'{self.path}.csv'):
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                shutil.copyfile(f'{self.path}.csv', f'{path}.csv')
+                os.truncate(f'{path}.csv', self.bytes_written)  # Without the rows flushed after this state
+        else:
+            for part_path in glob.glob(f'{self.path}/date=*/part-*.parquet'):
+                if int(os.path.basename(part_path)[len('part-'):-len('.parquet')]) < self.chunks_written:
+                    partition_path = f'{path}/{os.path.basename(os.path.dirname(part_path))}'
+                    os.makedirs(partition_path, exist_ok=True)
+                    shutil.copyfile(part_path, f'{partition_path}/{os.path.basename(part_path)}')
+        self.path = path
+
+    def record(self, *values) -> None:
+        """
+        Records a row.
+
+        Args:
+            *values: The values of the row, in the order of the columns.
+        """
+        if self.level == 'off':
+            return
+        self.rows_seen += 1
+        if self.level == 'sampled' and (self.rows_seen - 1) % self.sample_every != 0:
+            return
+        row = self.rows_in_chunk
+        for array, value in zip(self.arrays, values):
+            array[row] = value
+        self.rows_in_chunk += 1
+        if self.rows_in_chunk == self.chunk_size:
+            self.flush()
+
+    def chunk_to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The rows which were not flushed yet.
+        """
+        df = pd.DataFrame({name: array[:self.rows_in_chunk].copy()
+                           for name, array in zip(self.columns, self.arrays)})
+        for name, dtype in self.columns.items():
+            if name in self.categories:  # Replace the codes with their labels
+                df[name] = df[name].map(self.categories[name])
+            elif dtype == 'Int64':  # Replace -1 with missing values
+                df[name] = df[name].astype('Int64').mask(df[name] == -1)
+        return df
+
+    def flush(self) -> None:
+        """
+        Writes the rows in memory to disk and empties the arrays.
+        """
+        if self.rows_in_chunk == 0:
+            return
+        df = self.chunk_to_dataframe()
+        if self.file_format == 'csv':
+            if self.chunks_written == 0:  # Start a new file with a header
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                df.to_csv(f'{self.path}.csv', index=False)
+            else:
+                df.to_csv(f'{self.path}.csv', index=False, header=False, mode='a')
+            self.bytes_written = os.path.getsize(f'{self.path}.csv')
+        else:
+            if self.chunks_written == 0:  # Remove the chunks of a previous run
+                self.remove_output(self.path)
+            for date, partition in df.groupby(df[self.partition_by].dt.date):
+                partition_path = f'{self.path}/date={date}'
+                os.makedirs(partition_path, exist_ok=True)
+                partition.to_parquet(f'{partition_path}/part-{self.chunks_written:05d}.parquet', index=False)
+        self.rows_written += self.rows_in_chunk
+        self.chunks_written += 1
+        self.rows_in_chunk = 0
+
+    def close(self) -> None:
+        """
+        Flushes the remaining rows. If no rows were recorded, the output of a previous run is removed
+        and a CSV file with only a header is written.
+        """
+        if self.level != 'off' and len(self) == 0:
+            self.remove_output(self.path)
+            if self.file_format == 'csv':
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self.chunk_to_dataframe().to_csv(f'{self.path}.csv', index=False)
+        self.flush()
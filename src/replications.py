@@ -0,0 +1,199 @@
+import os
+import math
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from statistics import NormalDist
+from globals import *
+from engine import Simulation
+from batch import PLACEMENTS, start_pool, worker_inputs
+
+try:  # The t distribution gives exact intervals for few replications, without scipy the normal one is used
+    import scipy.stats
+except ImportError:
+    scipy = None
+
+# The measures.csv columns and the mean fetch task time in seconds, aggregated over the replications
+KPI_COLUMNS = ['ORDERS_ON_TIME', 'ORDERS_LATE', 'RETURN_ORDERS', 'WAITING_FOR_DELIVERY_len',
+               'FETCHING_QUEUE_DF', 'FETCHING_TASK_QUEUE_DF', 'IMPOSSIBLE_ORDERS', 'MEAN_FETCH_TASK_TIME']
+
+
+def run_replication(placement: str, replication: int, seed_sequence: np.random.SeedSequence) -> dict:
+    """
+    Run one replication of a placement, without writing results files.
+
+    Args:
+        placement (str): The placement of the warehouse, loaded in the worker inputs.
+        replication (int): The number of the replication.
+        seed_sequence (np.random.SeedSequence): The seed of the random numbers stream of the replication.
+
+    Returns:
+        dict: The measures of the replication and its mean fetch task time, with the placement and the replication number.
+    """
+    with tempfile.TemporaryDirectory() as results_path:  # Never the results directory of a real run
+        simulation = Simulation(worker_inputs(placement), results_path=results_path, events_recording_level='off',
+                                progress_quiet=True, fetch_tasks_recording_level='off',
+                                rng=np.random.default_rng(seed_sequence), checkpoint_every_days=None)
+        simulation.run()
+    measures = simulation.measures().iloc[0].to_dict()
+    measures['MEAN_FETCH_TASK_TIME'] = np.mean(simulation.fetch_task_times) if simulation.fetch_task_times else np.nan
+    return {'placement': placement, 'replication': replication, **measures}
+
+
+def t_quantile(confidence: float, degrees_of_freedom: int) -> float:
+    """
+    Returns:
+        float: The two-sided quantile of the t distribution, or of the normal distribution without scipy.
+    """
+    if scipy is not None:
+        return scipy.stats.t.ppf((1 + confidence) / 2, degrees_of_freedom)
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def confidence_intervals(replications: pd.DataFrame, confidence: float = 0.95) -> pd.DataFrame:
+    """
+    Aggregate the KPIs of the replications of every placement.
+
+    Args:
+        replications (pd.DataFrame): The measures of the replications, as returned by run_replication.
+        confidence (float, optional): The confidence level of the intervals. Defaults to 0.95.
+
+    Returns:
+        pd.DataFrame: One row per placement and KPI, with the number of replications, the mean, the standard
+                      deviation, the half width and the bounds of the confidence interval.
+    """
+    rows = []
+    for placement, placement_replications in replications.groupby('placement', sort=False):
+        n = len(placement_replications)
+        quantile = t_quantile(confidence, n - 1) if n > 1 else np.nan
+        for kpi in KPI_COLUMNS:
+            values = placement_replications[kpi].astype(float)
+            mean = values.mean()
+            std = values.std(ddof=1) if n > 1 else np.nan
+            half_width = quantile * std / math.sqrt(n)
+            rows.append({'placement': placement, 'kpi': kpi, 'n': n, 'mean': mean, 'std': std,
+                         'half_width': half_width, 'ci_low': mean - half_width, 'ci_high': mean + half_width})
+    return pd.DataFrame(rows)
+
+
+def replications_needed(summary: pd.DataFrame, target_kpi: str, target_half_width: float,
+                        max_replications: int) -> dict:
+    """
+    Estimate the number of replications which bring the half width of a KPI to the target,
+    n * (half_width / target_half_width) ** 2 for every placement which did not reach it.
+    A placement without a half width (less than 2 replications or a missing KPI) gets one more replication.
+
+    Args:
+        summary (pd.DataFrame): The intervals, as returned by confidence_intervals.
+        target_kpi (str): The KPI of the stopping rule.
+        target_half_width (float): The half width to reach.
+        max_replications (int): The maximal number of replications of a placement.
+
+    Returns:
+        dict: placement -> number of replications to add, only for the placements which need more.
+    """
+    needed = {}
+    for row in summary[summary['kpi'] == target_kpi].itertuples():
+        if row.n >= max_replications:
+            continue
+        if np.isnan(row.half_width):  # Nothing to estimate from yet
+            needed[row.placement] = 1
+            continue
+        if row.half_width <= target_half_width:
+            continue
+        estimate = math.ceil(row.n * (row.half_width / target_half_width) ** 2)
+        needed[row.placement] = max(1, min(estimate, max_replications) - row.n)
+    return needed
+
+
+def run_replications(placements: list = PLACEMENTS, replications: int = 10, workers: int = None,
+                     max_date: datetime or None = MAX_DATETIME, use_cache: bool = USE_DATA_CACHE,
+                     seed: int = None, confidence: float = 0.95, target_half_width: float = None,
+                     target_kpi: str = 'MEAN_FETCH_TASK_TIME', max_replications: int = 100) -> tuple:
+    """
+    Run seeded replications of many placements in parallel processes. The replication k of every placement
+    uses the same stream spawned from the seed, so the placements are compared with common random numbers.
+
+    Args:
+        placements (list, optional): The placements to run. Defaults to PLACEMENTS.
+        replications (int, optional): The number of replications of every placement. Defaults to 10.
+        workers (int, optional): The number of processes, None for the number of cores. Defaults to None.
+        max_date (datetime or None, optional): The end of the simulation, None for the full simulation. Defaults to MAX_DATETIME.
+        use_cache (bool, optional): If True the tables are read through the Parquet cache. Defaults to USE_DATA_CACHE.
+        seed (int, optional): The root seed of the replications streams, None draws fresh entropy. Defaults to None.
+        confidence (float, optional): The confidence level of the intervals. Defaults to 0.95.
+        target_half_width (float, optional): If set, replications are added until the half width of target_kpi
+                                             reaches it for every placement. Defaults to None.
+        target_kpi (str, optional): The KPI of the stopping rule. Defaults to 'MEAN_FETCH_TASK_TIME'.
+        max_replications (int, optional): The maximal number of replications of a placement. Defaults to 100.
+
+    Returns:
+        tuple: The measures of every replication, the confidence intervals as returned by
+               confidence_intervals, and the root seed.
+
+    Raises:
+        ValueError: If target_kpi is not one of KPI_COLUMNS.
+    """
+    if target_kpi not in KPI_COLUMNS:
+        raise ValueError(f"target_kpi must be one of {KPI_COLUMNS}.")
+    root_seed = np.random.SeedSequence(seed)
+    seed_sequences = root_seed.spawn(replications)  # Stream k is shared by the replication k of all placements
+    counts = {placement: 0 for placement in placements}
+    pending = {placement: replications for placement in placements}
+    results = []
+    with start_pool(placements, workers or os.cpu_count() or 1, max_date, use_cache) as pool:
+        while pending:
+            tasks = [(placement, replication) for placement, number in pending.items()
+                     for replication in range(counts[placement], counts[placement] + number)]
+            # Spawn the streams of the new replication numbers
+            last_replication = max(replication for _, replication in tasks)
+            if last_replication >= len(seed_sequences):
+                seed_sequences += root_seed.spawn(last_replication + 1 - len(seed_sequences))
+            futures = [pool.submit(run_replication, placement, replication, seed_sequences[replication])
+                       for placement, replication in tasks]
+            results += [future.result() for future in futures]
+            for placement, number in pending.items():
+                counts[placement] += number
+            summary = confidence_intervals(pd.DataFrame(results), confidence)
+            if target_half_width is None:
+                break
+            pending = replications_needed(summary, target_kpi, target_half_width, max_replications)
+    # Sort by placement, in the order of placements, then by replication
+    replications_df = pd.DataFrame(results)
+    placement_order = replications_df['placement'].map({placement: index for index, placement in enumerate(placements)})
+    replications_df = replications_df.iloc[np.lexsort((replications_df['replication'], placement_order))]
+    return replications_df.reset_index(drop=True), summary, root_seed.entropy
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run seeded replications of many placements in parallel.')
+    parser.add_argument('placements', nargs='*', default=PLACEMENTS,
+                        help='The placements to run, all the placements by default.')
+    parser.add_argument('--replications', type=int, default=10, help='The number of replications of every placement.')
+    parser.add_argument('--workers', type=int, default=None, help='The number of processes.')
+    parser.add_argument('--until', default=MAX_DATETIME, type=pd.Timestamp,
+                        help='The end of the simulation, MAX_DATETIME by default.')
+    parser.add_argument('--seed', type=int, default=None, help='The root seed of the replications.')
+    parser.add_argument('--confidence', type=float, default=0.95, help='The confidence level of the intervals.')
+    parser.add_argument('--target-half-width', type=float, default=None,
+                        help='Add replications until the half width of the target KPI reaches this value.')
+    parser.add_argument('--target-kpi', default='MEAN_FETCH_TASK_TIME', choices=KPI_COLUMNS, help='The KPI of the stopping rule.')
+    parser.add_argument('--max-replications', type=int, default=100, help='The maximal number of replications.')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    replications_df, summary, root_seed = run_replications(
+        args.placements, args.replications, args.workers, args.until, USE_DATA_CACHE, args.seed,
+        args.confidence, args.target_half_width, args.target_kpi, args.max_replications)
+    # Write the replications and the intervals of every placement next to its results
+    for placement in args.placements:
+        results_path = RESULTS_PATH.format(placement=placement)
+        os.makedirs(results_path, exist_ok=True)
+        replications_df[replications_df['placement'] == placement].assign(seed=root_seed).to_csv(
+            f'{results_path}/replications.csv', index=False)
+        summary[summary['placement'] == placement].to_csv(f'{results_path}/measures_ci.csv', index=False)
+    print(summary.to_string(index=False))
+    print(f"{len(replications_df)} replications with root seed {root_seed} took {time.perf_counter() - start:.1f} seconds")
@@ -0,0 +1,221 @@
+import numpy as np
+from geometry import WarehouseGeometry
+from lookups import ToolLookup
+
+ROUTING_POLICIES = ('return', 's_shape', 'largest_gap', 'optimal')  # The routing policies of PickRouter
+
+
+class PickRouter:
+    """
+    Represents the routing of the fetch tasks through the aisles. Aisles run along x between a front cross
+    aisle at x = 0, next to the I/O point, and a back cross aisle at geometry.back_x.
+    A route is given as the arrays (aisles, x, z) of its points: the cells of the task and the aisle ends
+    (x = 0 or back_x, z = 0) where the tool enters or leaves an aisle. Consecutive points in the same aisle
+    are a move inside the aisle, consecutive points in different aisles a move along a cross aisle.
+    The route starts and ends at the front of its first and last aisles.
+
+    Policies:
+        'return': Every aisle, in order of aisle id, is entered and left from the front.
+        's_shape': The aisles, in order of y, are traversed completely in alternating directions.
+                   With an odd number of aisles the last one is entered and left from the front.
+        'largest_gap': The first and last aisles, in order of y, are traversed completely. In every other
+                       aisle the largest gap between the cells and the aisle ends is not traversed: the
+                       cells behind it are fetched from the back and the others from the front.
+        'optimal': The shortest route by the mean speeds of the tool, by dynamic programming over the
+                   subsets of cells (Held-Karp). Tasks with more than optimal_max_cells cells use 'largest_gap'.
+    """
+
+    def __init__(self, geometry: WarehouseGeometry, tool_lookup: ToolLookup, policy: str = 'return',
+                 optimal_max_cells: int = 8) -> None:
+        """
+        Initializes a new instance of the PickRouter class.
+
+        Args:
+            geometry (WarehouseGeometry): The geometry of the placement.
+            tool_lookup (ToolLookup): The mean speeds of the tools, used by the 'optimal' policy.
+            policy (str, optional): One of ROUTING_POLICIES. Defaults to 'return'.
+            optimal_max_cells (int, optional): The largest task routed by the 'optimal' policy. Defaults to 8.
+
+        Raises:
+            ValueError: If the policy is not supported.
+        """
+        if policy not in ROUTING_POLICIES:
+            raise ValueError(f"policy must be one of {ROUTING_POLICIES}.")
+        self.geometry = geometry
+        self.tool_lookup = tool_lookup
+        self.policy = policy
+        self.optimal_max_cells = optimal_max_cells
+        self.route_policies = {'return': self.return_route, 's_shape': self.s_shape_route,
+                               'largest_gap': self.largest_gap_route, 'optimal': self.optimal_route}
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the PickRouter object.
+        """
+        return (f"PickRouter(policy={self.policy})")
+
+    def route(self, locations: np.ndarray, tool_type: int) -> tuple:
+        """
+        Route a fetch task. Several items in the same cell are fetched in one stop.
+
+        Args:
+            locations (np.ndarray): The locations of the items of the task.
+            tool_type (int): The tool type of the task.
+
+        Returns:
+            tuple: The aisles, x and z arrays of the route points.
+        """
+        return self.route_policies[self.policy](np.unique(locations), tool_type)
+
+    def aisle_cells(self, locations: np.ndarray, aisle_order: str) -> list:
+        """
+        Group the cells by aisle.
+
+        Args:
+            locations (np.ndarray): The locations of the cells, without repetitions.
+            aisle_order (str): 'id' or 'y', the order of the aisles.
+
+        Returns:
+            list: (aisle, x, z) for every aisle, the x and z arrays sorted by increasing x, then z.
+        """
+        aisles = self.geometry.cell_aisle[locations]
+        x = self.geometry.cell_x[locations]
+        z = self.geometry.cell_z[locations]
+        aisle_key = aisles if aisle_order == 'id' else self.geometry.aisle_y[aisles]
+        order = np.lexsort((z, x, aisles, aisle_key))
+        aisles, x, z = aisles[order], x[order], z[order]
+        starts = np.flatnonzero(np.r_[True, aisles[1:] != aisles[:-1]])
+        ends = np.r_[starts[1:], len(aisles)]
+        return [(aisles[start], x[start:end], z[start:end]) for start, end in zip(starts, ends)]
+
+    def segment(self, aisle: int, x: np.ndarray, z: np.ndarray, entry_x: float, exit_x: float) -> tuple:
+        """
+        Returns:
+            tuple: The aisles, x and z arrays of a visit of an aisle: its entry end, the cells in the
+                   given order and its exit end.
+        """
+        return (np.full(len(x) + 2, aisle), np.r_[entry_x, x, exit_x], np.r_[0, z, 0])
+
+    def join(self, segments: list) -> tuple:
+        """
+        Returns:
+            tuple: The aisles, x and z arrays of the segments one after the other.
+        """
+        aisles, x, z = zip(*segments)
+        return np.concatenate(aisles), np.concatenate(x), np.concatenate(z)
+
+    def return_route(self, locations: np.ndarray, tool_type: int) -> tuple:
+        """
+        Returns:
+            tuple: The route of the 'return' policy.
+        """
+        return self.join([self.segment(aisle, x, z, 0, 0) for aisle, x, z in self.aisle_cells(locations, 'id')])
+
+    def s_shape_route(self, locations: np.ndarray, tool_type: int) -> tuple:
+        """
+        Returns:
+            tuple: The route of the 's_shape' policy.
+        """
+        back_x = self.geometry.back_x
+        aisle_cells = self.aisle_cells(locations, 'y')
+        segments = []
+        for number, (aisle, x, z) in enumerate(aisle_cells):
+            if number == len(aisle_cells) - 1 and number % 2 == 0:  # The last of an odd number of aisles
+                segments.append(self.segment(aisle, x, z, 0, 0))
+            elif number % 2 == 0:  # From the front to the back
+                segments.append(self.segment(aisle, x, z, 0, back_x))
+            else:  # From the back to the front
+                segments.append(self.segment(aisle, x[::-1], z[::-1], back_x, 0))
+        return self.join(segments)
+
+    def largest_gap_route(self, locations: np.ndarray, tool_type: int) -> tuple:
+        """
+        Returns:
+            tuple: The route of the 'largest_gap' policy.
+        """
+        back_x = self.geometry.back_x
+        aisle_cells = self.aisle_cells(locations, 'y')
+        if len(aisle_cells) == 1:
+            return self.return_route(locations, tool_type)
+        first_aisle, first_x, first_z = aisle_cells[0]
+        last_aisle, last_x, last_z = aisle_cells[-1]
+        back_segments, front_segments = [], []
+        for aisle, x, z in aisle_cells[1:-1]:
+            # The cells before the largest gap between the front, the cells and the back are fetched from the front
+            gap = int(np.argmax(np.diff(np.r_[0, x, back_x])))
+            if gap > 0:
+                front_segments.append(self.segment(aisle, x[:gap], z[:gap], 0, 0))
+            if gap < len(x):
+                back_segments.append(self.segment(aisle, x[gap:][::-1], z[gap:][::-1], back_x, back_x))
+        # Along the back cross aisle to the last aisle, then back along the front cross aisle
+        return self.join([self.segment(first_aisle, first_x, first_z, 0, back_x)] + back_segments +
+                         [self.segment(last_aisle, last_x[::-1], last_z[::-1], back_x, 0)] + front_segments[::-1])
+
+    def optimal_route(self, locations: np.ndarray, tool_type: int) -> tuple:
+        """
+        Returns:
+            tuple: The route of the 'optimal' policy.
+        """
+        speed_x = self.tool_lookup.horizontal_speed_mean[tool_type]
+        speed_z = self.tool_lookup.vertical_speed_mean[tool_type]
+        if len(locations) > self.optimal_max_cells:
+            return self.largest_gap_route(locations, tool_type)
+        if not speed_x > 0 or len(locations) == 1:  # Nothing to optimize
+            return self.return_route(locations, tool_type)
+        back_x = self.geometry.back_x
+        aisles = self.geometry.cell_aisle[locations]
+        x = self.geometry.cell_x[locations]
+        z = self.geometry.cell_z[locations]
+
+        def move_time(dx, dz):  # The time of a move inside an aisle, without vertical speed only dx counts
+            with np.errstate(invalid='ignore'):
+                return np.fmax(np.abs(dx) / speed_x, np.abs(dz) / speed_z)
+
+        # Times between every two cells, through the front or the back cross aisle for different aisles
+        cross_time = self.geometry.aisle_distance[aisles[:, np.newaxis], aisles[np.newaxis, :]] / speed_x
+        to_front = move_time(x, z)
+        to_back = move_time(back_x - x, z)
+        through_front = to_front[:, np.newaxis] + cross_time + to_front[np.newaxis, :]
+        through_back = to_back[:, np.newaxis] + cross_time + to_back[np.newaxis, :]
+        same_aisle = aisles[:, np.newaxis] == aisles[np.newaxis, :]
+        times = np.where(same_aisle, move_time(x[:, np.newaxis] - x[np.newaxis, :], z[:, np.newaxis] - z[np.newaxis, :]),
+                         np.minimum(through_front, through_back))
+        from_io = self.geometry.aisle_io_distance[aisles] + to_front  # From the I/O point, and back to it
+
+        # Held-Karp: best[mask, j] is the shortest path from the I/O point through the cells of mask, ending at j
+        cells = len(locations)
+        cell_bits = 1 << np.arange(cells)
+        best = np.full((1 << cells, cells), np.inf)
+        previous = np.full((1 << cells, cells), -1, dtype=int)
+        best[cell_bits, np.arange(cells)] = from_io
+        for mask in range(1, 1 << cells):
+            outside = np.flatnonzero((mask & cell_bits) == 0)
+            if len(outside) == 0:
+                continue
+            candidates = best[mask][:, np.newaxis] + times[:, outside]
+            best_previous = np.argmin(candidates, axis=0)
+            new_best = candidates[best_previous, np.arange(len(outside))]
+            new_masks = mask | cell_bits[outside]
+            improved = new_best < best[new_masks, outside]
+            best[new_masks[improved], outside[improved]] = new_best[improved]
+            previous[new_masks[improved], outside[improved]] = best_previous[improved]
+        # Close the tour at the I/O point and walk back through the previous cells
+        mask = (1 << cells) - 1
+        cell = int(np.argmin(best[mask] + from_io))
+        order = []
+        while cell != -1:
+            order.append(cell)
+            mask, cell = mask & ~(1 << cell), previous[mask, cell]
+        order.reverse()
+
+        # Add the aisle ends where the route changes aisles
+        segments = [(aisles[order[:1]], np.zeros(1), np.zeros(1))]
+        for cell, next_cell in zip(order, order[1:] + [None]):
+            segments.append((aisles[[cell]], x[[cell]], z[[cell]]))
+            if next_cell is None or aisles[cell] == aisles[next_cell]:
+                continue
+            end_x = 0 if through_front[cell, next_cell] <= through_back[cell, next_cell] else back_x
+            segments.append((aisles[[cell, next_cell]], np.full(2, end_x, dtype=float), np.zeros(2)))
+        segments.append((aisles[order[-1:]], np.zeros(1), np.zeros(1)))
+        return self.join(segments)
@@ -0,0 +1,84 @@
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from globals import *
+from engine import SimulationInputs, Simulation
+from routing import ROUTING_POLICIES
+from classes import ToolType
+
+# Benchmark of the routing policies: routes random fetch tasks and measures the cost of a route
+# and the mean travel time of a task, for one day of tasks
+
+
+def random_tasks(inputs: SimulationInputs, tasks: int, max_cells: int, seed: int) -> list:
+    """
+    Draw random fetch tasks, every task with the cells of a single tool type.
+
+    Args:
+        inputs (SimulationInputs): The inputs of the placement.
+        tasks (int): The number of tasks.
+        max_cells (int): The largest number of cells of a task.
+        seed (int): The seed of the tasks.
+
+    Returns:
+        list: (tool type, locations) for every task.
+    """
+    rng = np.random.default_rng(seed)
+    fetch_tool = inputs.cell_lookup.fetch_tool
+    tool_cells = {tool_type: np.flatnonzero(fetch_tool == tool_type)
+                  for tool_type in (ToolType.REACH_FORK.value, ToolType.PALLET_JACK.value, ToolType.ORDER_PICKER.value)}
+    tool_types = rng.choice(list(tool_cells), size=tasks)
+    return [(int(tool_type), rng.choice(tool_cells[tool_type], size=rng.integers(1, max_cells + 1)))
+            for tool_type in tool_types]
+
+
+def benchmark(inputs: SimulationInputs, tasks: list, policies: list = ROUTING_POLICIES, seed: int = 0) -> pd.DataFrame:
+    """
+    Route the tasks with every policy and calculate their travel times.
+
+    Args:
+        inputs (SimulationInputs): The inputs of the placement.
+        tasks (list): The tasks, as returned by random_tasks.
+        policies (list, optional): The routing policies. Defaults to ROUTING_POLICIES.
+        seed (int, optional): The seed of the speeds. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: For every policy, the microseconds per route, per route with its travel time,
+                      and the mean travel time of a task in seconds.
+    """
+    rows = []
+    for policy in policies:
+        with tempfile.TemporaryDirectory() as results_path:  # Never the results directory of a real run
+            simulation = Simulation(inputs, results_path=results_path, events_recording_level='off',
+                                    fetch_tasks_recording_level='off', progress_quiet=True,
+                                    rng=np.random.default_rng(seed), routing_policy=policy, checkpoint_every_days=None)
+        tools = {tool.type: tool for tool in simulation.tools}
+        start = time.perf_counter()
+        routes = [simulation.router.route(locations, tool_type) for tool_type, locations in tasks]
+        route_seconds = time.perf_counter() - start
+        travel_times = [simulation.calculate_route_time(*route, tools[tool_type])
+                        for route, (tool_type, _) in zip(routes, tasks)]
+        total_seconds = time.perf_counter() - start
+        rows.append({'policy': policy,
+                     'route_us': round(route_seconds / len(tasks) * 1e6, 1),
+                     'route_and_time_us': round(total_seconds / len(tasks) * 1e6, 1),
+                     'mean_travel_time': round(float(np.mean(travel_times)), 2)})
+    return pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the routing policies of the fetch tasks.')
+    parser.add_argument('--placement', default=PLACEMENT, help='The placement of the warehouse.')
+    parser.add_argument('--tasks', type=int, default=10_000, help='The number of tasks, one day by default.')
+    parser.add_argument('--max-cells', type=int, default=8, help='The largest number of cells of a task.')
+    parser.add_argument('--seed', type=int, default=0, help='The seed of the tasks and the speeds.')
+    args = parser.parse_args()
+
+    inputs = SimulationInputs.load(args.placement, MAX_DATETIME, USE_DATA_CACHE)
+    tasks = random_tasks(inputs, args.tasks, args.max_cells, args.seed)
+    results = benchmark(inputs, tasks, seed=args.seed)
+    results['seconds_per_day'] = (results['route_and_time_us'] * args.tasks / 1e6).round(2)
+    print(f"{args.tasks} tasks of 1 to {args.max_cells} cells in {args.placement}")
+    print(results.to_string(index=False))
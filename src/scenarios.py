@@ -0,0 +1,259 @@
+import os
+import gc
+import copy
+import time
+import argparse
+import multiprocessing
+import multiprocessing.connection
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from globals import *
+from classes import Employee, ToolType
+from capacity import FreeCapacityIndex
+from engine import SimulationInputs, Simulation
+
+
+class Scenario:
+    """
+    Represents a what-if branch of a run: changes to the employees, the tools and the cells,
+    applied to a snapshot of the run before the branch continues from it.
+    Employees and tools which are removed are retired: they finish the task in progress at the snapshot and
+    get no new tasks, and a retired employee releases its tool. Added employees start taking tasks at the snapshot.
+    """
+
+    def __init__(self, name: str, add_employees: list = (), remove_employees: list = (), add_tools: list = (),
+                 remove_tools: list = (), cell_volumes: dict = None, cell_attractiveness: dict = None) -> None:
+        """
+        Initializes a new instance of the Scenario class.
+
+        Args:
+            name (str): The name of the scenario, also the name of its results directory.
+            add_employees (list, optional): The tool types of every added employee. Defaults to ().
+            remove_employees (list, optional): The ids of the removed employees. Defaults to ().
+            add_tools (list, optional): The tool type of every added tool, a copy of the first tool of the type. Defaults to ().
+            remove_tools (list, optional): The ids of the removed tools. Defaults to ().
+            cell_volumes (dict, optional): Free volume added to cells, negative for a volume taken,
+                                           location -> volume. Defaults to None.
+            cell_attractiveness (dict, optional): New attractiveness of cells, location -> attractiveness. Defaults to None.
+        """
+        self.name = name
+        self.add_employees = [list(tools) for tools in add_employees]
+        self.remove_employees = list(remove_employees)
+        self.add_tools = list(add_tools)
+        self.remove_tools = list(remove_tools)
+        self.cell_volumes = cell_volumes or {}
+        self.cell_attractiveness = cell_attractiveness or {}
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the Scenario object.
+        """
+        return (f"Scenario(name={self.name}, add_employees={self.add_employees}, "
+                f"remove_employees={self.remove_employees}, add_tools={self.add_tools}, "
+                f"remove_tools={self.remove_tools}, cells={len(self.cell_volumes) + len(self.cell_attractiveness)})")
+
+    def apply(self, simulation: Simulation) -> None:
+        """
+        Apply the changes of the scenario to a run.
+
+        Args:
+            simulation (Simulation): The run, modified in place.
+
+        Raises:
+            ValueError: If a tool type has no tool to copy or a location is not a cell.
+        """
+        # New ids follow all the ids of the run, so the removed ones are never reused
+        next_employee_id = max(employee.employee_id for employee in simulation.employees) + 1
+        next_tool_id = max(tool.tool_id for tool in simulation.tools) + 1
+        tool_templates = {}  # tool type -> its first tool, before the removals
+        for tool in simulation.tools:
+            tool_templates.setdefault(tool.type, tool)
+
+        simulation.employees = [employee for employee in simulation.employees
+                                if employee.employee_id not in self.remove_employees]
+        simulation.tools = [tool for tool in simulation.tools if tool.tool_id not in self.remove_tools]
+        added_employees = [Employee(employee_id=employee_id, tools=tools)
+                           for employee_id, tools in enumerate(self.add_employees, start=next_employee_id)]
+        simulation.employees.extend(added_employees)
+        for tool_id, tool_type in enumerate(self.add_tools, start=next_tool_id):
+            if tool_type not in tool_templates:
+                raise ValueError(f"there is no tool of type {tool_type} to copy.")
+            tool = copy.copy(tool_templates[tool_type])
+            tool.tool_id = tool_id
+            tool.left_capacity = tool.capacity
+            tool.status = 0  # The tool is available
+            simulation.tools.append(tool)
+        for employee in added_employees:  # The added employees start at the snapshot, not at their first event
+            tool = simulation.prioritize_tools_for_queues(employee)
+            if tool:
+                simulation.creation_fetching(simulation.t_now, employee, tool)
+
+        locations = list(self.cell_volumes) + list(self.cell_attractiveness)
+        if any(not np.isfinite(simulation.cell_lookup.available_volume[location]) for location in locations):
+            raise ValueError("the cells of a scenario must be locations of cells, not the sort area.")
+        for location, volume in self.cell_volumes.items():
+            simulation.capacity.change_volume(location, volume)
+        if self.cell_attractiveness:
+            # The branch gets its own cell lookup, the lookup of the inputs is shared with the other branches
+            cell_lookup = copy.copy(simulation.cell_lookup)
+            cell_lookup.attractiveness = cell_lookup.attractiveness.copy()
+            for location, attractiveness in self.cell_attractiveness.items():
+                cell_lookup.attractiveness[location] = attractiveness
+            simulation.cell_lookup = cell_lookup
+            simulation.capacity = FreeCapacityIndex(cell_lookup, simulation.available_volume,
+                                                    [simulation.sort_area_location])
+
+
+# Examples of scenarios, run by name from the command line
+SCENARIOS = [
+    Scenario('baseline'),
+    Scenario('extra_reach_fork', add_employees=[[ToolType.REACH_FORK.value]], add_tools=[ToolType.REACH_FORK.value]),
+    Scenario('one_pallet_jack_less', remove_employees=[3], remove_tools=[3]),
+]
+
+
+def warm_up(inputs: SimulationInputs, fork_time: datetime, results_path: str = None, **options) -> Simulation:
+    """
+    Run the shared prefix of the scenarios: from the start of the simulation to the first event at fork_time or later.
+
+    Args:
+        inputs (SimulationInputs): The loaded data.
+        fork_time (datetime): The time of the snapshot, a date forks at the start of its first working hours.
+        results_path (str, optional): The results directory of the warm-up.
+                                      Defaults to '<RESULTS_PATH>/scenarios/warm_up'.
+        **options: The other arguments of Simulation.
+
+    Returns:
+        Simulation: The run, before its first event at fork_time or later.
+    """
+    results_path = results_path or f'{RESULTS_PATH.format(placement=inputs.placement)}/scenarios/warm_up'
+    simulation = Simulation(inputs, results_path=results_path, **options)
+    while simulation.t_now is not None and simulation.t_now < fork_time:
+        if not simulation.step():
+            break
+    return simulation
+
+
+def run_branch(simulation: Simulation, scenario: Scenario, results_path: str) -> None:
+    """
+    Apply a scenario to a run, continue it to the end and write its results.
+
+    Args:
+        simulation (Simulation): The run, modified in place.
+        scenario (Scenario): The scenario.
+        results_path (str): The directory of the results directories of the scenarios.
+    """
+    scenario.apply(simulation)
+    simulation.branch(f'{results_path}/{scenario.name}')
+    simulation.run()
+    simulation.write_results()
+
+
+def _run_forked_branch(simulation: Simulation, scenario: Scenario, results_path: str) -> None:
+    """
+    Run a branch in a forked process, which inherits the snapshot copy-on-write.
+    """
+    simulation.progress.quiet = True  # The branches run together, their progress prints would mix
+    run_branch(simulation, scenario, results_path)
+
+
+def run_scenarios(simulation: Simulation, scenarios: list = SCENARIOS, results_path: str = None,
+                  processes: int = None) -> pd.DataFrame:
+    """
+    Run many scenarios from the same snapshot in parallel processes. Every branch is a forked process,
+    which shares the snapshot and the inputs with the others copy-on-write, so the work before the snapshot
+    is done once. All the branches continue with the random numbers state of the snapshot.
+    Without fork the branches run one after the other in this process, each from a copy of the snapshot.
+
+    Args:
+        simulation (Simulation): The snapshot, as returned by warm_up or Simulation.from_checkpoint. It is not modified.
+        scenarios (list, optional): The scenarios, with different names. Defaults to SCENARIOS.
+        results_path (str, optional): The directory of the results directories of the scenarios.
+                                      Defaults to '<RESULTS_PATH>/scenarios'.
+        processes (int, optional): The number of branches run at once, None for the number of cores. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The measures of every scenario, in the order of scenarios, with the run time in seconds.
+
+    Raises:
+        ValueError: If two scenarios have the same name.
+        RuntimeError: If a branch fails.
+    """
+    if len({scenario.name for scenario in scenarios}) != len(scenarios):
+        raise ValueError("the scenarios must have different names.")
+    results_path = results_path or f'{RESULTS_PATH.format(placement=simulation.inputs.placement)}/scenarios'
+    processes = processes or os.cpu_count() or 1
+    run_seconds = {}
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+        # Move the objects of the snapshot out of the collected generations, so the collector
+        # of a branch does not write to the pages it shares with the others
+        gc.freeze()
+        pending, running = list(scenarios), {}  # sentinel -> (process, scenario, start time)
+        try:
+            while pending or running:
+                while pending and len(running) < processes:
+                    scenario = pending.pop(0)
+                    process = context.Process(target=_run_forked_branch, args=(simulation, scenario, results_path))
+                    process.start()
+                    running[process.sentinel] = (process, scenario, time.perf_counter())
+                for sentinel in multiprocessing.connection.wait(list(running)):
+                    process, scenario, start = running.pop(sentinel)
+                    process.join()
+                    if process.exitcode != 0:
+                        raise RuntimeError(f"the scenario {scenario.name} failed with exit code {process.exitcode}.")
+                    run_seconds[scenario.name] = round(time.perf_counter() - start, 1)
+        finally:
+            for process, _, _ in running.values():
+                process.terminate()
+            gc.unfreeze()
+    else:
+        for scenario in scenarios:
+            start = time.perf_counter()
+            # A copy of the run state, the inputs stay shared
+            memo = {id(obj): obj for name, obj in simulation.shared_objects().items() if name != 'simulation'}
+            run_branch(copy.deepcopy(simulation, memo), scenario, results_path)
+            run_seconds[scenario.name] = round(time.perf_counter() - start, 1)
+
+    rows = []
+    for scenario in scenarios:
+        measures = pd.read_csv(f'{results_path}/{scenario.name}/measures.csv').iloc[0].to_dict()
+        rows.append({'scenario': scenario.name, **measures, 'run_seconds': run_seconds[scenario.name]})
+    return pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run what-if scenarios forked from a shared warm-up snapshot.')
+    parser.add_argument('scenarios', nargs='*', default=[scenario.name for scenario in SCENARIOS],
+                        help='The names of the scenarios in SCENARIOS, all of them by default.')
+    parser.add_argument('--fork-date', type=pd.Timestamp, default=None,
+                        help='The time of the snapshot, needed unless the snapshot file exists.')
+    parser.add_argument('--snapshot', default=None,
+                        help='A snapshot file, loaded if it exists and written after the warm-up otherwise.')
+    parser.add_argument('--processes', type=int, default=None, help='The number of branches run at once.')
+    args = parser.parse_args()
+
+    scenarios_by_name = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in args.scenarios if name not in scenarios_by_name]
+    if unknown:
+        parser.error(f"unknown scenarios {unknown}, the scenarios are {list(scenarios_by_name)}")
+    inputs = SimulationInputs.load(PLACEMENT, MAX_DATETIME, USE_DATA_CACHE)
+    start = time.perf_counter()
+    if args.snapshot and os.path.exists(args.snapshot):
+        print(f"Forking from {args.snapshot}")
+        simulation = Simulation.from_checkpoint(args.snapshot, inputs)
+        if args.fork_date is not None and simulation.t_now.date() != args.fork_date.date():
+            parser.error(f"the snapshot is at {simulation.t_now}, not at {args.fork_date}")
+    elif args.fork_date is None:
+        parser.error("--fork-date is needed to warm up a new snapshot")
+    else:
+        simulation = warm_up(inputs, args.fork_date)
+        if args.snapshot:
+            simulation.save_checkpoint(args.snapshot)
+    print(f"warm-up to {simulation.t_now} took {time.perf_counter() - start:.1f} seconds")
+    scenario_measures = run_scenarios(simulation, [scenarios_by_name[name] for name in args.scenarios],
+                                      processes=args.processes)
+    print(scenario_measures.to_string(index=False))
+    print(f"{len(args.scenarios)} scenarios took {time.perf_counter() - start:.1f} seconds")
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+
+class ShipmentIndex:
+    """
+    Represents the future shipments of every item as per-uuid sorted arrays of shipment dates
+    and cumulative quantities, so lookahead queries are answered with a binary search.
+    """
+
+    def __init__(self, shipments: pd.DataFrame) -> None:
+        """
+        Initializes a new instance of the ShipmentIndex class.
+
+        Args:
+            shipments (pd.DataFrame): The shipments data with 'date', 'uuid' and 'quantity' columns,
+                                      as returned by import_shipments_data.
+        """
+        uuids = shipments['uuid'].to_numpy(dtype=int)
+        ordinals = np.array([date.toordinal() for date in shipments['date']], dtype=int)
+        quantities = shipments['quantity'].to_numpy(dtype=float)
+        # Sort the shipments by uuid and then by date, the shipments of every uuid are a contiguous slice
+        sorted_shipments = np.lexsort((ordinals, uuids))
+        uuids = uuids[sorted_shipments]
+        self.dates = ordinals[sorted_shipments]  # Shipment dates as ordinals
+        # cumulative_quantities[i] is the quantity of the first i shipments, so a slice sum is a subtraction
+        self.cumulative_quantities = np.concatenate(([0], np.cumsum(quantities[sorted_shipments])))
+        # The shipments of uuid are in [offsets[uuid], offsets[uuid + 1])
+        size = (uuids.max() + 1) if len(uuids) > 0 else 0
+        self.offsets = np.searchsorted(uuids, np.arange(size + 1))
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of shipment lines in the index.
+        """
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the ShipmentIndex object.
+        """
+        return (f"ShipmentIndex(shipments={len(self.dates)}, items={len(self.offsets) - 1})")
+
+    def _window(self, uuid: int, start_date: datetime, end_date: datetime) -> tuple:
+        """
+        Get the positions of the shipments of an item between two dates.
+
+        Args:
+            uuid (int): The item id.
+            start_date (datetime): The first date of the window (included).
+            end_date (datetime): The last date of the window (included).
+
+        Returns:
+            tuple: (first, last) such that the shipments in the window are in [first, last).
+        """
+        if not 0 <= uuid < len(self.offsets) - 1:  # The item has no shipments
+            return 0, 0
+        lo, hi = self.offsets[uuid], self.offsets[uuid + 1]
+        item_dates = self.dates[lo:hi]
+        first = lo + np.searchsorted(item_dates, start_date.toordinal(), side='left')
+        last = lo + np.searchsorted(item_dates, end_date.toordinal(), side='right')
+        return first, last
+
+    def units_arriving(self, uuid: int, start_date: datetime, end_date: datetime) -> float:
+        """
+        Get the number of units of an item which arrive between two dates.
+
+        Args:
+            uuid (int): The item id.
+            start_date (datetime): The first date of the window (included).
+            end_date (datetime): The last date of the window (included).
+
+        Returns:
+            float: The total quantity of the item in the shipments of the window.
+        """
+        first, last = self._window(uuid, start_date, end_date)
+        return self.cumulative_quantities[last] - self.cumulative_quantities[first]
+
+    def arrival_of_units(self, uuid: int, start_date: datetime, end_date: datetime, units: float):
+        """
+        Get the date by which enough units of an item have arrived within a window.
+
+        Args:
+            uuid (int): The item id.
+            start_date (datetime): The first date of the window (included).
+            end_date (datetime): The last date of the window (included).
+            units (float): The number of units needed.
+
+        Returns:
+            datetime: The date of the shipment which completes the units needed, None if the window does not have enough units.
+        """
+        first, last = self._window(uuid, start_date, end_date)
+        if first == last or self.cumulative_quantities[last] - self.cumulative_quantities[first] < units:
+            return None
+        # Find the first shipment in the window where the cumulative quantity reaches the units needed
+        target = self.cumulative_quantities[first] + units
+        completing = np.searchsorted(self.cumulative_quantities[first + 1:last + 1], target, side='left')
+        return datetime.fromordinal(int(self.dates[first + completing]))
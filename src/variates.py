@@ -0,0 +1,122 @@
+import numpy as np
+from lookups import ToolLookup
+
+TOOL_PARAMETERS = ['horizontal_speed', 'vertical_speed', 'remove_from_shelf_time']  # The normal parameters of the tools
+
+
+class VariatePool:
+    """
+    Represents pools of normal variates drawn in blocks, one pool per (tool type, parameter) pair of
+    fetch_tools_speeds_mean_and_std.csv and per extra distribution added with add.
+    A draw pops a value from its pool, which is refilled with a new block from the generator when empty,
+    so the values are reproducible from the seed of the generator.
+    """
+
+    def __init__(self, tool_lookup: ToolLookup, rng=np.random, block_size: int = 4096) -> None:
+        """
+        Initializes a new instance of the VariatePool class.
+
+        Args:
+            tool_lookup (ToolLookup): The means and standard deviations of the tool parameters.
+            rng (np.random.Generator, optional): The generator of the blocks. Defaults to the global np.random.
+            block_size (int, optional): The number of values drawn in a block. Defaults to 4096.
+
+        Raises:
+            ValueError: If the block size is not positive.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be positive.")
+        self.tool_lookup = tool_lookup
+        self.rng = rng
+        self.block_size = block_size
+        self.distributions = {}  # (tool type or None, parameter) -> (mean, std)
+        self.pools = {}  # (tool type or None, parameter) -> list of values, drawn from the end
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: A string representation of the VariatePool object.
+        """
+        return (f"VariatePool(pools={len(self.pools)}, block_size={self.block_size})")
+
+    def add(self, parameter: str, mean: float, std: float) -> None:
+        """
+        Adds a distribution which does not depend on a tool, drawn with a tool type of None.
+
+        Args:
+            parameter (str): The name of the distribution.
+            mean (float): The mean of the distribution.
+            std (float): The standard deviation of the distribution.
+        """
+        self.distributions[(None, parameter)] = (mean, std)
+        self.pools.pop((None, parameter), None)
+
+    def distribution(self, tool_type: int or None, parameter: str) -> tuple:
+        """
+        Returns:
+            tuple: The mean and the standard deviation of a (tool type, parameter) pair.
+
+        Raises:
+            KeyError: If the parameter is unknown.
+        """
+        key = (tool_type, parameter)
+        if key not in self.distributions:
+            if tool_type is None or parameter not in TOOL_PARAMETERS:
+                raise KeyError(f"unknown distribution {key}.")
+            self.distributions[key] = (getattr(self.tool_lookup, f'{parameter}_mean')[tool_type],
+                                       getattr(self.tool_lookup, f'{parameter}_std')[tool_type])
+        return self.distributions[key]
+
+    def refill(self, tool_type: int or None, parameter: str, size: int = 0) -> list:
+        """
+        Draws a new block in front of the values left in a pool.
+
+        Args:
+            tool_type (int or None): The tool type, None for a distribution added with add.
+            parameter (str): The parameter of the tool or the name of the distribution.
+            size (int, optional): The minimal number of values in the block. Defaults to 0.
+
+        Returns:
+            list: The pool.
+        """
+        mean, std = self.distribution(tool_type, parameter)
+        block = self.rng.normal(mean, std, max(self.block_size, size)).tolist()
+        pool = block + self.pools.get((tool_type, parameter), [])
+        self.pools[(tool_type, parameter)] = pool
+        return pool
+
+    def draw(self, tool_type: int or None, parameter: str) -> float:
+        """
+        Draws a value.
+
+        Args:
+            tool_type (int or None): The tool type, None for a distribution added with add.
+            parameter (str): The parameter of the tool or the name of the distribution.
+
+        Returns:
+            float: The value.
+        """
+        pool = self.pools.get((tool_type, parameter))
+        if not pool:
+            pool = self.refill(tool_type, parameter)
+        return pool.pop()
+
+    def draw_many(self, tool_type: int or None, parameter: str, size: int) -> list:
+        """
+        Draws many values.
+
+        Args:
+            tool_type (int or None): The tool type, None for a distribution added with add.
+            parameter (str): The parameter of the tool or the name of the distribution.
+            size (int): The number of values.
+
+        Returns:
+            list: The values.
+        """
+        pool = self.pools.get((tool_type, parameter))
+        if pool is None or len(pool) < size:
+            pool = self.refill(tool_type, parameter, size)
+        values = pool[len(pool) - size:]
+        del pool[len(pool) - size:]
+        values.reverse()  # In drawing order, the pool is drawn from the end
+        return values
@@ -0,0 +1,86 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# The modules of the simulation are imported from src, like when running src/simulation.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from engine import SimulationInputs, Simulation
+
+# The working days of the small warehouse, Fridays are short days like in src/data/dates.csv
+DATES = ['2021-01-01', '2021-01-03', '2021-01-04', '2021-01-05', '2021-01-06', '2021-01-07', '2021-01-08',
+         '2021-01-10', '2021-01-11', '2021-01-12', '2021-01-13', '2021-01-14', '2021-01-15']
+
+
+def small_cells() -> pd.DataFrame:
+    """
+    Returns:
+        pd.DataFrame: A warehouse of 3 aisles of 8 cells, one aisle per fetch tool, and the sort area at location 0.
+    """
+    rows = [{'location': 0, 'aisle': 0, 'x_length': -10.0, 'y_width': 0.0, 'z_height': 0.0, 'heightfromfloor': 0.0,
+             'cell_attractiveness': 1.0, 'distance_from_io_to_aisle': 0.0, 'fetch_tool': 3, 'putaway_zone': 0,
+             'cell_volume': np.inf, 'available_volume': np.inf}]
+    for aisle, fetch_tool in zip((1, 2, 3), (1, 0, 2)):
+        for cell in range(8):
+            rows.append({'location': len(rows), 'aisle': aisle, 'x_length': 1.0 + cell // 2,
+                         'y_width': 3.0 * aisle, 'z_height': 0.0 if fetch_tool == 1 else 1.5 * (cell % 2),
+                         'heightfromfloor': 0.25, 'cell_attractiveness': 0.9 - 0.1 * aisle - 0.01 * cell,
+                         'distance_from_io_to_aisle': 10.0 + 3.0 * aisle, 'fetch_tool': fetch_tool,
+                         'putaway_zone': 1 + (aisle - 1) % 2, 'cell_volume': 1.0, 'available_volume': 1.0})
+    return pd.DataFrame(rows)
+
+
+def small_inputs(orders: list, shipments: list = (), positions: list = (), items: int = 10) -> SimulationInputs:
+    """
+    Build the inputs of a simulation of the small warehouse.
+
+    Args:
+        orders (list): (timestamp, uuid, quantity) for every order line, or with a 4th value, the order key
+                       which groups the lines into orders.
+        shipments (list, optional): (date, uuid, quantity) for every shipment. Defaults to ().
+        positions (list, optional): (location, uuid, quantity) for the initial stock. Defaults to ().
+        items (int, optional): The number of items, with uuids from 0. Defaults to 10.
+
+    Returns:
+        SimulationInputs: The inputs.
+    """
+    dates = pd.DataFrame({'date': pd.to_datetime(DATES)})
+    dates['short_day'] = dates['date'].dt.dayofweek == 4
+    items_df = pd.DataFrame({'uuid': range(items), 'putaway_zone': [1 + uuid % 2 for uuid in range(items)],
+                             'item_volume': 0.01, 'item_attractiveness': np.linspace(1, 0, items),
+                             'initial_stock': 0})
+    shipments_df = pd.DataFrame(list(shipments), columns=['date', 'uuid', 'quantity'])
+    shipments_df['date'] = pd.to_datetime(shipments_df['date'])
+    shipments_df = shipments_df.sort_values(['date', 'uuid']).reset_index(drop=True)
+    orders_df = pd.DataFrame([tuple(line[:3]) + (line[3] if len(line) > 3 else number,)
+                              for number, line in enumerate(orders)],
+                             columns=['timestamp', 'uuid', 'quantity', 'order_key'])
+    orders_df['timestamp'] = pd.to_datetime(orders_df['timestamp'])
+    orders_df = orders_df.sort_values(['timestamp', 'order_key', 'uuid'], kind='stable').reset_index(drop=True)
+    orders_df.insert(0, 'order_id', (orders_df['order_key'] != orders_df['order_key'].shift()).cumsum() - 1)
+    positions_df = pd.DataFrame(list(positions), columns=['location', 'uuid', 'quantity'], dtype=float)
+    positions_df[['location', 'uuid']] = positions_df[['location', 'uuid']].astype(int)
+    times = pd.DataFrame({'fetch_tool': [0, 1, 2], 'horizontal_speed_mean': [2.6, 2.4, 2.0],
+                          'horizontal_speed_std': [0.3, 0.4, 0.3], 'vertical_speed_mean': [0.8, np.nan, 0.4],
+                          'vertical_speed_std': [0.04, np.nan, 0.05], 'remove_from_shelf_time_mean': [25.7, 25.5, 26.0],
+                          'remove_from_shelf_time_std': [7.2, 6.7, 6.9]})
+    capacities = pd.DataFrame({'fetch_tool': [0, 1, 2, 3], 'max_volume': [6.18, 6.83, 6.18, np.inf]})
+    return SimulationInputs(dates, small_cells(), positions_df, items_df, shipments_df, orders_df, times, capacities,
+                            placement='small')
+
+
+@pytest.fixture
+def run_small(tmp_path):
+    """
+    Returns:
+        A function which runs a simulation of small_inputs(*args, **kwargs) to the end, without results files.
+    """
+    def run(*args, **kwargs) -> Simulation:
+        simulation = Simulation(small_inputs(*args, **kwargs), results_path=str(tmp_path / 'results'),
+                                events_recording_level='off', fetch_tasks_recording_level='off',
+                                progress_quiet=True, rng=np.random.default_rng(0))
+        simulation.run()
+        return simulation
+    return run
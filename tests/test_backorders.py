@@ -0,0 +1,53 @@
+import pandas as pd
+from backorders import BackorderBook
+from classes import Order
+
+
+def order(order_id: int, uuid: int) -> Order:
+    return Order(order_id=order_id, arrival_date=pd.Timestamp('2021-01-04 09:00'), items_dict={uuid: 1})
+
+
+def test_book_keeps_the_arrival_order_per_item():
+    book = BackorderBook()
+    first, second, other = order(0, 1), order(1, 1), order(2, 2)
+    assert book.add(first, 1, pd.Timestamp('2021-01-05'))
+    assert book.add(other, 2, pd.Timestamp('2021-01-06'))
+    assert book.add(second, 1, pd.Timestamp('2021-01-05'))
+    assert not book.add(first, 2, pd.Timestamp('2021-01-06'))  # Already waiting
+    assert len(book) == 3 and 2 in book and book.has_waiting(1)
+    assert [waiting for waiting, _ in book.pop_waiting(1)] == [first, second]
+    assert len(book) == 1 and 0 not in book and not book.has_waiting(1)
+    assert book.pop_waiting(1) == []
+
+
+def test_order_is_released_when_its_item_arrives(run_small):
+    simulation = run_small([('2021-01-04 09:00', 1, 10)], shipments=[('2021-01-05', 1, 10)])
+    assert simulation.return_orders == 1
+    assert simulation.impossible_orders == 0 and len(simulation.waiting_for_delivery) == 0
+    assert len(simulation.fetch_task_times) == 1  # Fetched once
+
+
+def test_order_waits_again_until_the_completing_shipment(run_small):
+    # The first shipment is not enough, the order waits for the second one without being counted again
+    simulation = run_small([('2021-01-04 09:00', 1, 20)], shipments=[('2021-01-05', 1, 10), ('2021-01-06', 1, 10)])
+    assert simulation.return_orders == 1
+    assert simulation.impossible_orders == 0 and len(simulation.waiting_for_delivery) == 0
+    assert len(simulation.fetch_task_times) == 1
+
+
+def test_order_whose_units_were_taken_is_checked_again(run_small):
+    # Both orders expect the shipment of 2021-01-05, the first one takes it and the second one
+    # is backordered again, for the shipment of 2021-01-07
+    simulation = run_small([('2021-01-04 09:00', 1, 10), ('2021-01-04 10:00', 1, 10)],
+                           shipments=[('2021-01-05', 1, 10), ('2021-01-07', 1, 10)])
+    assert simulation.return_orders == 3
+    assert simulation.impossible_orders == 0 and len(simulation.waiting_for_delivery) == 0
+    assert len(simulation.fetch_task_times) == 2
+
+
+def test_order_whose_units_were_taken_is_rejected_without_a_later_shipment(run_small):
+    simulation = run_small([('2021-01-04 09:00', 1, 10), ('2021-01-04 10:00', 1, 10)],
+                           shipments=[('2021-01-05', 1, 10)])
+    assert simulation.return_orders == 2
+    assert simulation.impossible_orders == 1 and len(simulation.waiting_for_delivery) == 0
+    assert len(simulation.fetch_task_times) == 1
@@ -0,0 +1,27 @@
+import functools
+import batch
+from conftest import small_inputs
+from engine import Simulation
+
+ORDERS = [('2021-01-04 09:00', 1, 2), ('2021-01-04 11:00', 2, 1), ('2021-01-05 10:00', 1, 3),
+          ('2021-01-06 14:00', 3, 4)]
+
+
+def test_batch_runs_every_placement_with_the_same_seed(tmp_path, monkeypatch):
+    placements = {'near': small_inputs(ORDERS, positions=[(1, 1, 10), (2, 2, 10), (3, 3, 10)]),
+                  'far': small_inputs(ORDERS, positions=[(8, 1, 10), (16, 2, 10), (24, 3, 10)])}
+    monkeypatch.setattr(batch, '_BATCH_INPUTS', {})
+    monkeypatch.setattr(batch, 'load_batch_inputs', lambda *args: placements)
+    # The forked workers write the results of every placement to the temporary directory
+    monkeypatch.setattr(batch, 'Simulation', functools.partial(Simulation, results_path=str(tmp_path),
+                                                               fetch_tasks_recording_level='off'))
+    measures = batch.run_batch(['near', 'far', 'near'], workers=2, events_recording_level='off', seed=3)
+    assert list(measures['placement']) == ['near', 'far', 'near']
+    assert (measures['seed'] == 3).all()
+    measures = measures.drop(columns=['run_seconds', 'seed'])
+    # A placement gives the same measures in every worker, and in a run of its own
+    assert measures.iloc[0].equals(measures.iloc[2])
+    far = batch.run_placement('far', 3, events_recording_level='off')
+    far.pop('run_seconds')
+    assert measures.iloc[1].to_dict() == far
+    assert (tmp_path / 'measures.csv').exists()
@@ -0,0 +1,43 @@
+import pandas as pd
+from conftest import DATES
+from business_calendar import BusinessCalendar
+
+
+def calendar() -> BusinessCalendar:
+    dates = pd.DataFrame({'date': pd.to_datetime(DATES)[::-1]})  # Not sorted, like a shuffled dates file
+    dates['short_day'] = dates['date'].dt.dayofweek == 4
+    return BusinessCalendar(dates)
+
+
+def test_working_days_count():
+    days = calendar()
+    assert len(days) == 13
+    assert days.first_date == pd.Timestamp('2021-01-01') and days.last_date == pd.Timestamp('2021-01-15')
+    assert days.working_days_until(pd.Timestamp('2020-12-31')) == 0
+    assert days.working_days_until(pd.Timestamp('2021-01-02 15:00')) == 1  # Saturday, not a working day
+    assert days.working_days_until(pd.Timestamp('2021-01-03')) == 2
+    assert days.working_days_until(pd.Timestamp('2021-02-01')) == 13
+    # (start, end]: Sunday to the next Sunday
+    assert days.working_days_between(pd.Timestamp('2021-01-03'), pd.Timestamp('2021-01-10')) == 6
+
+
+def test_next_working_day():
+    days = calendar()
+    assert days.next_working_day(pd.Timestamp('2021-01-01 10:00')) == pd.Timestamp('2021-01-03')
+    assert days.next_working_day(pd.Timestamp('2021-01-02')) == pd.Timestamp('2021-01-03')
+    # After the calendar ends, calendar days are counted
+    assert days.next_working_day(pd.Timestamp('2021-01-15 10:00')) == pd.Timestamp('2021-01-16 10:00')
+
+
+def test_nth_working_day():
+    days = calendar()
+    assert days.nth_working_day(pd.Timestamp('2021-01-07'), 1) == pd.Timestamp('2021-01-08')
+    assert days.nth_working_day(pd.Timestamp('2021-01-07'), 2) == pd.Timestamp('2021-01-10')
+    assert days.nth_working_day(pd.Timestamp('2021-01-14'), 3) == pd.Timestamp('2021-01-17')
+
+
+def test_short_days():
+    days = calendar()
+    assert days.is_short_day(pd.Timestamp('2021-01-08 09:00'))
+    assert not days.is_short_day(pd.Timestamp('2021-01-07'))
+    assert not days.is_short_day(pd.Timestamp('2021-01-22'))  # A Friday after the calendar
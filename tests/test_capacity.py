@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+from conftest import small_cells, small_inputs
+from capacity import FreeCapacityIndex, MaxSegmentTree
+from engine import Simulation
+from lookups import CellLookup
+
+
+def test_segment_tree_finds_the_first_value_at_least_a_threshold():
+    rng = np.random.default_rng(0)
+    values = rng.choice([0.0, 0.2, 0.5, 1.0], size=13)
+    tree = MaxSegmentTree(values)
+    for _ in range(200):
+        position = rng.integers(len(values))
+        values[position] = rng.choice([0.0, 0.2, 0.5, 1.0])
+        tree.update(position, values[position])
+        threshold = rng.choice([0.1, 0.2, 0.6, 1.0, 1.5])
+        expected = np.flatnonzero(values >= threshold)
+        assert tree.first_at_least(threshold) == (expected[0] if len(expected) else -1)
+
+
+def baseline_placing(cells: pd.DataFrame, positions: pd.DataFrame, item_id: int, amount_to_place: int,
+                     unit_volume: float, unit_putaway_zone: int) -> pd.DataFrame:
+    """
+    The placing heuristic of the first version of the simulation, on DataFrames: the cells which include
+    the item, then the cells of its putaway zone, then all the cells, and in them the most attractive cell
+    with room for all the units left, or else for one unit.
+
+    Returns:
+        pd.DataFrame: The positions, with a new row for every placement.
+    """
+    while amount_to_place > 0:
+        volume_left_to_place = unit_volume * amount_to_place
+        cells_available = cells[(cells['location'] != 0) & (cells['available_volume'] >= unit_volume)]
+        merged = pd.merge(positions[['location', 'uuid']],
+                          cells_available[['location', 'putaway_zone', 'available_volume', 'cell_attractiveness']],
+                          on='location', how='right')
+        if item_id in merged['uuid'].values:
+            possible_cells = merged.loc[merged['uuid'] == item_id]
+        elif unit_putaway_zone in merged['putaway_zone'].values:
+            possible_cells = merged.loc[merged['putaway_zone'] == unit_putaway_zone]
+        else:
+            possible_cells = merged
+        if any(possible_cells['available_volume'] >= volume_left_to_place):
+            possible_cells = possible_cells[possible_cells['available_volume'] >= volume_left_to_place]
+        cell = possible_cells.loc[possible_cells['cell_attractiveness'].idxmax()]
+        amount_to_place_here = min(amount_to_place, cell['available_volume'] // unit_volume)
+        placement = pd.DataFrame([[int(cell['location']), item_id, amount_to_place_here]], columns=positions.columns)
+        positions = pd.concat([positions, placement], ignore_index=True)
+        cells.loc[cells['location'] == cell['location'], 'available_volume'] -= unit_volume * amount_to_place_here
+        amount_to_place -= amount_to_place_here
+    return positions
+
+
+def test_placing_matches_the_baseline_heuristic(tmp_path):
+    rng = np.random.default_rng(0)
+    cells = small_cells()
+    # Ties of attractiveness inside every aisle, and cells partly full
+    cells['cell_attractiveness'] = cells['cell_attractiveness'].round(1)
+    cells.loc[1:, 'available_volume'] = rng.choice([0.0, 0.05, 0.3, 1.0], size=len(cells) - 1)
+    simulation = Simulation(small_inputs([('2021-01-04 09:00', 0, 1)]), results_path=str(tmp_path),
+                            events_recording_level='off', fetch_tasks_recording_level='off', progress_quiet=True)
+    simulation.available_volume[:] = cells['available_volume'].to_numpy()
+    simulation.capacity = FreeCapacityIndex(CellLookup(cells), simulation.available_volume, [0])
+    positions = pd.DataFrame(columns=['location', 'uuid', 'quantity'])
+    for _ in range(25):
+        item_id = int(rng.integers(10))
+        amount = int(rng.integers(1, 60))
+        unit_volume = simulation.item_lookup.volume[item_id]
+        positions = baseline_placing(cells, positions, item_id, amount, unit_volume,
+                                     int(simulation.item_lookup.putaway_zone[item_id]))
+        simulation.placing_huristic(item_id, amount)
+        expected = positions.groupby(['location', 'uuid'])['quantity'].sum()
+        assert simulation.warehouse_positions.quantities == {key: quantity for key, quantity in expected.items()}
+        assert np.array_equal(simulation.available_volume[1:], cells['available_volume'].to_numpy()[1:])
+
+
+def test_bulk_placing_matches_placing_every_item_in_turn(tmp_path):
+    rng = np.random.default_rng(1)
+    inputs = small_inputs([('2021-01-04 09:00', 0, 1)], positions=[(1, 2, 5), (12, 7, 30)])
+    # Ties of attractiveness between items, placed in the order of the sort area
+    inputs.item_lookup.attractiveness[:] = [0.9, 0.5, 0.9, 0.2, 0.5, 0.5, 0.1, 0.9, 0.3, 0.2]
+    volumes = rng.choice([0.0, 0.05, 0.3, 1.0], size=len(inputs.cells) - 1)
+    # Deliveries to the sort area, an item delivered twice and some empty lines
+    deliveries = [(uuid, int(rng.integers(0, 80))) for uuid in (3, 0, 7, 5, 2, 9, 1, 4, 8, 6, 3, 0)]
+    ledgers = []
+    for bulk in (True, False):
+        simulation = Simulation(inputs, results_path=str(tmp_path), events_recording_level='off',
+                                fetch_tasks_recording_level='off', progress_quiet=True)
+        simulation.available_volume[1:] = volumes
+        simulation.capacity = FreeCapacityIndex(inputs.cell_lookup, simulation.available_volume, [0])
+        for uuid, quantity in deliveries:
+            simulation.warehouse_positions.add(0, uuid, quantity)
+        if bulk:
+            simulation.placing()
+        else:
+            sort_area = simulation.warehouse_positions.items_at(0)
+            uuids = np.array([uuid for _, uuid, _ in sort_area])
+            for i in np.argsort(-inputs.item_lookup.attractiveness[uuids], kind='stable'):
+                _, uuid, quantity = sort_area[i]
+                if quantity > 0:
+                    simulation.placing_huristic(uuid, quantity)
+            simulation.warehouse_positions.discard_empty(0)
+        ledgers.append((simulation.warehouse_positions.to_dataframe(), simulation.available_volume.copy()))
+    pd.testing.assert_frame_equal(ledgers[0][0], ledgers[1][0])
+    assert np.array_equal(ledgers[0][1], ledgers[1][1])
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import small_inputs
+from checkpoint import checkpoint_files, latest_checkpoint, prune_checkpoints, read_checkpoint, write_checkpoint
+from engine import Simulation
+
+RESULTS_FILES = ('measures.csv', 'positions_results.csv', 'waiting_for_supply.csv', 'fetch_tasks_results.csv',
+                 'events_sim_results.csv')
+
+
+@pytest.fixture
+def inputs():
+    # Orders over a week, some of them waiting for the shipments of their items
+    orders = [(f'2021-01-{day:02d} {9 + line % 6}:{line % 4 * 15:02d}', line % 10, 40)
+              for day in (3, 4, 5, 6, 7) for line in range(12)]
+    shipments = [(f'2021-01-{day:02d}', uuid, 200) for day in (4, 6) for uuid in (1, 3, 5)]
+    positions = [(1 + uuid, uuid, 400) for uuid in range(0, 10, 2)] + [(17 + uuid // 2, uuid, 50) for uuid in (7, 9)]
+    return small_inputs(orders, shipments=shipments, positions=positions)
+
+
+def small_simulation(inputs, results_path, **options) -> Simulation:
+    simulation = Simulation(inputs, results_path=str(results_path), progress_quiet=True,
+                            rng=np.random.default_rng(0), **options)
+    for recorder in (simulation.fetch_tasks, simulation.events_sim):
+        recorder.chunk_size = 7  # Rows are flushed before and after the checkpoints
+    return simulation
+
+
+def test_resumed_run_matches_an_uninterrupted_run(inputs, tmp_path):
+    simulation = small_simulation(inputs, tmp_path / 'full', checkpoint_every_days=None)
+    simulation.run()
+    simulation.write_results()
+
+    simulation = small_simulation(inputs, tmp_path / 'resumed', checkpoint_every_days=1)
+    simulation.run(until=pd.Timestamp('2021-01-06 12:00'))  # Interrupted after the checkpoint of the day
+    checkpoint = latest_checkpoint(str(tmp_path / 'resumed' / 'checkpoints'))
+    assert os.path.basename(checkpoint).startswith('checkpoint-20210106-')
+    assert simulation.fetch_tasks.rows_written > 0
+    resumed = Simulation.from_checkpoint(checkpoint, inputs)
+    resumed.run()
+    resumed.write_results()
+    for name in RESULTS_FILES:
+        assert (tmp_path / 'resumed' / name).read_bytes() == (tmp_path / 'full' / name).read_bytes(), name
+
+
+def test_checkpoint_with_other_inputs_is_rejected(inputs, tmp_path):
+    simulation = small_simulation(inputs, tmp_path, checkpoint_every_days=None)
+    simulation.run(until=pd.Timestamp('2021-01-04 12:00'))
+    path = simulation.save_checkpoint()
+    other_inputs = small_inputs([('2021-01-04 09:00', 0, 1)])
+    with pytest.raises(ValueError):
+        Simulation.from_checkpoint(path, other_inputs)
+
+
+def test_shared_objects_are_not_saved(tmp_path):
+    shared = {'inputs': {'rows': list(range(1000))}}
+    path = str(tmp_path / 'checkpoint-1.pkl.gz')
+    write_checkpoint(path, {'inputs': shared['inputs'], 'position': 3}, shared)
+    replacement = {'rows': []}
+    state = read_checkpoint(path, {'inputs': replacement})
+    assert state['inputs'] is replacement and state['position'] == 3
+
+
+def test_prune_keeps_the_latest_checkpoints(tmp_path):
+    for name in ('checkpoint-20210105-000000.pkl.gz', 'checkpoint-20210104-000000.pkl.gz',
+                 'checkpoint-20210106-000000.pkl.gz', 'notes.txt'):
+        (tmp_path / name).write_bytes(b'')
+    prune_checkpoints(str(tmp_path))
+    assert [os.path.basename(path) for path in checkpoint_files(str(tmp_path))] == \
+        ['checkpoint-20210105-000000.pkl.gz', 'checkpoint-20210106-000000.pkl.gz']
+    assert (tmp_path / 'notes.txt').exists()
+    assert latest_checkpoint(str(tmp_path / 'missing')) is None
@@ -0,0 +1,73 @@
+import os
+import pandas as pd
+import pytest
+import data_cache
+from data_cache import load_table
+
+
+@pytest.fixture
+def data_path(tmp_path, monkeypatch):
+    """
+    Cache a partitioned table of daily events read from the events.csv of a temporary data directory.
+    """
+    monkeypatch.setattr(data_cache, 'DATA_PATH', str(tmp_path))
+    monkeypatch.setattr(data_cache, 'CACHE_PATH', f'{tmp_path}/cache')
+    monkeypatch.setitem(data_cache.TABLES, 'events', (
+        lambda placement: pd.read_csv(f'{tmp_path}/events.csv', parse_dates=['date']),
+        ['events.csv'], 'date', True))
+    write_events(tmp_path, pd.date_range('2021-01-25', '2021-03-05'))
+    return tmp_path
+
+
+def write_events(path, dates) -> None:
+    pd.DataFrame({'date': dates, 'quantity': range(len(dates))}).to_csv(f'{path}/events.csv', index=False)
+
+
+def cache_entries(path) -> list:
+    return sorted(os.listdir(f'{path}/cache'))
+
+
+def test_cache_matches_the_import(data_path):
+    imported = load_table('events', use_cache=False)
+    pd.testing.assert_frame_equal(load_table('events'), imported)
+    # The second load reads the cache
+    pd.testing.assert_frame_equal(load_table('events'), imported)
+    assert len(cache_entries(data_path)) == 1
+
+
+def test_changed_source_invalidates_the_cache(data_path):
+    first_key = data_cache.table_key('events', 'unused')
+    load_table('events')
+    write_events(data_path, pd.date_range('2021-02-01', '2021-02-10'))
+    assert data_cache.table_key('events', 'unused') != first_key
+    df = load_table('events')
+    assert df['date'].min() == pd.Timestamp('2021-02-01') and len(df) == 10
+    # The cache of the old source is replaced
+    assert cache_entries(data_path) == [f'events-{data_cache.table_key("events", "unused")[:16]}']
+
+
+def test_partial_month_cutoff(data_path):
+    load_table('events')
+    path = f'{data_path}/cache/{cache_entries(data_path)[0]}'
+    assert sorted(entry for entry in os.listdir(path) if entry.startswith('month=')) == \
+        ['month=2021-01', 'month=2021-02', 'month=2021-03']
+    # The months after the cutoff are not read
+    os.remove(f'{path}/month=2021-03/part.parquet')
+    df = load_table('events', max_date=pd.Timestamp('2021-02-15'))
+    assert df['date'].min() == pd.Timestamp('2021-01-25')
+    assert df['date'].max() == pd.Timestamp('2021-02-14')
+    assert list(df.index) == list(range(len(df)))
+    # A cutoff at the start of a month reads the month and keeps none of its rows
+    assert load_table('events', max_date=pd.Timestamp('2021-02-01'))['date'].max() == pd.Timestamp('2021-01-31')
+    # A cutoff before every partition reads the empty schema
+    df = load_table('events', max_date=pd.Timestamp('2020-12-01'))
+    assert df.empty and list(df.columns) == ['date', 'quantity']
+
+
+def test_stale_caches_removed_by_label(data_path):
+    stale = ['events-0123456789abcdef', 'events-fedcba9876543210']
+    kept = ['events-sorted-0123456789abcdef', 'eventsx-0123456789abcdef', 'items-0123456789abcdef']
+    for entry in stale + kept:
+        os.makedirs(f'{data_path}/cache/{entry}')
+    load_table('events')
+    assert cache_entries(data_path) == sorted(kept + [f'events-{data_cache.table_key("events", "unused")[:16]}'])
@@ -0,0 +1,56 @@
+import pandas as pd
+from classes import Event, EventType
+from event_calendar import EventCalendar, KnownEvents
+
+
+def known_events() -> KnownEvents:
+    # The known events are created when they come due, with their row in the times of their type
+    return KnownEvents(lambda type, row, time: Event(time, type, order=row))
+
+
+def popped(calendar: EventCalendar) -> list:
+    events = []
+    while len(calendar):
+        event = calendar.pop()
+        events.append((event.time, event.type, event.order))
+    return events
+
+
+def test_ties_are_popped_in_scheduling_order():
+    calendar = EventCalendar()
+    calendar.schedule(pd.Timestamp('2021-01-04 10:00'), EventType.REST, order='late')
+    for number, type in enumerate((EventType.TRANSFER_TOOLS, EventType.FETCHING, EventType.REST)):
+        calendar.schedule(pd.Timestamp('2021-01-04 09:00'), type, order=number)
+    calendar.extend([Event(pd.Timestamp('2021-01-04 09:00'), EventType.FETCHING, order=3),
+                     Event(pd.Timestamp('2021-01-04 08:00'), EventType.FETCHING, order='early')])
+    assert calendar.peek_time() == pd.Timestamp('2021-01-04 08:00')
+    assert [order for _, _, order in popped(calendar)] == ['early', 0, 1, 2, 3, 'late']
+    assert calendar.peek_time() is None
+
+
+def test_known_events_come_before_scheduled_events_at_the_same_time():
+    known = known_events()
+    known.add(pd.to_datetime(['2021-01-04 09:00', '2021-01-04 11:00']), EventType.ORDERS_FROM_CUSTOMERS)
+    known.add(pd.to_datetime(['2021-01-04 09:00']), EventType.DELIVERIES_FROM_SUPPLIERS)
+    calendar = EventCalendar(known)
+    calendar.schedule(pd.Timestamp('2021-01-04 09:00'), EventType.FETCHING)
+    calendar.schedule(pd.Timestamp('2021-01-04 10:00'), EventType.REST)
+    assert len(calendar) == 5
+    assert popped(calendar) == [
+        (pd.Timestamp('2021-01-04 09:00'), EventType.ORDERS_FROM_CUSTOMERS, 0),
+        (pd.Timestamp('2021-01-04 09:00'), EventType.DELIVERIES_FROM_SUPPLIERS, 0),  # Added after the orders
+        (pd.Timestamp('2021-01-04 09:00'), EventType.FETCHING, None),
+        (pd.Timestamp('2021-01-04 10:00'), EventType.REST, None),
+        (pd.Timestamp('2021-01-04 11:00'), EventType.ORDERS_FROM_CUSTOMERS, 1)]
+
+
+def test_known_events_added_during_the_run():
+    known = known_events()
+    known.add(pd.to_datetime(['2021-01-04 09:00', '2021-01-05 09:00']), EventType.ORDERS_FROM_CUSTOMERS)
+    calendar = EventCalendar(known)
+    assert calendar.pop().order == 0
+    known.add(pd.to_datetime(['2021-01-05 09:00', '2021-01-04 12:00']), EventType.PLACING)
+    assert popped(calendar) == [
+        (pd.Timestamp('2021-01-04 12:00'), EventType.PLACING, 1),
+        (pd.Timestamp('2021-01-05 09:00'), EventType.ORDERS_FROM_CUSTOMERS, 1),
+        (pd.Timestamp('2021-01-05 09:00'), EventType.PLACING, 0)]
@@ -0,0 +1,90 @@
+import pandas as pd
+from fetching_queues import FetchItem, FetchingQueue
+
+
+def fetch_item(fetch_tool: int, aisle: int, attractiveness: float, arrival: str, volume: float = 0.1,
+               order_id: int = 0) -> FetchItem:
+    return FetchItem(fetch_tool, location=int(attractiveness * 100), aisle=aisle, cell_attractiveness=attractiveness,
+                     order_id=order_id, arrival_date=pd.Timestamp(arrival), uuid=0, units_to_fetch=1,
+                     volume_to_fetch=volume, time_to_fetch=10.0)
+
+
+def test_pop_earliest_order():
+    queue = FetchingQueue()
+    late = fetch_item(0, 1, 0.9, '2021-01-04 10:00')
+    early_low = fetch_item(0, 1, 0.2, '2021-01-04 09:00')
+    early_high = fetch_item(0, 2, 0.5, '2021-01-04 09:00')
+    other_tool = fetch_item(1, 1, 0.9, '2021-01-04 08:00')
+    for item in (late, early_low, early_high, other_tool):
+        queue.push(item)
+    assert len(queue) == 4 and queue.has_work(0) and queue.has_work(1) and not queue.has_work(2)
+    # The earliest arrival, then the most attractive cell
+    assert [queue.pop_earliest(0) for _ in range(4)] == [early_high, early_low, late, None]
+    assert not queue.has_work(0) and len(queue) == 1
+
+
+def test_pop_earliest_skips_the_items_which_do_not_fit():
+    queue = FetchingQueue()
+    large = fetch_item(0, 1, 0.9, '2021-01-04 09:00', volume=5.0)
+    small = fetch_item(0, 1, 0.1, '2021-01-04 10:00', volume=1.0)
+    queue.push(large)
+    queue.push(small)
+    assert queue.pop_earliest(0, max_volume=2.0) is small
+    assert queue.pop_earliest(0, max_volume=2.0) is None
+    # The large item is still queued
+    assert queue.pop_earliest(0) is large
+
+
+def test_pop_earliest_does_not_reorder_the_heap_for_the_items_which_do_not_fit():
+    queue = FetchingQueue()
+    large_items = [fetch_item(0, 1, 0.9, f'2021-01-04 09:{minute:02d}', volume=5.0) for minute in range(30)]
+    small = fetch_item(0, 2, 0.1, '2021-01-04 10:00', volume=1.0)
+    for item in large_items + [small]:
+        queue.push(item)
+    heap = list(queue.heaps[0])
+    assert queue.pop_earliest(0, max_volume=2.0) is small
+    # The heap is searched, not popped and pushed back: the entry of the small item stays, skipped from now on
+    assert queue.heaps[0] == heap
+    assert queue.pop_earliest(0, max_volume=2.0) is None
+    assert [queue.pop_earliest(0) for _ in range(30)] == large_items and len(queue) == 0
+
+
+def test_removed_items_are_skipped_by_pop_earliest():
+    queue = FetchingQueue()
+    items = [fetch_item(0, 1 + number % 2, 0.5, '2021-01-04 09:00', order_id=number) for number in range(4)]
+    for item in items:
+        queue.push(item)
+    queue.remove(items[0])
+    queue.remove(items[3])
+    # The removed items stay in the heap but not in the aisles and the counters
+    assert len(queue.heaps[0]) == 4 and len(queue) == 2
+    assert queue.items_in_aisle(0, 1) == [items[2]] and queue.items_in_aisle(0, 2) == [items[1]]
+    assert sorted(item.order_id for item in queue) == [1, 2]
+    assert queue.pop_earliest(0) is items[1]
+    assert queue.pop_earliest(0) is items[2]
+    assert queue.pop_earliest(0) is None and len(queue) == 0 and not queue.aisles
+
+
+def test_removed_items_are_compacted_out_of_the_heap():
+    queue = FetchingQueue()
+    items = [fetch_item(0, 1, 0.5, '2021-01-04 09:00', order_id=number) for number in range(100)]
+    for item in items:
+        queue.push(item)
+    for item in items[:82]:
+        queue.remove(item)
+    assert len(queue.heaps[0]) == 100  # The removed items are still in the heap
+    # The heap is rebuilt without the removed items when it holds more than 2 * queued + 64 entries
+    queue.remove(items[82])
+    assert len(queue.heaps[0]) == 17 and all(entry[3].queued for entry in queue.heaps[0])
+    queue.remove(items[83])
+    assert len(queue.heaps[0]) == 17
+    assert [queue.pop_earliest(0).order_id for _ in range(16)] == list(range(84, 100))
+
+
+def test_items_in_aisle_by_attractiveness():
+    queue = FetchingQueue()
+    items = [fetch_item(2, 3, attractiveness, '2021-01-04 09:00') for attractiveness in (0.2, 0.7, 0.7, 0.4)]
+    for item in items:
+        queue.push(item)
+    assert queue.items_in_aisle(2, 3) == [items[1], items[2], items[3], items[0]]
+    assert queue.items_in_aisle(2, 4) == [] and queue.items_in_aisle(0, 3) == []
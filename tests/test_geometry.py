@@ -0,0 +1,30 @@
+import numpy as np
+from conftest import small_cells
+from geometry import WarehouseGeometry
+
+
+def test_cells_indexed_by_location():
+    cells = small_cells()
+    geometry = WarehouseGeometry(cells)
+    assert np.array_equal(geometry.cell_aisle, cells['aisle'].to_numpy())
+    assert np.array_equal(geometry.cell_x, cells['x_length'].to_numpy())
+    assert np.array_equal(geometry.cell_z, cells['z_height'].to_numpy())
+    # The deepest cells of the aisles are at x = 4
+    assert geometry.back_x == 4.0
+
+
+def test_locations_without_a_cell():
+    cells = small_cells()
+    geometry = WarehouseGeometry(cells[cells['location'] != 5])
+    assert len(geometry.cell_x) == len(cells)
+    assert geometry.cell_aisle[5] == -1 and np.isnan(geometry.cell_x[5]) and np.isnan(geometry.cell_z[5])
+    assert geometry.cell_x[6] == cells.loc[6, 'x_length']
+
+
+def test_aisles():
+    geometry = WarehouseGeometry(small_cells())
+    # The sort area is aisle 0, at the I/O point
+    assert np.array_equal(geometry.aisle_io_distance, [0.0, 13.0, 16.0, 19.0])
+    assert np.array_equal(geometry.aisle_y, [0.0, 3.0, 6.0, 9.0])
+    assert np.array_equal(geometry.aisle_distance, geometry.aisle_distance.T)
+    assert geometry.aisle_distance[1, 3] == 6.0 and geometry.aisle_distance[2, 2] == 0.0
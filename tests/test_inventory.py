@@ -0,0 +1,42 @@
+import pandas as pd
+from inventory import InventoryLedger
+
+
+def test_add_and_remove_keep_the_totals():
+    ledger = InventoryLedger(pd.DataFrame({'location': [1, 2, 1], 'uuid': [5, 5, 6], 'quantity': [10.0, 4.0, 3.0]}))
+    ledger.add(2, 5, 6.0)
+    ledger.add_many([(3, 5, 1.0), (1, 6, 2.0)])
+    ledger.remove(1, 5, 10.0)
+    assert ledger.quantity(1, 5) == 0 and ledger.quantity(2, 5) == 10.0 and ledger.quantity(9, 5) == 0
+    assert ledger.total(5) == 11.0 and ledger.total(6) == 5.0 and ledger.total(7) == 0
+    assert len(ledger) == 4
+
+
+def test_positions_keep_the_insertion_order():
+    ledger = InventoryLedger()
+    ledger.add_many([(3, 5, 1.0), (1, 5, 2.0), (1, 6, 4.0), (3, 5, 1.0)])
+    assert ledger.locations(5) == [3, 1]
+    assert ledger.positions(5) == [(3, 5, 2.0), (1, 5, 2.0)]
+    assert ledger.items_at(1) == [(1, 5, 2.0), (1, 6, 4.0)]
+    assert ledger.locations(7) == [] and ledger.items_at(7) == []
+
+
+def test_empty_positions_are_kept_until_discarded():
+    ledger = InventoryLedger()
+    ledger.add_many([(0, 5, 2.0), (0, 6, 1.0), (4, 5, 1.0)])
+    ledger.remove(0, 5, 2.0)
+    assert ledger.has_positions(5) and ledger.locations(5) == [0, 4]
+    ledger.discard_empty(0)
+    assert ledger.locations(5) == [4] and ledger.items_at(0) == [(0, 6, 1.0)]
+    ledger.remove(4, 5, 1.0)
+    ledger.discard_empty(4)
+    assert not ledger.has_positions(5) and ledger.total(5) == 0
+
+
+def test_to_dataframe_has_integer_ids():
+    ledger = InventoryLedger()
+    ledger.add_many([(1.0, 5.0, 2.0), (2, 6, 1.0)])
+    df = ledger.to_dataframe()
+    assert list(df.columns) == ['location', 'uuid', 'quantity']
+    assert df['location'].dtype == int and df['uuid'].dtype == int
+    assert df.values.tolist() == [[1, 5, 2.0], [2, 6, 1.0]]
@@ -0,0 +1,23 @@
+def test_order_waits_for_the_last_delivery_of_a_date(run_small):
+    # Neither item is in stock, both arrive on 2021-01-06: the order must wait for both deliveries
+    simulation = run_small([('2021-01-05 10:00', 1, 1, 'a'), ('2021-01-05 10:00', 2, 1, 'a')],
+                           shipments=[('2021-01-06', 1, 3), ('2021-01-06', 2, 6)])
+    assert simulation.impossible_orders == 0
+    assert len(simulation.waiting_for_delivery) == 0
+    # Both lines are fetched from the sort area in one task
+    assert len(simulation.fetch_task_times) == 1
+
+
+def test_order_is_fetched_when_all_lines_are_in_stock(run_small):
+    simulation = run_small([('2021-01-05 10:00', 1, 2, 'a'), ('2021-01-05 10:00', 2, 3, 'a')],
+                           positions=[(1, 1, 5), (9, 2, 5)])
+    assert simulation.orders_on_time == 1
+    assert simulation.warehouse_positions.total(1) == 3
+    assert simulation.warehouse_positions.total(2) == 2
+
+
+def test_order_with_a_line_never_supplied_is_impossible(run_small):
+    simulation = run_small([('2021-01-05 10:00', 1, 1, 'a'), ('2021-01-05 10:00', 2, 1, 'a')],
+                           shipments=[('2021-01-06', 1, 3)])
+    assert simulation.impossible_orders == 1
+    assert simulation.orders_on_time == 0
@@ -0,0 +1,65 @@
+import io
+import pandas as pd
+from datetime import timedelta
+import progress
+from progress import ProgressReporter
+
+TIMESTAMPS = pd.to_datetime(['2021-01-05 09:00', '2021-01-04 10:00', '2021-01-04 09:00', '2021-01-05 09:00',
+                             '2021-01-06 12:00'])
+
+
+def report(reporter: ProgressReporter, t_now) -> None:
+    reporter.report(pd.Timestamp(t_now), 'ORDERS_FROM_CUSTOMERS', 0, 0, 0, 0, 0, 0)
+
+
+def test_orders_so_far_per_date():
+    reporter = ProgressReporter(TIMESTAMPS)
+    assert reporter.orders_so_far(pd.Timestamp('2021-01-04 08:00')) == (0, 0)
+    assert reporter.orders_so_far(pd.Timestamp('2021-01-04 09:00')) == (1, 1)
+    assert reporter.orders_so_far(pd.Timestamp('2021-01-04 18:00')) == (2, 2)
+    # The orders of a new date are counted from its first order
+    assert reporter.orders_so_far(pd.Timestamp('2021-01-05 09:00')) == (4, 2)
+    assert reporter.orders_so_far(pd.Timestamp('2021-01-07 09:00')) == (5, 0)
+
+
+def test_every_event_reported_without_intervals():
+    reporter = ProgressReporter(TIMESTAMPS, stream=io.StringIO())
+    for t_now in ('2021-01-04 09:00', '2021-01-04 09:00', '2021-01-04 09:01'):
+        assert reporter.due(pd.Timestamp(t_now))
+        report(reporter, t_now)
+    assert len(reporter.stream.getvalue().splitlines()) == 3
+    assert not ProgressReporter(TIMESTAMPS, quiet=True).due(pd.Timestamp('2021-01-04 09:00'))
+
+
+def test_reports_throttled_by_simulation_time():
+    reporter = ProgressReporter(TIMESTAMPS, sim_interval=timedelta(hours=1), stream=io.StringIO())
+    assert reporter.due(pd.Timestamp('2021-01-04 09:00'))  # The first report
+    report(reporter, '2021-01-04 09:00')
+    assert not reporter.due(pd.Timestamp('2021-01-04 09:59'))
+    assert reporter.due(pd.Timestamp('2021-01-04 10:00'))
+
+
+def test_reports_throttled_by_real_time(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(progress.time, 'monotonic', lambda: clock[0])
+    reporter = ProgressReporter(TIMESTAMPS, wall_interval=5.0, stream=io.StringIO())
+    report(reporter, '2021-01-04 09:00')
+    clock[0] = 104.9
+    # Simulation time alone does not make a report due
+    assert not reporter.due(pd.Timestamp('2021-01-06 09:00'))
+    clock[0] = 105.0
+    assert reporter.due(pd.Timestamp('2021-01-04 09:00'))
+    report(reporter, '2021-01-04 09:00')
+    assert not reporter.due(pd.Timestamp('2021-01-04 09:00'))
+
+
+def test_quiet_reporter_prints_no_messages():
+    stream = io.StringIO()
+    ProgressReporter([], stream=stream).message("started", 3)
+    ProgressReporter([], quiet=True, stream=stream).message("hidden")
+    assert stream.getvalue() == 'started 3\n'
+
+
+def test_quiet_simulation_prints_nothing(run_small, capsys):
+    run_small([('2021-01-04 09:00', 1, 1)], positions=[(1, 1, 5)])
+    assert capsys.readouterr().out == ''
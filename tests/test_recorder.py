@@ -0,0 +1,40 @@
+import pandas as pd
+from recorder import EventRecorder
+
+COLUMNS = {'t_now': 'datetime64[ns]', 'value': 'Int64'}
+
+
+def test_recorder_replaces_the_rows_of_a_previous_run(tmp_path):
+    path = str(tmp_path / 'events')
+    recorder = EventRecorder(path, COLUMNS)
+    recorder.record(pd.Timestamp('2021-01-04 09:00'), 1)
+    recorder.close()
+    # A recorder which is off writes nothing, the file belongs to the previous run
+    EventRecorder(path, COLUMNS, level='off').close()
+    assert pd.read_csv(tmp_path / 'events.csv')['value'].tolist() == [1]
+    # The file is kept until the next recorder writes
+    recorder = EventRecorder(path, COLUMNS)
+    assert (tmp_path / 'events.csv').exists()
+    # A recorder without rows writes only the header
+    recorder.close()
+    assert (tmp_path / 'events.csv').read_text() == 't_now,value\n'
+
+
+def test_parquet_recorder_without_rows_removes_the_previous_chunks(tmp_path):
+    path = str(tmp_path / 'events')
+    recorder = EventRecorder(path, COLUMNS, file_format='parquet')
+    recorder.record(pd.Timestamp('2021-01-04 09:00'), 1)
+    recorder.close()
+    assert (tmp_path / 'events' / 'date=2021-01-04').is_dir()
+    EventRecorder(path, COLUMNS, file_format='parquet').close()
+    assert not (tmp_path / 'events').exists()
+
+
+def test_branch_replaces_the_rows_of_a_previous_branch(tmp_path):
+    recorder = EventRecorder(str(tmp_path / 'events'), COLUMNS, chunk_size=1)
+    recorder.record(pd.Timestamp('2021-01-04 09:00'), 1)
+    (tmp_path / 'branch.csv').write_text('t_now,value\n2021-01-01 00:00:00,7\n')
+    recorder.branch(str(tmp_path / 'branch'))
+    recorder.record(pd.Timestamp('2021-01-04 10:00'), 2)
+    recorder.close()
+    assert pd.read_csv(tmp_path / 'branch.csv')['value'].tolist() == [1, 2]
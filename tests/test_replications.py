@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from replications import KPI_COLUMNS, confidence_intervals, replications_needed
+
+
+def replications(values: dict) -> pd.DataFrame:
+    # placement -> the MEAN_FETCH_TASK_TIME of its replications, the other KPIs are constant
+    rows = [{'placement': placement, 'replication': replication, **{kpi: 1.0 for kpi in KPI_COLUMNS},
+             'MEAN_FETCH_TASK_TIME': value}
+            for placement, placement_values in values.items() for replication, value in enumerate(placement_values)]
+    return pd.DataFrame(rows)
+
+
+def test_confidence_interval_of_a_kpi():
+    summary = confidence_intervals(replications({'a': [10.0, 12.0, 14.0]}))
+    row = summary[summary['kpi'] == 'MEAN_FETCH_TASK_TIME'].iloc[0]
+    assert row['n'] == 3 and row['mean'] == 12.0 and row['std'] == 2.0
+    assert row['ci_low'] < 12.0 < row['ci_high']
+    # A constant KPI has an empty interval
+    assert summary[summary['kpi'] == 'ORDERS_ON_TIME']['half_width'].iloc[0] == 0
+
+
+def test_replications_needed_scales_with_the_half_width():
+    summary = confidence_intervals(replications({'wide': [10.0, 20.0, 30.0, 40.0], 'narrow': [10.0] * 4}))
+    half_width = summary.set_index(['placement', 'kpi']).loc[('wide', 'MEAN_FETCH_TASK_TIME'), 'half_width']
+    needed = replications_needed(summary, 'MEAN_FETCH_TASK_TIME', half_width / 2, 100)
+    assert needed == {'wide': 12}  # 4 * 2 ** 2 replications in all
+    assert replications_needed(summary, 'MEAN_FETCH_TASK_TIME', half_width / 2, 10) == {'wide': 6}
+
+
+def test_replications_needed_without_a_half_width():
+    # One replication, or a KPI which is missing, can not estimate the number needed: one more is run
+    summary = confidence_intervals(replications({'single': [10.0], 'missing': [np.nan, np.nan]}))
+    assert replications_needed(summary, 'MEAN_FETCH_TASK_TIME', 0.5, 100) == {'single': 1, 'missing': 1}
+    assert replications_needed(summary, 'MEAN_FETCH_TASK_TIME', 0.5, 2) == {'single': 1}
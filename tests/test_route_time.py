@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from conftest import small_inputs
+from engine import Simulation
+
+REACH_FORK, PALLET_JACK, CROSS_DOCK = 0, 1, 3
+
+
+@pytest.fixture
+def simulation(tmp_path) -> Simulation:
+    """
+    Returns:
+        Simulation: The small warehouse, with the mean speeds of the tools for every move.
+    """
+    inputs = small_inputs([('2021-01-04 09:00', 0, 1)])
+    inputs.tool_lookup.horizontal_speed_std[:] = 0
+    inputs.tool_lookup.vertical_speed_std[:] = 0
+    return Simulation(inputs, results_path=str(tmp_path), events_recording_level='off',
+                      fetch_tasks_recording_level='off', progress_quiet=True, rng=np.random.default_rng(0))
+
+
+def route_time(simulation: Simulation, tool_type: int, points: list) -> float:
+    tool = next(tool for tool in simulation.tools if tool.type == tool_type)
+    aisles, x, z = (np.array(values) for values in zip(*points))
+    return simulation.calculate_route_time(aisles, x, z, tool)
+
+
+def test_every_move_counts_once(simulation):
+    # Into aisle 2 up to a high cell, to a floor cell behind it and back, with the I/O distance of aisle 2 both ways
+    points = [(2, 0.0, 0.0), (2, 2.0, 1.5), (2, 4.0, 0.0), (2, 0.0, 0.0)]
+    expected = max(2.0 / 2.6, 1.5 / 0.8) + max(2.0 / 2.6, 1.5 / 0.8) + 4.0 / 2.6 + 2 * 16.0
+    assert route_time(simulation, REACH_FORK, points) == pytest.approx(expected)
+
+
+def test_tool_without_vertical_speed_moves_on_the_floor(simulation):
+    points = [(1, 0.0, 0.0), (1, 3.0, 0.0), (1, 0.0, 0.0)]
+    assert route_time(simulation, PALLET_JACK, points) == pytest.approx(6.0 / 2.4 + 2 * 13.0)
+
+
+def test_moves_between_aisles(simulation):
+    # From aisle 1 to aisle 3 along the front cross aisle, 6 meters apart
+    points = [(1, 0.0, 0.0), (1, 2.0, 0.0), (1, 0.0, 0.0), (3, 0.0, 0.0), (3, 1.0, 0.0), (3, 0.0, 0.0)]
+    expected = 4.0 / 2.6 + 6.0 / 2.6 + 2.0 / 2.6 + 13.0 + 19.0
+    assert route_time(simulation, REACH_FORK, points) == pytest.approx(expected)
+
+
+def test_cross_dock_moves_take_no_time(simulation):
+    points = [(0, 0.0, 0.0), (0, -10.0, 0.0), (0, 0.0, 0.0)]
+    assert route_time(simulation, CROSS_DOCK, points) == 0.0
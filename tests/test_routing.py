@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from conftest import small_inputs
+from routing import ROUTING_POLICIES, PickRouter
+
+REACH_FORK = 0  # The tool type of the routes, with horizontal and vertical speeds
+
+
+def mean_route_time(router: PickRouter, route: tuple, tool_type: int) -> float:
+    """
+    Returns:
+        float: The time of a route with the mean speeds of the tool, like Simulation.calculate_route_time.
+    """
+    aisles, x, z = route
+    speed_x = router.tool_lookup.horizontal_speed_mean[tool_type]
+    speed_z = router.tool_lookup.vertical_speed_mean[tool_type]
+    same_aisle = aisles[1:] == aisles[:-1]
+    route_time = np.maximum(np.abs(np.diff(x)) / speed_x, np.abs(np.diff(z)) / speed_z)[same_aisle].sum()
+    route_time += router.geometry.aisle_distance[aisles[:-1][~same_aisle], aisles[1:][~same_aisle]].sum() / speed_x
+    return route_time + router.geometry.aisle_io_distance[aisles[0]] + router.geometry.aisle_io_distance[aisles[-1]]
+
+
+@pytest.fixture
+def routers():
+    inputs = small_inputs([('2021-01-04 09:00', 0, 1)])
+    return {policy: PickRouter(inputs.geometry, inputs.tool_lookup, policy) for policy in ROUTING_POLICIES}
+
+
+def test_every_policy_visits_every_cell(routers):
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        locations = rng.choice(np.arange(1, 25), size=rng.integers(1, 8))
+        cells = {(routers['return'].geometry.cell_aisle[location], routers['return'].geometry.cell_x[location],
+                  routers['return'].geometry.cell_z[location]) for location in locations}
+        for policy, router in routers.items():
+            aisles, x, z = router.route(locations, REACH_FORK)
+            assert cells <= set(zip(aisles, x, z)), policy
+            # The route starts and ends at the front of an aisle
+            assert x[0] == x[-1] == 0 and z[0] == z[-1] == 0, policy
+
+
+def test_optimal_route_is_not_longer_than_the_other_policies(routers):
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        locations = rng.choice(np.arange(1, 25), size=rng.integers(2, 7), replace=False)
+        times = {policy: mean_route_time(router, router.route(locations, REACH_FORK), REACH_FORK)
+                 for policy, router in routers.items()}
+        assert times['optimal'] <= min(times.values()) + 1e-9, times
+
+
+def test_unknown_policy():
+    inputs = small_inputs([('2021-01-04 09:00', 0, 1)])
+    with pytest.raises(ValueError):
+        PickRouter(inputs.geometry, inputs.tool_lookup, 'random')
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import small_inputs
+from engine import Simulation
+from scenarios import Scenario, warm_up, run_branch
+
+FORK_TIME = pd.Timestamp('2021-01-04 09:00:30')
+
+
+@pytest.fixture
+def inputs():
+    # 40 orders at once, the pallet jack items 0, 2, ... in aisle 1 and the order picker items 1, 3, ... in aisle 3
+    orders = [('2021-01-04 09:00', line % 10, 300) for line in range(40)]
+    positions = [(1 + uuid, uuid, 10000) for uuid in range(0, 10, 2)] + \
+                [(17 + uuid // 2, uuid, 10000) for uuid in range(1, 10, 2)]
+    return small_inputs(orders, positions=positions)
+
+
+def fetch_tasks_after_fork(inputs, scenario, tmp_path) -> pd.DataFrame:
+    simulation = warm_up(inputs, FORK_TIME, results_path=str(tmp_path / 'warm_up'), progress_quiet=True,
+                         rng=np.random.default_rng(0))
+    # The fork is inside a burst: every employee is busy and items wait for the tools
+    assert all(employee.employee_status == 1 for employee in simulation.employees[1:])
+    assert len(simulation.fetching_queue) > 0
+    run_branch(simulation, scenario, str(tmp_path))
+    fetch_tasks = pd.read_csv(tmp_path / scenario.name / 'fetch_tasks_results.csv', parse_dates=['t_now'])
+    return fetch_tasks[fetch_tasks['t_now'] >= FORK_TIME]
+
+
+def test_baseline_branch_matches_an_uninterrupted_run(inputs, tmp_path):
+    simulation = Simulation(inputs, results_path=str(tmp_path / 'full'), progress_quiet=True,
+                            rng=np.random.default_rng(0))
+    simulation.run()
+    simulation.write_results()
+    fetch_tasks_after_fork(inputs, Scenario('baseline'), tmp_path)
+    for name in ('measures.csv', 'fetch_tasks_results.csv', 'events_sim_results.csv'):
+        assert (tmp_path / 'baseline' / name).read_bytes() == (tmp_path / 'full' / name).read_bytes()
+
+
+def test_removed_employees_get_no_new_tasks(inputs, tmp_path):
+    fetch_tasks = fetch_tasks_after_fork(inputs, Scenario('no_order_pickers', remove_employees=[4, 5]), tmp_path)
+    assert len(fetch_tasks) > 0
+    assert not fetch_tasks['employee'].isin([4, 5]).any()
+
+
+def test_removed_tool_is_not_used(inputs, tmp_path):
+    fetch_tasks = fetch_tasks_after_fork(inputs, Scenario('one_order_picker_tool', remove_tools=[6]), tmp_path)
+    assert fetch_tasks['tool'].eq(7).any()
+    assert not fetch_tasks['tool'].eq(6).any()
+
+
+def test_added_employee_and_tool_take_tasks(inputs, tmp_path):
+    fetch_tasks = fetch_tasks_after_fork(inputs, Scenario('extra_pallet_jack', add_employees=[[1]], add_tools=[1]),
+                                         tmp_path)
+    assert fetch_tasks['employee'].eq(6).any()
+    assert fetch_tasks['tool'].eq(8).any()
@@ -0,0 +1,35 @@
+import pandas as pd
+from shipment_index import ShipmentIndex
+
+
+def shipment_index() -> ShipmentIndex:
+    return ShipmentIndex(pd.DataFrame({
+        'date': pd.to_datetime(['2021-01-06', '2021-01-04', '2021-01-04', '2021-01-10', '2021-01-05']),
+        'uuid': [3, 3, 1, 3, 3],
+        'quantity': [20.0, 5.0, 7.0, 40.0, 10.0]}))
+
+
+def test_units_arriving_in_a_window():
+    index = shipment_index()
+    assert len(index) == 5
+    assert index.units_arriving(3, pd.Timestamp('2021-01-04'), pd.Timestamp('2021-01-06')) == 35.0
+    # The window includes both ends, the time of the day is ignored
+    assert index.units_arriving(3, pd.Timestamp('2021-01-05 18:00'), pd.Timestamp('2021-01-10 08:00')) == 70.0
+    assert index.units_arriving(3, pd.Timestamp('2021-01-07'), pd.Timestamp('2021-01-09')) == 0
+    assert index.units_arriving(1, pd.Timestamp('2021-01-01'), pd.Timestamp('2021-01-31')) == 7.0
+    # Items without shipments
+    assert index.units_arriving(2, pd.Timestamp('2021-01-01'), pd.Timestamp('2021-01-31')) == 0
+    assert index.units_arriving(99, pd.Timestamp('2021-01-01'), pd.Timestamp('2021-01-31')) == 0
+
+
+def test_arrival_of_units():
+    index = shipment_index()
+    start, end = pd.Timestamp('2021-01-04'), pd.Timestamp('2021-01-10')
+    assert index.arrival_of_units(3, start, end, 5.0) == pd.Timestamp('2021-01-04')
+    assert index.arrival_of_units(3, start, end, 6.0) == pd.Timestamp('2021-01-05')
+    assert index.arrival_of_units(3, start, end, 35.0) == pd.Timestamp('2021-01-06')
+    assert index.arrival_of_units(3, start, end, 75.0) == pd.Timestamp('2021-01-10')
+    assert index.arrival_of_units(3, start, end, 76.0) is None
+    # The units are counted from the start of the window
+    assert index.arrival_of_units(3, pd.Timestamp('2021-01-05'), end, 30.0) == pd.Timestamp('2021-01-06')
+    assert index.arrival_of_units(2, start, end, 1.0) is None
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from conftest import small_inputs
+from variates import VariatePool
+
+
+def variate_pool(seed: int = 0, block_size: int = 4) -> VariatePool:
+    pool = VariatePool(small_inputs([('2021-01-04 09:00', 0, 1)]).tool_lookup, np.random.default_rng(seed), block_size)
+    pool.add('transfer_time', 10.0, 2.0)
+    return pool
+
+
+def test_values_drawn_in_the_order_of_the_blocks():
+    pool = variate_pool()
+    rng = np.random.default_rng(0)
+    # Every pool is refilled with a block of the generator when empty, in the order of the draws
+    expected_speeds = rng.normal(2.6, 0.3, 4).tolist()[::-1]
+    expected_transfers = rng.normal(10.0, 2.0, 4).tolist()[::-1]
+    expected_speeds += rng.normal(2.6, 0.3, 4).tolist()[::-1]
+    assert [pool.draw(0, 'horizontal_speed') for _ in range(3)] == expected_speeds[:3]
+    assert [pool.draw(None, 'transfer_time') for _ in range(4)] == expected_transfers
+    assert [pool.draw(0, 'horizontal_speed') for _ in range(4)] == expected_speeds[3:7]
+    assert pool.pools[(0, 'horizontal_speed')] == expected_speeds[7:]
+
+
+def test_draw_many_matches_single_draws():
+    single, many = variate_pool(), variate_pool()
+    single.draw(2, 'vertical_speed')
+    many.draw(2, 'vertical_speed')
+    expected = [single.draw(2, 'vertical_speed') for _ in range(5)]
+    assert many.draw_many(2, 'vertical_speed', 3) == expected[:3]
+    # The pool is refilled when it has too few values
+    assert many.draw_many(2, 'vertical_speed', 2) == expected[3:]
+    assert many.draw_many(2, 'vertical_speed', 0) == []
+    # A block is never smaller than the values drawn at once
+    assert len(many.draw_many(2, 'vertical_speed', 9)) == 9
+    assert len(many.pools[(2, 'vertical_speed')]) == 2
+
+
+def test_distributions():
+    pool = variate_pool()
+    assert pool.distribution(1, 'remove_from_shelf_time') == (25.5, 6.7)
+    pool.draw(None, 'transfer_time')
+    # A new distribution drops the values of the old one
+    pool.add('transfer_time', 100.0, 0.0)
+    assert pool.draw(None, 'transfer_time') == 100.0
+    with pytest.raises(KeyError):
+        pool.draw(None, 'horizontal_speed')
+    with pytest.raises(KeyError):
+        pool.draw(0, 'transfer_time')
+    with pytest.raises(ValueError):
+        VariatePool(pool.tool_lookup, block_size=0)
@@ -0,0 +1,78 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+from conftest import small_inputs
+from engine import Simulation
+
+POSITIONS = [(1, 1, 10), (9, 2, 10), (17, 3, 10)]
+
+
+def run_waves(tmp_path, orders: list, wave_max_orders: int = 3) -> tuple:
+    """
+    Run the small warehouse in the 'wave' picking mode with 30 minutes windows, recording the waves.
+
+    Returns:
+        tuple: The simulation, the (time, order ids) of every released wave, the times of every wave release
+               event and the units fetched per (order id, uuid).
+    """
+    simulation = Simulation(small_inputs(orders, positions=POSITIONS), results_path=str(tmp_path / 'results'),
+                            events_recording_level='off', fetch_tasks_recording_level='off',
+                            progress_quiet=True, rng=np.random.default_rng(0), picking_mode='wave',
+                            wave_window_minutes=30, wave_max_orders=wave_max_orders)
+    waves, release_events, fetched = [], [], Counter()
+    release_wave, wave_release = simulation.release_wave, simulation.wave_release
+    handle_employee_fetching_tasks = simulation.handle_employee_fetching_tasks
+
+    def record_wave(t_now):
+        waves.append((t_now, [order.order_id for order in simulation.wave_orders]))
+        release_wave(t_now)
+
+    def record_release_event(t_now):
+        release_events.append(t_now)
+        wave_release(t_now)
+
+    def record_fetch(item):
+        fetched[item.order_id, item.uuid] += item.units_to_fetch
+        handle_employee_fetching_tasks(item)
+
+    simulation.release_wave = record_wave
+    simulation.wave_release = record_release_event
+    simulation.handle_employee_fetching_tasks = record_fetch
+    simulation.run()
+    return simulation, waves, release_events, fetched
+
+
+def assert_every_order_picked_once(simulation, waves, fetched, orders):
+    released = [order_id for _, order_ids in waves for order_id in order_ids]
+    assert sorted(released) == list(range(len(orders)))
+    assert fetched == Counter({(order_id, uuid): quantity for order_id, (_, uuid, quantity) in enumerate(orders)})
+    assert simulation.orders_on_time == len(orders)
+    assert simulation.wave_orders == [] and simulation.wave_release_time is None
+
+
+def test_wave_released_by_max_orders(tmp_path):
+    orders = [('2021-01-05 10:00', 1, 2), ('2021-01-05 10:05', 2, 1), ('2021-01-05 10:10', 3, 4)]
+    simulation, waves, release_events, fetched = run_waves(tmp_path, orders)
+    assert waves == [(pd.Timestamp('2021-01-05 10:10'), [0, 1, 2])]
+    # The release event of the window is left behind and does nothing
+    assert release_events == [pd.Timestamp('2021-01-05 10:30')]
+    assert_every_order_picked_once(simulation, waves, fetched, orders)
+
+
+def test_wave_released_by_its_window(tmp_path):
+    orders = [('2021-01-05 10:00', 1, 2), ('2021-01-05 10:05', 2, 1)]
+    simulation, waves, release_events, fetched = run_waves(tmp_path, orders)
+    assert waves == [(pd.Timestamp('2021-01-05 10:30'), [0, 1])]
+    assert release_events == [pd.Timestamp('2021-01-05 10:30')]
+    assert_every_order_picked_once(simulation, waves, fetched, orders)
+
+
+def test_stale_release_event_does_not_release_the_next_wave(tmp_path):
+    orders = [('2021-01-05 10:00', 1, 2), ('2021-01-05 10:05', 2, 1), ('2021-01-05 10:10', 3, 4),
+              ('2021-01-05 10:12', 1, 3)]
+    simulation, waves, release_events, fetched = run_waves(tmp_path, orders)
+    # The event of the first window fires while the second wave is open, the second wave keeps its own window
+    assert waves == [(pd.Timestamp('2021-01-05 10:10'), [0, 1, 2]), (pd.Timestamp('2021-01-05 10:42'), [3])]
+    assert release_events == [pd.Timestamp('2021-01-05 10:30'), pd.Timestamp('2021-01-05 10:42')]
+    assert_every_order_picked_once(simulation, waves, fetched, orders)
+    assert simulation.warehouse_positions.total(1) == 5